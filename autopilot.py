@@ -0,0 +1,246 @@
+import time
+from player import INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN
+
+# (dx, dy) in cells -> input mask
+_MOVES = {
+    (0, 0): 0,
+    (-1, 0): INPUT_LEFT,
+    (1, 0): INPUT_RIGHT,
+    (0, -1): INPUT_UP,
+    (0, 1): INPUT_DOWN,
+    (-1, -1): INPUT_LEFT | INPUT_UP,
+    (1, -1): INPUT_RIGHT | INPUT_UP,
+    (-1, 1): INPUT_LEFT | INPUT_DOWN,
+    (1, 1): INPUT_RIGHT | INPUT_DOWN,
+}
+
+
+class Autopilot:
+    """
+    Lookahead player for soak tests and headless batches. Every decision
+    predicts each obstacle's rect over the next `horizon_steps` simulation
+    steps (obstacles only fall, at effective_speed * speed_multiplier per
+    60 Hz step) and rasterizes the swept rects into an occupancy grid over
+    the player's zone. Grid cells are one macro-step of player movement
+    (`macro_steps` steps at full speed) and are anchored at the player's
+    current position, so every reachable position is a cell. Each grid row
+    is an int bitset over columns, which turns the backwards search for
+    cells that stay safe until the horizon into a few shifts per row.
+    Among the first moves that stay safe, the one leading closest to the
+    target (a power-up in reach, else the bottom center) wins. When nothing
+    survives the full horizon, the longest horizon that still has a safe
+    move is found in one forward pass and used instead, so a decision costs
+    at most three passes over the horizon.
+    """
+
+    def __init__(self, horizon_steps=36, macro_steps=3, margin=2):
+        self.macro_steps = macro_steps
+        self.horizon = max(1, horizon_steps // macro_steps) # In macro-steps
+        self.margin = margin # Extra pixels kept clear around obstacles
+        self.decisions = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.last_s = 0.0
+
+    def decide(self, sim):
+        """Returns the INPUT_* mask for the simulation's next step."""
+        start = time.perf_counter()
+        mask = self._decide(sim)
+        elapsed = time.perf_counter() - start
+        self.decisions += 1
+        self.total_s += elapsed
+        self.last_s = elapsed
+        if elapsed > self.max_s:
+            self.max_s = elapsed
+        return mask
+
+    def stats(self):
+        """Decision latency so far, in ms."""
+        return {
+            "decisions": self.decisions,
+            "mean_ms": self.total_s / self.decisions * 1000 if self.decisions else 0.0,
+            "max_ms": self.max_s * 1000,
+            "last_ms": self.last_s * 1000,
+        }
+
+    # --- Planning ---
+    def _decide(self, sim):
+        game_settings = sim.settings
+        player = sim.player.rect
+        k = self.macro_steps
+        cell = game_settings.PLAYER_SPEED * sim.time_scale * k # Pixels per macro-step
+        px, py, pw, ph = player.x, player.y, player.width, player.height
+
+        # Reachable player top-left range (see Player.apply_input), in cells from the anchor
+        x_min, x_max = 3, game_settings.WIDTH - 3 - pw
+        y_min, y_max = game_settings.HEIGHT // 2, game_settings.HEIGHT - 5 - ph
+        col_lo = -int(max(0, px - x_min) // cell)
+        row_lo = -int(max(0, py - y_min) // cell)
+        cols = int(max(0, x_max - px) // cell) - col_lo + 1
+        rows = int(max(0, y_max - py) // cell) - row_lo + 1
+        full = (1 << cols) - 1
+        # Cell (c, r) is the top-left (gx0 + c * cell, gy0 + r * cell)
+        gx0 = px + col_lo * cell
+        gy0 = py + row_lo * cell
+
+        occupancy = self._occupancy(sim, cell, gx0, gy0, cols, rows, pw, ph)
+        start_col, start_row = -col_lo, -row_lo
+        target_col, target_row = self._target(sim, cell, gx0, gy0, cols, rows, pw)
+
+        def first_move(horizon):
+            safe = self._safe_first_cells(occupancy, horizon, rows, full)
+            best_mask, best_score = None, None
+            for (dc, dr), mask in _MOVES.items():
+                col, row = start_col + dc, start_row + dr
+                if not (0 <= col < cols and 0 <= row < rows):
+                    continue
+                if not (safe[row] >> col) & 1:
+                    continue
+                score = abs(col - target_col) + abs(row - target_row)
+                if best_score is None or score < best_score:
+                    best_mask, best_score = mask, score
+            return best_mask
+
+        mask = first_move(self.horizon)
+        if mask is not None:
+            return mask
+        # Nothing survives the full horizon: find the longest horizon that
+        # something survives in one forward pass, then plan for it
+        longest = self._longest_safe_horizon(occupancy, self.horizon, rows, full, start_col, start_row)
+        if not longest:
+            return 0 # Boxed in: keep still and hope for the shield
+        return first_move(longest)
+
+    def _occupancy(self, sim, cell, gx0, gy0, cols, rows, pw, ph):
+        """
+        occupancy[t][row] is a column bitset of cells where the player would
+        touch an obstacle at some point during macro-step t (t = 1..horizon),
+        i.e. between simulation steps (t - 1) * k and t * k.
+        """
+        horizon = self.horizon
+        k = self.macro_steps
+        occupancy = [[0] * rows for _ in range(horizon + 1)]
+        grid_bottom = gy0 + rows * cell
+        fall_scale = sim.speed_multiplier * sim.time_scale
+        margin = self.margin
+        full = (1 << cols) - 1
+        obstacles = sim.obstacles
+        for obs in obstacles:
+            # Obstacles move exactly `speed` pixels per step from a float
+            # position; their Rects (what collisions test) round that to the
+            # nearest pixel, hence the half-pixel slack on either side
+            speed = obs.effective_speed * fall_scale
+            if speed <= 0:
+                continue
+            step = speed * k # Pixels per macro-step
+            rect = obs.rect
+            y = obstacles.position(obs)[1]
+            top = y - 0.5 - margin - ph
+            bottom = y + rect.height + 0.5 + margin
+            # Only macro-steps where the obstacle's sweep overlaps the grid matter
+            t_first = int((gy0 - bottom) // step)
+            if t_first > horizon:
+                continue # Still above the grid at the horizon
+            if t_first < 1:
+                t_first = 1
+            t_last = int((grid_bottom - top) // step) + 1
+            if t_last > horizon:
+                t_last = horizon
+            if t_first > t_last:
+                continue
+
+            # Columns whose player rect overlaps the obstacle's x-span (constant: obstacles fall straight)
+            c0 = int((rect.left - margin - pw - gx0) // cell) + 1
+            c1 = int((rect.right + margin - gx0) // cell)
+            if c0 < 0:
+                c0 = 0
+            if c1 >= cols:
+                c1 = cols - 1
+            if c0 > c1:
+                continue
+            col_bits = (full >> c0 << c0) & ((1 << (c1 + 1)) - 1)
+
+            for t in range(t_first, t_last + 1):
+                # Swept vertical span during macro-step t
+                r0 = int((top + (t - 1) * step - gy0) // cell) + 1
+                r1 = int((bottom + t * step - gy0) // cell)
+                if r0 < 0:
+                    r0 = 0
+                if r1 >= rows:
+                    r1 = rows - 1
+                layer = occupancy[t]
+                for row in range(r0, r1 + 1):
+                    layer[row] |= col_bits
+        return occupancy
+
+    @staticmethod
+    def _safe_first_cells(occupancy, horizon, rows, full):
+        """
+        Column bitsets of cells the player can be in after macro-step 1 and
+        still dodge everything up to `horizon`. A cell is safe at t if it is
+        free during macro-steps t and t + 1 (the player leaves it during the
+        latter) and it or a neighbouring cell is safe at t + 1.
+        """
+        safe = [full & ~bits for bits in occupancy[horizon]]
+        for t in range(horizon - 1, 0, -1):
+            current, following = occupancy[t], occupancy[t + 1]
+            spread = [bits | (bits << 1) | (bits >> 1) for bits in safe]
+            safe = [
+                (
+                    spread[row]
+                    | (spread[row - 1] if row > 0 else 0)
+                    | (spread[row + 1] if row + 1 < rows else 0)
+                )
+                & full & ~current[row] & ~following[row]
+                for row in range(rows)
+            ]
+        return safe
+
+    @staticmethod
+    def _longest_safe_horizon(occupancy, horizon, rows, full, start_col, start_row):
+        """
+        Longest horizon below `horizon` for which _safe_first_cells has a
+        cell next to the start, or 0. Runs the same constraints forwards:
+        `reach` holds the cells the player can be in at macro-step t while
+        still free during t + 1, and horizon t + 1 is survivable if a
+        neighbour of one of them is free during t + 1. The search stops at
+        the first horizon nothing survives, so its cost is bounded by one
+        pass over the horizon.
+        """
+        def spread(bitsets):
+            widened = [bits | (bits << 1) | (bits >> 1) for bits in bitsets]
+            return [
+                (
+                    widened[row]
+                    | (widened[row - 1] if row > 0 else 0)
+                    | (widened[row + 1] if row + 1 < rows else 0)
+                )
+                & full
+                for row in range(rows)
+            ]
+
+        reach = [0] * rows
+        reach[start_row] = 1 << start_col # Macro-step 0: where the player is now
+        longest = 0
+        for t in range(1, horizon):
+            candidates = spread(reach)
+            current = occupancy[t]
+            if not any(bits & ~current[row] for row, bits in enumerate(candidates)):
+                break
+            longest = t
+            following = occupancy[t + 1]
+            reach = [bits & ~current[row] & ~following[row] for row, bits in enumerate(candidates)]
+        return longest
+
+    @staticmethod
+    def _target(sim, cell, gx0, gy0, cols, rows, pw):
+        """Preferred cell: under the lowest power-up, else the bottom center."""
+        target_x = sim.settings.WIDTH / 2 - pw / 2
+        lowest = None
+        for powerup in sim.powerups:
+            if lowest is None or powerup.rect.bottom > lowest.rect.bottom:
+                lowest = powerup
+        if lowest is not None:
+            target_x = lowest.rect.centerx - pw / 2
+        col = min(cols - 1, max(0, round((target_x - gx0) / cell)))
+        return col, rows - 1
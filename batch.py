@@ -0,0 +1,171 @@
+import ast
+import os
+import random
+import time
+import types
+
+import settings
+
+DEFAULT_MAX_FRAMES = 36000 # Per-game cap (10 minutes at 60 Hz) so a flawless autopilot run still ends
+
+# Per-run columns aggregated in the summary table, in display order
+SUMMARY_FIELDS = (
+    "score",
+    "frames",
+    "pickups",
+    "obstacles_spawned",
+    "obstacles_destroyed",
+    "peak_obstacles",
+    "lives_lost",
+)
+
+
+def parse_override(text):
+    """Parses a NAME=VALUE command-line override of a settings constant."""
+    name, sep, raw = text.partition("=")
+    name = name.strip()
+    if not sep or not name.isupper() or not hasattr(settings, name):
+        raise ValueError(f"Expected NAME=VALUE with NAME an existing settings constant, got {text!r}")
+    try:
+        value = ast.literal_eval(raw.strip())
+    except (ValueError, SyntaxError):
+        raise ValueError(f"Value for {name} is not a Python literal: {raw!r}") from None
+    return name, value
+
+
+def settings_with(overrides):
+    """A copy of the settings module's constants with `overrides` replaced."""
+    values = {name: getattr(settings, name) for name in dir(settings) if name.isupper()}
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+
+def game_seeds(games, seed=None):
+    """Per-game seeds; the same base seed always yields the same batch."""
+    seeds = random.Random(seed)
+    return [seeds.randrange(2**63) for _ in range(games)]
+
+
+def simulate_game(seed, max_frames=DEFAULT_MAX_FRAMES, overrides=None, autopilot=True):
+    """
+    Plays one seeded game headlessly until game over or `max_frames` steps.
+    Module-level and argument-only so process-pool workers can run it.
+    Returns a flat dict of per-run results.
+    """
+    import pygame
+    from autopilot import Autopilot
+    from simulation import Simulation
+
+    pygame.font.init() # PowerUp labels need the font module, but no display
+    game_settings = settings_with(overrides) if overrides else settings
+    sim = Simulation(game_settings, visual_effects=False, seed=seed)
+    pilot = Autopilot() if autopilot else None
+    start = time.perf_counter()
+    while sim.frame < max_frames and not sim.game_over:
+        sim.step(pilot.decide(sim) if pilot is not None else 0)
+    counters = sim.counters
+    return {
+        "seed": seed,
+        "score": sim.score,
+        "frames": sim.frame,
+        "game_over": sim.game_over,
+        "pickups": sum(counters.powerups_collected.values()),
+        "pickups_by_type": dict(counters.powerups_collected),
+        "powerups_spawned": counters.powerups_spawned,
+        "obstacles_spawned": counters.obstacles_spawned,
+        "obstacles_destroyed": counters.obstacles_destroyed,
+        "peak_obstacles": counters.peak_obstacles,
+        "lives_lost": counters.lives_lost,
+        "elapsed_s": time.perf_counter() - start,
+    }
+
+
+def _simulate_game_args(args):
+    return simulate_game(*args)
+
+
+def run_batch(games, seed=None, workers=None, max_frames=DEFAULT_MAX_FRAMES, overrides=None, autopilot=True):
+    """
+    Runs `games` seeded games over a process pool of `workers` processes
+    (all CPU cores if None) and returns (results, summary). Games are
+    independent and share nothing, so each is one task; results come back
+    in seed order whatever order the workers finish in.
+    """
+    import multiprocessing
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Inherited by workers; nothing opens a window
+    workers = max(1, min(workers or os.cpu_count() or 1, games))
+    tasks = [(game_seed, max_frames, overrides, autopilot) for game_seed in game_seeds(games, seed)]
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_simulate_game_args(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(_simulate_game_args, tasks, chunksize=1)
+    elapsed = time.perf_counter() - start
+    return results, summarize(results, elapsed, workers)
+
+
+def summarize(results, elapsed_s, workers):
+    """Aggregates per-run results into per-field statistics plus batch throughput."""
+    import statistics
+
+    fields = {}
+    for name in SUMMARY_FIELDS:
+        values = sorted(result[name] for result in results)
+        fields[name] = {
+            "mean": statistics.fmean(values),
+            "median": statistics.median(values),
+            "min": values[0],
+            "p90": values[min(len(values) - 1, int(len(values) * 0.9))],
+            "max": values[-1],
+        }
+    pickups_by_type = {}
+    for result in results:
+        for powerup_type, count in result["pickups_by_type"].items():
+            pickups_by_type[powerup_type] = pickups_by_type.get(powerup_type, 0) + count
+    total_frames = sum(result["frames"] for result in results)
+    return {
+        "games": len(results),
+        "workers": workers,
+        "completed": sum(1 for result in results if result["game_over"]),
+        "fields": fields,
+        "pickups_by_type": dict(sorted(pickups_by_type.items())),
+        "elapsed_s": elapsed_s,
+        "frames_per_s": total_frames / elapsed_s if elapsed_s > 0 else float("inf"),
+    }
+
+
+def format_summary(summary):
+    lines = [
+        f"{summary['games']} games on {summary['workers']} workers in {summary['elapsed_s']:.2f}s "
+        f"({summary['frames_per_s']:.0f} frames/s, {summary['completed']} ended by game over)",
+        f"{'':<20} {'mean':>10} {'median':>10} {'min':>10} {'p90':>10} {'max':>10}",
+    ]
+    for name, row in summary["fields"].items():
+        lines.append(
+            f"{name:<20} {row['mean']:>10.1f} {row['median']:>10.1f} "
+            f"{row['min']:>10} {row['p90']:>10} {row['max']:>10}"
+        )
+    if summary["pickups_by_type"]:
+        per_game = ", ".join(
+            f"{powerup_type} {count / summary['games']:.2f}"
+            for powerup_type, count in summary["pickups_by_type"].items()
+        )
+        lines.append(f"pickups per game: {per_game}")
+    return "\n".join(lines)
+
+
+def write_results_csv(path, results):
+    import csv
+
+    columns = [name for name in results[0] if name != "pickups_by_type"]
+    powerup_types = sorted({t for result in results for t in result["pickups_by_type"]})
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns + [f"pickups_{t}" for t in powerup_types])
+        for result in results:
+            writer.writerow(
+                [result[name] for name in columns]
+                + [result["pickups_by_type"].get(t, 0) for t in powerup_types]
+            )
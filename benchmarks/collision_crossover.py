@@ -0,0 +1,101 @@
+"""
+Compares the per-frame cost of the three collision checks in
+Simulation.check_collisions (player vs obstacles, companion bullets vs
+obstacles, player vs powerups) done with pygame sprite-group collisions
+against the SpatialHash grid (forced on for every count) and the adaptive
+SpatialHash the game uses, for growing obstacle counts. It reports the
+obstacle count where the grid starts to win; that is the value to use for
+settings.COLLISION_GRID_MIN_SPRITES.
+
+Run from the repository root:  python benchmarks/collision_crossover.py
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import settings
+from spatial_hash import SpatialHash
+
+OBSTACLE_COUNTS = [5, 10, 20, 40, 80, 160, 320, 640]
+
+
+class _Box(pygame.sprite.Sprite):
+    def __init__(self, rng, width, height):
+        super().__init__()
+        self.rect = pygame.Rect(
+            rng.randint(0, settings.WIDTH - width), rng.randint(-height, settings.HEIGHT), width, height
+        )
+
+
+def _scene(rng, num_obstacles, num_bullets, num_powerups):
+    player = _Box(rng, 60, 20)
+    obstacles = pygame.sprite.Group(_Box(rng, 50, 20) for _ in range(num_obstacles))
+    bullets = pygame.sprite.Group(_Box(rng, 10, 10) for _ in range(num_bullets))
+    powerups = pygame.sprite.Group(_Box(rng, settings.POWERUP_SIZE, settings.POWERUP_SIZE) for _ in range(num_powerups))
+    return player, obstacles, bullets, powerups
+
+
+def _sprite_groups(player, obstacles, bullets, powerups):
+    pygame.sprite.spritecollide(player, obstacles, False)
+    pygame.sprite.groupcollide(bullets, obstacles, False, False)
+    pygame.sprite.spritecollide(player, powerups, False)
+
+
+def _spatial_hash(player, obstacles, bullets, powerups, obstacle_grid, powerup_grid):
+    obstacle_grid.rebuild(obstacles)
+    powerup_grid.rebuild(powerups)
+    obstacle_grid.spritecollide(player)
+    for bullet in bullets:
+        obstacle_grid.spritecollide(bullet)
+    powerup_grid.spritecollide(player)
+
+
+def run(repeats, cell_size, seed):
+    rng = random.Random(seed)
+    grids = (SpatialHash(cell_size), SpatialHash(cell_size))
+    adaptive = (
+        SpatialHash(cell_size, settings.COLLISION_GRID_MIN_SPRITES),
+        SpatialHash(cell_size, settings.COLLISION_GRID_MIN_SPRITES),
+    )
+    rows = []
+    for num_obstacles in OBSTACLE_COUNTS:
+        # Sustained turret fire keeps roughly one bullet per 4 obstacles on screen
+        scene = _scene(rng, num_obstacles, max(1, num_obstacles // 4), 2)
+        groups_us = timeit.timeit(lambda: _sprite_groups(*scene), number=repeats) / repeats * 1e6
+        grid_us = timeit.timeit(
+            lambda: _spatial_hash(*scene, *grids), number=repeats
+        ) / repeats * 1e6
+        adaptive_us = timeit.timeit(
+            lambda: _spatial_hash(*scene, *adaptive), number=repeats
+        ) / repeats * 1e6
+        rows.append((num_obstacles, groups_us, grid_us, adaptive_us))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=500)
+    parser.add_argument("--cell-size", type=int, default=settings.COLLISION_CELL_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = run(args.repeats, args.cell_size, args.seed)
+    print(f"{'obstacles':>10} {'sprite groups (us)':>20} {'grid (us)':>12} {'adaptive (us)':>15}")
+    crossover = None
+    for num_obstacles, groups_us, grid_us, adaptive_us in rows:
+        print(f"{num_obstacles:>10} {groups_us:>20.1f} {grid_us:>12.1f} {adaptive_us:>15.1f}")
+        if crossover is None and grid_us < groups_us:
+            crossover = num_obstacles
+    if crossover is None:
+        print("The grid did not overtake sprite-group collisions in this range.")
+    else:
+        print(f"The grid is faster from {crossover} obstacles upward.")
+
+
+if __name__ == "__main__":
+    main()
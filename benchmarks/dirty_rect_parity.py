@@ -0,0 +1,97 @@
+"""
+Checks that DirtyRectRenderer's partial updates leave the screen identical,
+pixel for pixel, to a full redraw. A seeded starfield scrolls under a
+translucent UI layer covering the whole screen (so every star is blended, and
+stars entering at the top edge are included) for a number of frames; after
+each partial update the screen is compared with the background, the stars
+and the layer drawn from scratch. Exits with status 1 on the first mismatch.
+
+Run from the repository root:  python benchmarks/dirty_rect_parity.py
+"""
+import argparse
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import settings
+from dirty_rects import DirtyRectRenderer
+from starfield import ListStarfield, create_starfield
+
+
+def _draw_layer(surface):
+    # Translucent everywhere, like the instructions screen, with opaque text on top
+    surface.fill((0, 0, 0, 150))
+    label = pygame.font.Font(None, 48).render("NEON DODGE", True, settings.MENU_TITLE_COLOR)
+    surface.blit(label, label.get_rect(center=(surface.get_width() // 2, 40)))
+
+
+def _full_redraw(screen, starfield, layer, background_color):
+    expected = pygame.Surface(screen.get_size(), 0, screen)
+    expected.fill(background_color)
+    starfield.draw(expected)
+    expected.blit(layer, (0, 0))
+    return expected
+
+
+def _mismatches(screen, expected):
+    actual = pygame.image.tobytes(screen, "RGB")
+    wanted = pygame.image.tobytes(expected, "RGB")
+    if actual == wanted:
+        return []
+    width = screen.get_width()
+    return [
+        ((i // 3) % width, (i // 3) // width)
+        for i in range(0, len(actual), 3)
+        if actual[i:i + 3] != wanted[i:i + 3]
+    ]
+
+
+def check(starfield, frames, background_color=settings.BACKGROUND_COLOR):
+    """Returns (frame, mismatched pixels) for the first frame that differs, or None."""
+    screen = pygame.display.get_surface()
+    renderer = DirtyRectRenderer(screen, background_color)
+    renderer.render(starfield, "ui", _draw_layer) # Full redraw to start from
+    for frame in range(1, frames + 1):
+        starfield.update()
+        renderer.render(starfield, "ui", _draw_layer)
+        pixels = _mismatches(screen, _full_redraw(screen, starfield, renderer.layer, background_color))
+        if pixels:
+            return frame, pixels
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=240)
+    parser.add_argument("--stars", type=int, default=settings.NUM_STARS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    starfields = [
+        ("default", create_starfield(count=args.stars, seed=args.seed)),
+        ("list", ListStarfield(count=args.stars, rng=random.Random(args.seed))),
+    ]
+    failed = False
+    for name, starfield in starfields:
+        result = check(starfield, args.frames)
+        if result is None:
+            print(f"{name:>8}: {args.frames} partial updates match a full redraw")
+        else:
+            frame, pixels = result
+            rows = sorted({y for _, y in pixels})
+            print(f"{name:>8}: frame {frame} differs in {len(pixels)} pixels (rows {rows[0]}-{rows[-1]})")
+            failed = True
+    pygame.quit()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
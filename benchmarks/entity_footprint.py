@@ -0,0 +1,105 @@
+"""
+Measures the memory each entity instance costs and how fast its hot
+attributes read, for Obstacle, Bullet, Particle, PowerUp and Companion.
+Memory is traced with tracemalloc while creating many instances, so shared
+data (atlas surfaces, settings, class constants) is excluded and per-instance
+storage (__dict__ or slots, rect, group membership) is included. Attribute
+access is timed over the attributes each class reads in update() and in the
+collision / rendering code.
+
+Run from the repository root:  python benchmarks/entity_footprint.py
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import settings
+
+
+def _factories(rng):
+    from bullet import Bullet
+    from companion import Companion
+    from obstacle import Obstacle
+    from particle import Particle
+    from powerups import PowerUp
+
+    player_rect = pygame.Rect(100, 500, 60, 20)
+    return {
+        "Obstacle": (
+            lambda: Obstacle(3, 1, True, game_settings=settings, rng=rng),
+            ("rect", "effective_speed", "settings", "color", "can_split"),
+        ),
+        "Bullet": (
+            lambda: Bullet(100, 100, game_settings=settings),
+            ("rect", "speed_y", "image"),
+        ),
+        "Particle": (
+            lambda: Particle(100, 100, settings.NEON_RED),
+            ("rect", "vx", "vy", "friction", "gravity", "current_lifespan", "lifespan"),
+        ),
+        "PowerUp": (
+            lambda: PowerUp(game_settings=settings, rng=rng),
+            ("rect", "type", "settings"),
+        ),
+        "Companion": (
+            lambda: Companion(player_rect, game_settings=settings, now=0),
+            ("rect", "last_shot_time", "settings"),
+        ),
+    }
+
+
+def bytes_per_instance(factory, count):
+    factory() # Warm up shared caches (sprite atlas, fonts) outside the trace
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_bytes = sys.getsizeof(instances)
+    return (after - before - list_bytes) / count
+
+
+def ns_per_access(instance, attributes, repeats):
+    # Plain attribute loads, as the game's code performs them
+    source = "; ".join(f"e.{name}" for name in attributes)
+    seconds = timeit.timeit(source, globals={"e": instance}, number=repeats)
+    return seconds / (repeats * len(attributes)) * 1e9
+
+
+def run(count, repeats, seed):
+    pygame.init()
+    rng = random.Random(seed)
+    rows = []
+    for name, (factory, attributes) in _factories(rng).items():
+        instance = factory()
+        rows.append((
+            name,
+            bytes_per_instance(factory, count),
+            ns_per_access(instance, attributes, repeats),
+            hasattr(instance, "__dict__"),
+        ))
+    pygame.quit()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000, help="Instances created per class")
+    parser.add_argument("--repeats", type=int, default=200000, help="Attribute-access loop iterations")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'entity':<10} {'bytes/instance':>15} {'ns/attribute':>13} {'__dict__':>9}")
+    for name, size, access_ns, has_dict in run(args.count, args.repeats, args.seed):
+        print(f"{name:<10} {size:>15.0f} {access_ns:>13.1f} {'yes' if has_dict else 'no':>9}")
+
+
+if __name__ == "__main__":
+    main()
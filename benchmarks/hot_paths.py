@@ -0,0 +1,371 @@
+"""
+Frame-cost benchmarks for the simulation and rendering hot paths.
+
+Each scenario times one call per frame of a Game method under a scripted
+load (obstacle counts, a bomb detonation, sustained turret fire, large
+starfields) or one frame of the main menu, with SDL's dummy video driver.
+Results are written as JSON; pass a previous results file as --baseline to
+flag scenarios whose median frame time regressed beyond --tolerance.
+
+Run from the repository root:
+    python benchmarks/hot_paths.py --output bench.json
+    python benchmarks/hot_paths.py --baseline bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+import settings
+
+RESULTS_VERSION = 1
+BENCH_SEED = 1234
+BATCH_FRAMES = 30 # Frames between (untimed) scene top-ups
+OBSTACLE_LOADS = [25, 100, 400]
+STAR_LOADS = [200, 2000]
+
+
+def _settings_with(**overrides):
+    """A copy of the settings module with some values replaced."""
+    values = {name: getattr(settings, name) for name in dir(settings) if name.isupper()}
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+
+def _make_game(screen, game_settings=settings):
+    from game import Game
+
+    game = Game(screen, "bench", game_settings=game_settings, seed=BENCH_SEED)
+    game.update_score = lambda: None # Never write highscores.json from a benchmark
+    game.sim.lives = 10**9 # Keep the run alive so every frame exercises collisions
+    return game
+
+
+def _top_up_obstacles(sim, count):
+    from obstacle import Obstacle
+
+    # Spread over the upper screen so the load stays on screen for a whole batch
+    while len(sim.obstacles) < count:
+        x = sim.rng.randint(0, sim.settings.WIDTH)
+        y = sim.rng.randint(-20, sim.settings.HEIGHT // 2)
+        sim.obstacles.add(
+            Obstacle(
+                sim.obstacle_speed,
+                1,
+                sim.rng.random() < sim.settings.SPLITTABLE_OBSTACLE_CHANCE,
+                position=(x, y),
+                game_settings=sim.settings,
+                rng=sim.rng,
+            )
+        )
+
+
+def _pickup(sim, powerup_type):
+    from powerups import PowerUp
+
+    powerup = PowerUp(game_settings=sim.settings, rng=sim.rng)
+    powerup.type = powerup_type
+    sim.handle_powerup_pickup(powerup, sim.now)
+
+
+def _time_frames(frames, setup_batch, frame):
+    """Calls `frame()` `frames` times, running `setup_batch()` untimed every BATCH_FRAMES."""
+    samples = []
+    clock = time.perf_counter
+    while len(samples) < frames:
+        setup_batch()
+        for _ in range(min(BATCH_FRAMES, frames - len(samples))):
+            start = clock()
+            frame()
+            samples.append(clock() - start)
+    return samples
+
+
+# --- Simulation scenarios (Game.update_game_logic) ---
+def bench_update_obstacles(screen, frames, count):
+    game = _make_game(screen)
+    return _time_frames(
+        frames, lambda: _top_up_obstacles(game.sim, count), game.update_game_logic
+    )
+
+
+def bench_update_bomb(screen, frames, count=100):
+    # Every batch detonates a bomb over `count` obstacles, then simulates the
+    # burst of PARTICLES_PER_OBSTACLE_EXPLOSION-derived particles it leaves
+    game = _make_game(screen)
+    pending = []
+
+    def setup_batch():
+        _top_up_obstacles(game.sim, count)
+        pending.append(True)
+
+    def frame():
+        if pending:
+            pending.clear()
+            _pickup(game.sim, "bomb")
+        game.update_game_logic()
+
+    return _time_frames(frames, setup_batch, frame)
+
+
+def bench_update_turret(screen, frames, count=50):
+    game = _make_game(screen)
+    _pickup(game.sim, "turret")
+
+    def setup_batch():
+        _top_up_obstacles(game.sim, count)
+        game.sim.timers.companion_active_end_tick = float("inf") # Sustained fire
+
+    return _time_frames(frames, setup_batch, game.update_game_logic)
+
+
+def bench_update_autopilot(screen, frames, count=100):
+    # Decision cost alone, over a crowded screen at the current obstacle speed
+    from autopilot import Autopilot
+
+    game = _make_game(screen)
+    pilot = Autopilot()
+
+    def setup_batch():
+        _top_up_obstacles(game.sim, count)
+        game.update_game_logic()
+
+    return _time_frames(frames, setup_batch, lambda: pilot.decide(game.sim))
+
+
+def bench_update_stars(screen, frames, count):
+    game = _make_game(screen, _settings_with(NUM_STARS=count))
+    return _time_frames(frames, lambda: None, game.update_game_logic)
+
+
+# --- Rendering scenarios ---
+def _busy_game(screen):
+    game = _make_game(screen)
+    _top_up_obstacles(game.sim, 100)
+    _pickup(game.sim, "turret")
+    _pickup(game.sim, "bomb")
+    _top_up_obstacles(game.sim, 100)
+    for _ in range(10):
+        game.update_game_logic()
+    return game
+
+
+def bench_render_game(screen, frames):
+    game = _busy_game(screen)
+
+    def setup_batch():
+        _top_up_obstacles(game.sim, 100)
+        game.update_game_logic()
+
+    def frame():
+        screen.fill(game.settings.BACKGROUND_COLOR)
+        game.render_game()
+
+    return _time_frames(frames, setup_batch, frame)
+
+
+def bench_render_stars(screen, frames, count):
+    game = _make_game(screen, _settings_with(NUM_STARS=count))
+
+    def frame():
+        game._update_stars()
+        game._draw_stars()
+
+    return _time_frames(frames, lambda: None, frame)
+
+
+def bench_render_ui(screen, frames):
+    game = _busy_game(screen)
+    return _time_frames(frames, lambda: None, lambda: game.render_ui(game.sim.now))
+
+
+def bench_render_overlay(screen, frames, state):
+    # Pause/game over frame over the frozen scene, with the pointer on a button
+    game = _busy_game(screen)
+    game.current_state = state
+    screen.fill(game.settings.BACKGROUND_COLOR)
+    game.render_game() # Lays out the buttons
+    hovered = game.pause_resume_button or game.game_over_restart_button
+    real_get_pos = pygame.mouse.get_pos
+    pygame.mouse.get_pos = lambda: hovered.center
+
+    def frame():
+        screen.fill(game.settings.BACKGROUND_COLOR)
+        game.render_game()
+
+    try:
+        return _time_frames(frames, lambda: None, frame)
+    finally:
+        pygame.mouse.get_pos = real_get_pos
+
+
+class _UncappedClock:
+    def tick(self, framerate=0):
+        return 0
+
+
+def bench_main_menu(screen, frames):
+    # show_main_menu owns its loop, so frames are counted at display.flip (or
+    # display.update, for dirty-rect frames) and a QUIT event ends the menu;
+    # its 60 FPS clock cap is lifted while timing
+    import game as game_module
+
+    samples = []
+    real_flip = pygame.display.flip
+    real_update = pygame.display.update
+    real_clock = pygame.time.Clock
+    last = [0.0]
+
+    def present(*args):
+        if args:
+            real_update(*args)
+        else:
+            real_flip()
+        now = time.perf_counter()
+        samples.append(now - last[0])
+        if len(samples) >= frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        last[0] = time.perf_counter()
+
+    pygame.display.flip = present
+    pygame.display.update = present
+    pygame.time.Clock = _UncappedClock
+    try:
+        pygame.event.clear()
+        last[0] = time.perf_counter()
+        game_module.show_main_menu(screen, "bench")
+    finally:
+        pygame.display.flip = real_flip
+        pygame.display.update = real_update
+        pygame.time.Clock = real_clock
+    return samples
+
+
+def scenarios():
+    """Scenario name -> callable(screen, frames) returning per-frame seconds."""
+    table = {}
+    for count in OBSTACLE_LOADS:
+        table[f"update.obstacles_{count}"] = (
+            lambda screen, frames, count=count: bench_update_obstacles(screen, frames, count)
+        )
+    table["update.bomb_burst"] = bench_update_bomb
+    table["update.turret_fire"] = bench_update_turret
+    table["update.autopilot"] = bench_update_autopilot
+    for count in STAR_LOADS:
+        table[f"update.stars_{count}"] = (
+            lambda screen, frames, count=count: bench_update_stars(screen, frames, count)
+        )
+    table["render.game"] = bench_render_game
+    for count in STAR_LOADS:
+        table[f"render.stars_{count}"] = (
+            lambda screen, frames, count=count: bench_render_stars(screen, frames, count)
+        )
+    table["render.ui"] = bench_render_ui
+    table["render.pause"] = lambda screen, frames: bench_render_overlay(screen, frames, "paused")
+    table["render.game_over"] = lambda screen, frames: bench_render_overlay(screen, frames, "game_over")
+    table["render.main_menu"] = bench_main_menu
+    return table
+
+
+def summarize(samples):
+    ms = sorted(sample * 1000 for sample in samples)
+    median = statistics.median(ms)
+    return {
+        "frames": len(ms),
+        "median_ms": median,
+        "mean_ms": statistics.fmean(ms),
+        "p95_ms": ms[min(len(ms) - 1, int(len(ms) * 0.95))],
+        "fps": 1000 / median if median > 0 else float("inf"),
+    }
+
+
+def run(frames, only=None):
+    pygame.init()
+    screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    results = {}
+    for name, bench in scenarios().items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = summarize(bench(screen, frames))
+        print(
+            f"{name:<24} {results[name]['median_ms']:>9.3f} ms  "
+            f"{results[name]['fps']:>10.0f} fps  (p95 {results[name]['p95_ms']:.3f} ms)"
+        )
+    pygame.quit()
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": numpy_version,
+            "platform": platform.platform(),
+            "frames": frames,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Prints a per-scenario comparison and returns the names that regressed."""
+    regressions = []
+    print(f"\n{'scenario':<24} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+    for name, base in baseline.get("results", {}).items():
+        result = current["results"].get(name)
+        if result is None:
+            continue
+        change = result["median_ms"] / base["median_ms"] - 1 if base["median_ms"] > 0 else 0.0
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<24} {base['median_ms']:>12.3f} {result['median_ms']:>12.3f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="Timed frames per scenario")
+    parser.add_argument("--only", nargs="*", help="Run only scenarios whose name contains one of these")
+    parser.add_argument("--output", metavar="PATH", help="Write results as JSON to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a saved results file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15,
+        help="Allowed median frame time increase over the baseline (0.15 = 15%%)",
+    )
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT) # Locale files and highscores are resolved relative to the repo root
+    current = run(args.frames, args.only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} scenario(s) regressed: {', '.join(regressions)}")
+            return 1
+        print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,19 @@
-import pygame
+from entity import Entity
+from sprite_atlas import _SPRITE_ATLAS_GLOBAL
 # import settings  # Removed direct import, settings will be passed
 
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(Entity):
+    __slots__ = ("settings", "radius", "speed_y")
+
     def __init__(
         self, x, y, speed_y=None, radius=4, game_settings=None
     ):  # Accept game_settings
         super().__init__()
+        self.reinit(x, y, speed_y, radius, game_settings)
+
+    def reinit(self, x, y, speed_y=None, radius=4, game_settings=None):
+        """(Re)initializes the bullet in place; EntityPool calls this to recycle instances."""
         # Initialize settings with fallback if not provided
         if game_settings is None:
             import settings as default_settings # Fallback import
@@ -17,17 +24,18 @@ class Bullet(pygame.sprite.Sprite):
         self.radius = radius
         # Use settings for default speed and color, or provided values
         self.speed_y = speed_y if speed_y is not None else self.settings.BULLET_SPEED
-        self.color = self.settings.BULLET_COLOR
 
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
+        self.image = _SPRITE_ATLAS_GLOBAL.bullet(self.radius, self.color) # Shared surface
         self.rect = self.image.get_rect(center=(x, y))
 
+    @property
+    def color(self):
+        return self.settings.BULLET_COLOR
 
-    def update(self):
-        self.rect.y += self.speed_y
-        if self.rect.bottom < 0:
-            self.kill()
+    @property
+    def velocity(self):
+        # Pixels per 60 Hz step; the bullets' KinematicGroup moves and culls them
+        return 0.0, self.speed_y
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
\ No newline at end of file
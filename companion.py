@@ -1,15 +1,21 @@
 import pygame
 from bullet import Bullet
+from entity import Entity
+from sprite_atlas import _SPRITE_ATLAS_GLOBAL, SpriteAtlas
 # import settings  # Removed direct import, settings will be passed
 
 
-class Companion(pygame.sprite.Sprite):
+class Companion(Entity):
+    __slots__ = ("settings", "bullet_pool", "last_shot_time")
+
     COMPANION_OFFSET_X = -45
     COMPANION_OFFSET_Y = 0
     FIRE_RATE_MS = 400
+    width = height = SpriteAtlas.COMPANION_SIZE
 
-    def __init__(self, player_rect, game_settings=None):  # Accept game_settings
+    def __init__(self, player_rect, game_settings=None, now=None, bullet_pool=None):  # Accept game_settings
         super().__init__()
+        self.bullet_pool = bullet_pool # Optional EntityPool of Bullets to recycle
         # Initialize settings with fallback if not provided
         if game_settings is None:
             import settings as default_settings # Fallback import
@@ -17,25 +23,25 @@ class Companion(pygame.sprite.Sprite):
         else:
             self.settings = game_settings
 
-        self.width = 20
-        self.height = 20
-        self.image = pygame.Surface([self.width, self.height], pygame.SRCALPHA)
-        self.color = self.settings.NEON_BLUE  # Use settings color
-        pygame.draw.rect(
-            self.image, self.color, (0, 0, self.width, self.height), border_radius=5
-        )
+        self.image = _SPRITE_ATLAS_GLOBAL.companion(self.color, self.width) # Shared surface
         self.rect = self.image.get_rect()
-        self.last_shot_time = pygame.time.get_ticks()
+        # `now` lets a caller with its own clock (e.g. a headless Simulation) drive the fire rate
+        self.last_shot_time = now if now is not None else pygame.time.get_ticks()
         self.update_position(player_rect)
 
+    @property
+    def color(self):
+        return self.settings.NEON_BLUE  # Use settings color
+
     def update_position(self, player_rect):
         self.rect.centerx = player_rect.centerx + self.COMPANION_OFFSET_X
         self.rect.centery = player_rect.centery + self.COMPANION_OFFSET_Y
 
-    def update(self, player_rect):
+    def update(self, player_rect, now=None):
         self.update_position(player_rect)
 
-        now = pygame.time.get_ticks()
+        if now is None:
+            now = pygame.time.get_ticks()
         bullets_fired = []
         if now - self.last_shot_time > self.FIRE_RATE_MS:
             self.last_shot_time = now
@@ -45,7 +51,8 @@ class Companion(pygame.sprite.Sprite):
     def shoot(self):
         bullet_start_x = self.rect.centerx
         bullet_start_y = self.rect.top
-        new_bullet = Bullet(
+        create = self.bullet_pool.acquire if self.bullet_pool is not None else Bullet
+        new_bullet = create(
             bullet_start_x,
             bullet_start_y,
             speed_y=self.settings.COMPANION_BULLET_SPEED,
@@ -0,0 +1,205 @@
+import hashlib
+import json
+import math
+import struct
+from dataclasses import dataclass
+
+MAX_TABLE_SCORE = 100000 # Longest table compiled; curves are flat beyond their last point anyway
+
+# Curve file channels, in DifficultyLevel field order: name -> (default interpolation, value type)
+CHANNELS = {
+    "spawn_interval": ("linear", int), # Base (60 Hz) frames between spawns
+    "obstacle_speed": ("step", float), # Pixels per base frame
+    "wave_chance": ("linear", float), # Chance that a spawn is a wave
+    "wave_size": ("step", int), # Extra obstacles in a wave
+}
+_LEVEL = struct.Struct("<iddi") # One DifficultyLevel, for fingerprints
+
+
+class DifficultyCurveError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class DifficultyLevel:
+    spawn_interval: int
+    obstacle_speed: float
+    wave_chance: float
+    wave_size: int
+
+
+class DifficultyCurve:
+    """
+    Score -> DifficultyLevel lookup table, compiled once so the simulation
+    pays one list index per step instead of re-deriving the spawn interval
+    and speed milestones from settings. Scores past the end of the table
+    keep its last level.
+
+    Curves come from the settings (`from_settings`, which reproduces the
+    interpolated spawn interval and stepped speed increases exactly) or
+    from a JSON file (`load`) mapping channel names to [score, value]
+    points:
+
+        {"spawn_interval": [[0, 35], [300, 20]],
+         "obstacle_speed": {"points": [[0, 5], [50, 8], [200, 12]], "mode": "step"},
+         "wave_chance": [[0, 0.1], [400, 0.6]]}
+
+    "linear" channels interpolate between points, "step" channels hold each
+    value until the next point (see CHANNELS for defaults and types).
+    Channels missing from the file fall back to the settings curve.
+    """
+
+    def __init__(self, levels):
+        if not levels:
+            raise DifficultyCurveError("A difficulty curve needs at least one level")
+        self.levels = levels
+        self._last = len(levels) - 1
+        self._fingerprint = None
+
+    def __len__(self):
+        return len(self.levels)
+
+    def fingerprint(self):
+        """64-bit hash of the compiled table; replays record it to detect a different curve."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for level in self.levels:
+                digest.update(_LEVEL.pack(
+                    level.spawn_interval, level.obstacle_speed, level.wave_chance, level.wave_size
+                ))
+            self._fingerprint = int.from_bytes(digest.digest(), "little")
+        return self._fingerprint
+
+    def at(self, score):
+        return self.levels[score if score < self._last else self._last]
+
+    # --- Construction ---
+    @classmethod
+    def from_settings(cls, game_settings):
+        channels = _settings_channels(game_settings)
+        return cls._from_channels(channels)
+
+    @classmethod
+    def load(cls, path, game_settings):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise DifficultyCurveError(f"Cannot read difficulty curve {path}: {e}") from None
+        if not isinstance(data, dict):
+            raise DifficultyCurveError(f"{path}: expected an object of channels")
+        channels = _settings_channels(game_settings)
+        for name, spec in data.items():
+            if name not in CHANNELS:
+                raise DifficultyCurveError(f"{path}: unknown channel {name!r}")
+            channels[name] = _keyframe_channel(name, spec)
+        return cls._from_channels(channels)
+
+    @classmethod
+    def _from_channels(cls, channels):
+        # Each channel is (value(score) function, score from which it stays constant)
+        length = min(MAX_TABLE_SCORE, max(flat_from for _, flat_from in channels.values())) + 1
+        values = {name: [function(score) for score in range(length)] for name, (function, _) in channels.items()}
+        levels = [
+            DifficultyLevel(*(values[name][score] for name in CHANNELS))
+            for score in range(length)
+        ]
+        return cls(levels)
+
+
+def _settings_channels(game_settings):
+    """The difficulty the settings constants describe, as (function, flat-from score) per channel."""
+    base_interval = game_settings.BASE_OBSTACLE_SPAWN_INTERVAL
+    min_interval = game_settings.MIN_OBSTACLE_SPAWN_INTERVAL
+    score_to_min = game_settings.SCORE_TO_REACH_MIN_INTERVAL
+
+    def spawn_interval(score):
+        interval = base_interval
+        if score_to_min > 0: # Avoid division by zero if not set
+            if score >= score_to_min:
+                interval = min_interval
+            else:
+                # Linearly interpolate spawn interval
+                interval = base_interval - (base_interval - min_interval) * (score / score_to_min)
+        return max(min_interval, int(interval))
+
+    base_speed = game_settings.OBSTACLE_BASE_SPEED
+    speed_interval = game_settings.OBSTACLE_SPEED_INCREASE_INTERVAL
+    speed_amount = game_settings.OBSTACLE_SPEED_INCREASE_AMOUNT
+    max_speed = game_settings.MAX_OBSTACLE_SPEED
+    speed_steps = 0
+    if speed_interval > 0 and speed_amount > 0 and max_speed > base_speed:
+        speed_steps = math.ceil((max_speed - base_speed) / speed_amount)
+
+    def obstacle_speed(score):
+        # One increase per milestone reached, accumulated as the old per-spawn code did
+        speed = base_speed
+        for _ in range(min(speed_steps, score // speed_interval) if speed_steps else 0):
+            speed = min(speed + speed_amount, max_speed)
+        return speed
+
+    wave_chance = game_settings.MULTIPLE_OBSTACLE_SPAWN_CHANCE
+    wave_size = game_settings.ADDITIONAL_OBSTACLES_TO_SPAWN
+    return {
+        "spawn_interval": (spawn_interval, max(0, score_to_min)),
+        "obstacle_speed": (obstacle_speed, speed_steps * speed_interval),
+        "wave_chance": (lambda score: wave_chance, 0),
+        "wave_size": (lambda score: wave_size, 0),
+    }
+
+
+def _keyframe_channel(name, spec):
+    mode, cast = CHANNELS[name]
+    points = spec
+    if isinstance(spec, dict):
+        points = spec.get("points")
+        mode = spec.get("mode", mode)
+    if mode not in ("linear", "step"):
+        raise DifficultyCurveError(f"{name}: unknown mode {mode!r}")
+    try:
+        points = sorted((int(score), float(value)) for score, value in points)
+    except (TypeError, ValueError):
+        raise DifficultyCurveError(f"{name}: expected a list of [score, value] points") from None
+    if not points:
+        raise DifficultyCurveError(f"{name}: needs at least one point")
+
+    def value(score):
+        previous = points[0]
+        for point in points:
+            if point[0] > score:
+                if mode == "step" or score < previous[0]:
+                    return cast(previous[1])
+                s0, v0 = previous
+                s1, v1 = point
+                return cast(v0 - (v0 - v1) * ((score - s0) / (s1 - s0)))
+            previous = point
+        return cast(previous[1])
+
+    return value, points[-1][0]
+
+
+_CURVE_CACHE = {}
+
+
+def get_difficulty_curve(game_settings):
+    """
+    The compiled curve for `game_settings`: DIFFICULTY_CURVE_FILE if set,
+    else the settings-derived one. Compiled once per distinct set of inputs.
+    """
+    path = getattr(game_settings, "DIFFICULTY_CURVE_FILE", None)
+    key = (path,) + tuple(
+        getattr(game_settings, name)
+        for name in (
+            "BASE_OBSTACLE_SPAWN_INTERVAL", "MIN_OBSTACLE_SPAWN_INTERVAL", "SCORE_TO_REACH_MIN_INTERVAL",
+            "OBSTACLE_BASE_SPEED", "OBSTACLE_SPEED_INCREASE_INTERVAL", "OBSTACLE_SPEED_INCREASE_AMOUNT",
+            "MAX_OBSTACLE_SPEED", "MULTIPLE_OBSTACLE_SPAWN_CHANCE", "ADDITIONAL_OBSTACLES_TO_SPAWN",
+        )
+    )
+    curve = _CURVE_CACHE.get(key)
+    if curve is None:
+        if path:
+            curve = DifficultyCurve.load(path, game_settings)
+        else:
+            curve = DifficultyCurve.from_settings(game_settings)
+        _CURVE_CACHE[key] = curve
+    return curve
@@ -0,0 +1,80 @@
+import pygame
+import settings
+
+
+def _merge_overlapping(rects):
+    """Replaces overlapping rects by their unions until no two overlap."""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    Renders screens made of a scrolling starfield under a static UI layer
+    (menus, the instructions screen). The UI is drawn once into an alpha layer
+    and the whole screen is redrawn and flipped only when the caller's `key`
+    changes (hover target, typed text, locale, ...). On all other frames only
+    the squares the stars moved out of and into are repainted and pushed with
+    pygame.display.update(rects). benchmarks/dirty_rect_parity.py checks that
+    the partial updates match a full redraw pixel for pixel.
+    """
+
+    def __init__(self, screen, background_color=settings.BACKGROUND_COLOR):
+        self.screen = screen
+        self.background_color = background_color
+        self.layer = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        self._key = None
+        self._has_frame = False
+        self._layer_rects = [] # Bounding rects of the layer's visible content
+        self.full_redraws = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        """Forces a full redraw on the next frame."""
+        self._has_frame = False
+
+    def render(self, starfield, key, draw_layer):
+        """
+        Presents one frame. `starfield` must have been updated since the last
+        call; `draw_layer(surface)` draws the UI and is only called when `key`
+        differs from the previous frame's.
+        """
+        screen = self.screen
+        if not self._has_frame or key != self._key:
+            self._key = key
+            self._has_frame = True
+            self.layer.fill((0, 0, 0, 0))
+            draw_layer(self.layer)
+            self._layer_rects = pygame.mask.from_surface(self.layer, 0).get_bounding_rects()
+            screen.fill(self.background_color)
+            starfield.draw(screen)
+            screen.blit(self.layer, (0, 0))
+            pygame.display.flip()
+            self.full_redraws += 1
+            return
+
+        screen_rect = screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in starfield.dirty_rects()]
+        layer_rects = self._layer_rects
+        clear, under_layer = [], []
+        for rect in dirty:
+            if rect.height:
+                (clear if rect.collidelist(layer_rects) == -1 else under_layer).append(rect)
+        # Translucent UI must be blended exactly once per pixel, so the rects
+        # it is restored into may not overlap
+        under_layer = _merge_overlapping(under_layer)
+        dirty = clear + under_layer
+        for rect in dirty:
+            screen.fill(self.background_color, rect)
+        starfield.draw(screen)
+        for rect in under_layer:
+            screen.blit(self.layer, rect, rect)
+        pygame.display.update(dirty)
+        self.partial_updates += 1
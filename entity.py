@@ -0,0 +1,97 @@
+import pygame
+
+
+class Entity:
+    """
+    Slotted stand-in for pygame.sprite.Sprite. pygame.sprite.Sprite gives
+    every instance a __dict__ (and so does any subclass), which is the bulk
+    of a small entity's memory. Entity implements the same protocol groups
+    rely on (add_internal/remove_internal, kill, alive, groups, update) with
+    fixed slots instead. pygame groups accept such sprites through their
+    non-Sprite code path; EntityGroup adds a fast path for them.
+
+    Group membership is a tuple rather than a set: entities are almost always
+    in exactly one group, and an empty set alone outweighs all their slots.
+
+    Subclasses declare their own __slots__ and keep shared constants at
+    class level rather than copying them into every instance.
+    """
+
+    __slots__ = ("image", "rect", "_groups")
+
+    def __init__(self, *groups):
+        self._groups = ()
+        if groups:
+            self.add(*groups)
+
+    # --- pygame.sprite.Sprite protocol ---
+    def add_internal(self, group):
+        self._groups += (group,)
+
+    def remove_internal(self, group):
+        self._groups = tuple(g for g in self._groups if g is not group)
+
+    def add(self, *groups):
+        for group in groups:
+            if group not in self._groups:
+                group.add_internal(self)
+                self.add_internal(group)
+
+    def remove(self, *groups):
+        for group in groups:
+            if group in self._groups:
+                group.remove_internal(self)
+                self.remove_internal(group)
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def kill(self):
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def groups(self):
+        return list(self._groups)
+
+    def alive(self):
+        return bool(self._groups)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} Entity(in {len(self._groups)} groups)>"
+
+
+class EntityGroup(pygame.sprite.Group):
+    """
+    pygame.sprite.Group with a direct path for Entity members; plain Group
+    only recognizes them after a failed attempt to unpack them as iterables.
+    """
+
+    def add(self, *sprites):
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                if not self.has_internal(sprite):
+                    self.add_internal(sprite)
+                    sprite.add_internal(self)
+            else:
+                super().add(sprite)
+
+    def remove(self, *sprites):
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                if self.has_internal(sprite):
+                    self.remove_internal(sprite)
+                    sprite.remove_internal(self)
+            else:
+                super().remove(sprite)
+
+    def has(self, *sprites):
+        if not sprites:
+            return False
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                if not self.has_internal(sprite):
+                    return False
+            elif not super().has(sprite):
+                return False
+        return True
@@ -0,0 +1,75 @@
+from entity import EntityGroup
+
+
+class EntityPool:
+    """
+    Free list of recycled sprites of one class. `acquire` re-initializes a
+    free instance through its `reinit` method (which takes the constructor's
+    arguments) or constructs a new one when the list is empty. Released
+    sprites only become reusable after the next `flush`, so an entity killed
+    during a simulation step is never handed out again within that same step
+    while other code may still hold a reference to it.
+    """
+
+    def __init__(self, cls, max_free=512):
+        self.cls = cls
+        self.max_free = max_free
+        self._free = []
+        self._pending = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            entity = self._free.pop()
+            entity.reinit(*args, **kwargs)
+            self.reused += 1
+        else:
+            entity = self.cls(*args, **kwargs)
+            self.created += 1
+        return entity
+
+    def release(self, entity):
+        if type(entity) is not self.cls:
+            return # Foreign sprites (e.g. subclasses) are left to the garbage collector
+        self.released += 1
+        if len(self._free) + len(self._pending) < self.max_free:
+            self._pending.append(entity)
+        else:
+            self.dropped += 1
+
+    def flush(self):
+        """Makes every sprite released since the last flush available to acquire."""
+        if self._pending:
+            self._free.extend(self._pending)
+            self._pending.clear()
+
+    def clear(self):
+        self._free.clear()
+        self._pending.clear()
+
+    def stats(self):
+        acquired = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "dropped": self.dropped,
+            "free": len(self._free),
+            "pending": len(self._pending),
+            "reuse_rate": self.reused / acquired if acquired else 0.0,
+        }
+
+
+class PooledGroup(EntityGroup):
+    """Sprite group that hands each sprite back to `pool` when it leaves the group (kill, remove, empty)."""
+
+    def __init__(self, pool, *sprites):
+        self.pool = pool
+        super().__init__(*sprites)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.pool.release(sprite)
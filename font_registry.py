@@ -0,0 +1,84 @@
+import io
+import threading
+import pygame
+
+DEFAULT_FONT_NAME = "consolas"
+
+
+class FontRegistry:
+    """
+    Resolves each (name, size) pair to a Font once and hands out the shared
+    Font object afterwards. Finding a font's file scans the system font list
+    (fc-list or the registry), so it must never run inside a per-frame or
+    per-entity code path.
+
+    SDL_ttf is not thread-safe, so Font objects are only created and used on
+    the main thread. The startup warmer calls `prefetch`, which does the
+    slow part off the main thread: the system font scan and reading the font
+    file into memory. `get` then builds each size from those bytes.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self._fitted = {}
+        self._files = {} # Font name -> file contents, or None for pygame's default font
+        self._lock = threading.Lock() # Serializes font file discovery between the warmer and the main thread
+
+    def prefetch(self, name=DEFAULT_FONT_NAME):
+        """Finds and reads the font file for `name`. Safe to call from any thread."""
+        with self._lock:
+            if name not in self._files:
+                path = pygame.font.match_font(name)
+                data = None
+                if path is not None:
+                    try:
+                        with open(path, "rb") as f:
+                            data = f.read()
+                    except OSError as e:
+                        print(f"Warning: could not read font file {path}: {e}")
+                self._files[name] = data
+            return self._files[name]
+
+    def get(self, size, name=DEFAULT_FONT_NAME):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            data = self.prefetch(name)
+            if not pygame.font.get_init():
+                pygame.font.init()
+            # Same lookup SysFont does; None falls back to pygame's default font
+            font = pygame.font.Font(io.BytesIO(data) if data is not None else None, size)
+            self._fonts[key] = font
+        return font
+
+    def get_fitted(self, text, max_font_size, max_width, max_height, name=DEFAULT_FONT_NAME):
+        """
+        Returns the largest registered font (<= max_font_size, >= 10) whose
+        rendering of `text` fits within max_width x max_height. Memoized per
+        (text, size bounds, name).
+        """
+        key = (text, max_font_size, max_width, max_height, name)
+        font = self._fitted.get(key)
+        if font is None:
+            font = self.get(10, name) # Fallback to a very small font if nothing fits
+            for size in range(max_font_size, 10, -1): # Iterate downwards from max_font_size
+                candidate = self.get(size, name)
+                width, height = candidate.size(text)
+                if width <= max_width and height <= max_height:
+                    font = candidate
+                    break
+            self._fitted[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        self._fitted.clear()
+        with self._lock:
+            self._files.clear()
+
+
+_FONT_REGISTRY_GLOBAL = FontRegistry()
+
+
+def get_font(size, name=DEFAULT_FONT_NAME):
+    return _FONT_REGISTRY_GLOBAL.get(size, name)
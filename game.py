@@ -1,43 +1,29 @@
 import pygame
 import random
 import math
-from player import Player
-from obstacle import Obstacle
-from powerups import PowerUp
+import time
 from utils import (
     get_username,
     save_high_scores,
     update_high_scores,
     get_high_scores,
     get_high_score_value,
+    get_high_score_version,
 )
-from bullet import Bullet
-from companion import Companion
-from particle import Particle
-from dataclasses import dataclass, field
+from simulation import Simulation
+from replay import ReplayRecorder
+import snapshot
+from autopilot import Autopilot
+from text_cache import render_text
+from font_registry import get_font, _FONT_REGISTRY_GLOBAL
+from starfield import create_starfield
+from profiler import _FRAME_PROFILER_GLOBAL
+from dirty_rects import DirtyRectRenderer
+from overlay_cache import OverlayBuilder, OverlayCache
+from startup import _STARTUP_PROFILER_GLOBAL
 import settings
 from locale_manager import _LOCALE_MANAGER_GLOBAL
 
-# --- Dataclasses ---
-@dataclass
-class GameTimers:
-    spawn_obstacle: int = 0
-    spawn_powerup: int = 0
-    slowmo_effect_end_tick: int = 0
-    shrink_effect_end_tick: int = 0
-    pickup_message_end_tick: int = 0
-    player_invincible_end_tick: int = 0
-    companion_active_end_tick: int = 0
-
-
-@dataclass
-class ActiveEffects:
-    shield: bool = False
-    bomb_ready: bool = False
-    pickup_message: str = ""
-
-
-# ---
 
 # Constants for menu actions
 ACTION_SHOW_INSTRUCTIONS = "SHOW_INSTRUCTIONS"
@@ -181,8 +167,8 @@ def draw_simplified_flag(screen, locale_code, rect):
     else: # Fallback
         pygame.draw.rect(screen, settings.ACCENT_DARK_BLUE, flag_rect_inner)
         try:
-            font = pygame.font.SysFont("consolas", 18) # Adjust font as needed
-            text_surf = font.render(locale_code.upper(), True, settings.BRIGHT_WHITE)
+            font = get_font(18) # Adjust font as needed
+            text_surf = render_text(font, locale_code.upper(), True, settings.BRIGHT_WHITE)
             text_rect = text_surf.get_rect(center=flag_rect_inner.center)
             screen.blit(text_surf, text_rect)
         except pygame.error:
@@ -190,7 +176,7 @@ def draw_simplified_flag(screen, locale_code, rect):
 
 
 def draw_text_centered(screen, text, font, color, surface_rect):
-    text_surf = font.render(text, True, color)
+    text_surf = render_text(font, text, True, color)
     text_rect = text_surf.get_rect(center=surface_rect.center)
     screen.blit(text_surf, text_rect)
 
@@ -198,20 +184,18 @@ def get_fitted_font(text, max_font_size, max_width, max_height, font_name="conso
     """
     Returns a Pygame font object that fits the given text within the specified
     max_width and max_height, starting from max_font_size and decreasing if necessary.
+    Results are memoized by the font registry.
     """
-    for size in range(max_font_size, 10, -1):  # Iterate downwards from max_font_size
-        font = pygame.font.SysFont(font_name, size)
-        text_surface = font.render(text, True, (255, 255, 255))  # Color doesn't matter for size check
-        if text_surface.get_width() <= max_width and text_surface.get_height() <= max_height:
-            return font
-    return pygame.font.SysFont(font_name, 10) # Fallback to a very small font if nothing fits
+    return _FONT_REGISTRY_GLOBAL.get_fitted(
+        text, max_font_size, max_width, max_height, font_name
+    )
 
 
 def show_main_menu(screen, username=""):
-    menu_font = pygame.font.SysFont("consolas", 30)
-    title_font = pygame.font.SysFont("consolas", 48)
-    small_font = pygame.font.SysFont("consolas", 22)
-    input_font = pygame.font.SysFont("consolas", 28)
+    menu_font = get_font(30)
+    title_font = get_font(48)
+    small_font = get_font(22)
+    input_font = get_font(28)
     clock = pygame.time.Clock()
     input_box_rect = pygame.Rect(settings.WIDTH // 2 - 150, 220, 300, 40)
     input_box_active = False
@@ -243,14 +227,7 @@ def show_main_menu(screen, username=""):
     cursor_visible = True
     last_cursor_toggle = pygame.time.get_ticks()
 
-    stars = []
-    for _ in range(settings.NUM_STARS):
-        x = random.randint(0, settings.WIDTH)
-        y = random.randint(0, settings.HEIGHT)
-        speed = random.randint(settings.STAR_SPEED_MIN, settings.STAR_SPEED_MAX)
-        color = random.choice(settings.STAR_COLORS)
-        size = random.randint(settings.STAR_SIZE_MIN, settings.STAR_SIZE_MAX)
-        stars.append([x, y, speed, color, size])
+    starfield = create_starfield(settings)
 
     available_locales = _LOCALE_MANAGER_GLOBAL.get_available_locales()
     flag_button_width = 60
@@ -266,49 +243,21 @@ def show_main_menu(screen, username=""):
         language_buttons[locale_code] = flag_rect
 
 
-    def _update_stars():
-        for i in range(len(stars)):
-            star = stars[i]
-            star[1] += star[2]
-            if star[1] > settings.HEIGHT:
-                stars[i] = [
-                    random.randint(0, settings.WIDTH),
-                    random.randint(-20, -5),
-                    random.randint(settings.STAR_SPEED_MIN, settings.STAR_SPEED_MAX),
-                    random.choice(settings.STAR_COLORS),
-                    random.randint(settings.STAR_SIZE_MIN, settings.STAR_SIZE_MAX),
-                ]
-
-    def _draw_stars():
-        for star_data in stars:
-            pygame.draw.rect(
-                screen,
-                star_data[3],
-                (star_data[0], star_data[1], star_data[4], star_data[4]),
-            )
-
-    while running:
-        current_time = pygame.time.get_ticks()
-        if current_time - last_cursor_toggle > cursor_blink_interval:
-            cursor_visible = not cursor_visible
-            last_cursor_toggle = current_time
-
-        mouse_pos = pygame.mouse.get_pos() # Keep for hover
-        screen.fill(settings.BACKGROUND_COLOR)
-        _update_stars()
-        _draw_stars()
+    # Dirty-rect mode pushes only the moving stars between UI changes
+    renderer = DirtyRectRenderer(screen) if settings.DIRTY_RECT_RENDERING else None
 
+    def draw_menu_ui(surface):
         draw_text_centered(
-            screen,
+            surface,
             _LOCALE_MANAGER_GLOBAL.get_text("game_title"),
             title_font,
             settings.MENU_TITLE_COLOR,
             pygame.Rect(0, 100, settings.WIDTH, title_font.get_height()),
         )
-        username_label_surf = small_font.render(
-            _LOCALE_MANAGER_GLOBAL.get_text("enter_username"), True, settings.MENU_TEXT_COLOR
+        username_label_surf = render_text(
+            small_font, _LOCALE_MANAGER_GLOBAL.get_text("enter_username"), True, settings.MENU_TEXT_COLOR
         )
-        screen.blit(
+        surface.blit(
             username_label_surf,
             (input_box_rect.x, input_box_rect.y - username_label_surf.get_height() - 5),
         )
@@ -318,12 +267,12 @@ def show_main_menu(screen, username=""):
             else settings.INPUT_BOX_COLOR_INACTIVE
         )
         pygame.draw.rect(
-            screen, current_input_box_color, input_box_rect, 2, border_radius=5
+            surface, current_input_box_color, input_box_rect, 2, border_radius=5
         )
-        username_text_surf = input_font.render(
-            current_username, True, settings.MENU_TEXT_COLOR
+        username_text_surf = render_text(
+            input_font, current_username, True, settings.MENU_TEXT_COLOR
         )
-        screen.blit(
+        surface.blit(
             username_text_surf,
             (
                 input_box_rect.x + 10,
@@ -333,8 +282,8 @@ def show_main_menu(screen, username=""):
         )
 
         if input_box_active and cursor_visible:
-            text_before_cursor = input_font.render(
-                current_username[:cursor_position], True, settings.MENU_TEXT_COLOR
+            text_before_cursor = render_text(
+                input_font, current_username[:cursor_position], True, settings.MENU_TEXT_COLOR
             )
             cursor_x = input_box_rect.x + 10 + text_before_cursor.get_width()
             cursor_y = (
@@ -343,7 +292,7 @@ def show_main_menu(screen, username=""):
             )
             cursor_height = input_font.get_height()
             pygame.draw.line(
-                screen,
+                surface,
                 settings.MENU_TEXT_COLOR,
                 (cursor_x, cursor_y),
                 (cursor_x, cursor_y + cursor_height),
@@ -355,9 +304,9 @@ def show_main_menu(screen, username=""):
             if start_button_rect.collidepoint(mouse_pos)
             else settings.BUTTON_COLOR_NORMAL
         )
-        pygame.draw.rect(screen, start_color, start_button_rect, border_radius=10)
+        pygame.draw.rect(surface, start_color, start_button_rect, border_radius=10)
         draw_text_centered(
-            screen,
+            surface,
             _LOCALE_MANAGER_GLOBAL.get_text("start_game"),
             menu_font,
             settings.BUTTON_TEXT_COLOR,
@@ -369,10 +318,10 @@ def show_main_menu(screen, username=""):
             else settings.BUTTON_COLOR_NORMAL
         )
         pygame.draw.rect(
-            screen, instr_color, instructions_button_rect, border_radius=10
+            surface, instr_color, instructions_button_rect, border_radius=10
         )
         draw_text_centered(
-            screen,
+            surface,
             _LOCALE_MANAGER_GLOBAL.get_text("instructions"),
             menu_font,
             settings.BUTTON_TEXT_COLOR,
@@ -383,17 +332,45 @@ def show_main_menu(screen, username=""):
             if quit_button_rect.collidepoint(mouse_pos)
             else settings.BUTTON_COLOR_NORMAL
         )
-        pygame.draw.rect(screen, quit_color, quit_button_rect, border_radius=10)
+        pygame.draw.rect(surface, quit_color, quit_button_rect, border_radius=10)
         draw_text_centered(
-            screen, _LOCALE_MANAGER_GLOBAL.get_text("quit"), menu_font, settings.BUTTON_TEXT_COLOR, quit_button_rect
+            surface, _LOCALE_MANAGER_GLOBAL.get_text("quit"), menu_font, settings.BUTTON_TEXT_COLOR, quit_button_rect
         )
         hs_y_start = quit_button_rect.bottom + 20
         if hs_y_start + 150 > settings.HEIGHT:
             hs_y_start = settings.HEIGHT - 150
-        draw_high_scores(screen, small_font, y_start=hs_y_start)
+        draw_high_scores(surface, small_font, y_start=hs_y_start)
 
         for locale_code, flag_rect in language_buttons.items():
-            draw_simplified_flag(screen, locale_code, flag_rect)
+            draw_simplified_flag(surface, locale_code, flag_rect)
+
+    while running:
+        current_time = pygame.time.get_ticks()
+        if current_time - last_cursor_toggle > cursor_blink_interval:
+            cursor_visible = not cursor_visible
+            last_cursor_toggle = current_time
+
+        mouse_pos = pygame.mouse.get_pos() # Keep for hover
+        starfield.update()
+        if renderer is None:
+            screen.fill(settings.BACKGROUND_COLOR)
+            starfield.draw(screen)
+            draw_menu_ui(screen)
+        else:
+            # Everything draw_menu_ui shows; any change triggers a full redraw
+            ui_state = (
+                start_button_rect.collidepoint(mouse_pos),
+                instructions_button_rect.collidepoint(mouse_pos),
+                quit_button_rect.collidepoint(mouse_pos),
+                input_box_active,
+                input_box_active and cursor_visible,
+                current_username,
+                cursor_position,
+                _LOCALE_MANAGER_GLOBAL.current_locale,
+                _LOCALE_MANAGER_GLOBAL.catalog_version, # Redraw once the warmer's catalog lands
+                get_high_score_version(),
+            )
+            renderer.render(starfield, ui_state, draw_menu_ui)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -549,24 +526,41 @@ def show_main_menu(screen, username=""):
                             else _LOCALE_MANAGER_GLOBAL.get_text("guest")
                         )
 
-        pygame.display.flip()
+        if renderer is None:
+            pygame.display.flip()
+        _STARTUP_PROFILER_GLOBAL.first_frame() # No-op after the first menu frame
         clock.tick(60)
     return ACTION_QUIT_GAME, current_username # Fallback
 
 
+# Rendered top-10 lines, rebuilt only when the scores, title or font change
+_high_score_surfaces_key = None
+_high_score_surfaces = []
+
+
+def _render_high_score_surfaces(font):
+    global _high_score_surfaces_key, _high_score_surfaces
+    title = _LOCALE_MANAGER_GLOBAL.get_text("top_scores")
+    key = (get_high_score_version(), title, font)
+    if key != _high_score_surfaces_key:
+        surfaces = [render_text(font, title, True, (255, 255, 255))]
+        for i, entry in enumerate(get_high_scores()[:10]):
+            surfaces.append(
+                render_text(font, f"{i+1}. {entry['username']}: {entry['score']}", True, (200, 200, 200))
+            )
+        _high_score_surfaces_key = key
+        _high_score_surfaces = surfaces
+    return _high_score_surfaces
+
+
 def draw_high_scores(screen, font, y_start):
-    highscores = get_high_scores()
-    highscores.sort(key=lambda x: x["score"], reverse=True)
+    title_text_surf, *entry_surfs = _render_high_score_surfaces(font)
     y_pos = y_start
-    title_text_surf = font.render(_LOCALE_MANAGER_GLOBAL.get_text("top_scores"), True, (255, 255, 255))
     screen.blit(
         title_text_surf, (settings.WIDTH // 2 - title_text_surf.get_width() // 2, y_pos)
     )
     y_pos += 28
-    for i, entry in enumerate(highscores[:10]):
-        hs_text_surf = font.render(
-            f"{i+1}. {entry['username']}: {entry['score']}", True, (200, 200, 200)
-        )
+    for hs_text_surf in entry_surfs:
         screen.blit(
             hs_text_surf, (settings.WIDTH // 2 - hs_text_surf.get_width() // 2, y_pos)
         )
@@ -588,18 +582,25 @@ class Game:
         ai_mode=False,
         start_state=STATE_PLAYING,
         game_settings=settings,
+        seed=None,
+        replay_path=None,
     ):
         self.ai_mode = ai_mode
+        self.autopilot = Autopilot() if ai_mode else None # Plays the run in ai_mode (soak tests)
+        self.seed = seed # None picks a fresh random seed for the run
+        self.replay_path = replay_path # If set, the run's replay is written here
         self.screen = screen
         self.username = username.strip() or _LOCALE_MANAGER_GLOBAL.get_text("guest")
         self.settings = game_settings
         self.locale = _LOCALE_MANAGER_GLOBAL
 
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("consolas", 28)
-        self.small_font = pygame.font.SysFont("consolas", 20)
-        self.medium_font = pygame.font.SysFont("consolas", 24)
-        self.large_font = pygame.font.SysFont("consolas", 32)
+        self.profiler = _FRAME_PROFILER_GLOBAL # Phase timings, F3 overlay and trace sink
+        self.font = get_font(28)
+        self.small_font = get_font(20)
+        self.medium_font = get_font(24)
+        self.large_font = get_font(32)
+        self.overlays = OverlayCache() # Composited pause/game over/instructions/quit screens
 
         self.reset_game_state()
         self.current_state = start_state
@@ -621,121 +622,70 @@ class Game:
         self.quit_context_message = ""
         
         self.current_touch_pos = None # For player movement touch
-
-    def _create_star(self):
-        x = random.randint(0, self.settings.WIDTH)
-        y = random.randint(0, self.settings.HEIGHT)
-        speed = random.randint(
-            self.settings.STAR_SPEED_MIN, self.settings.STAR_SPEED_MAX
-        )
-        color = random.choice(self.settings.STAR_COLORS)
-        size = random.randint(
-            self.settings.STAR_SIZE_MIN, self.settings.STAR_SIZE_MAX
-        )
-        return [x, y, speed, color, size]
-
-    def _create_explosion(
-        self,
-        position,
-        base_color,
-        num_particles=settings.PARTICLES_PER_OBSTACLE_EXPLOSION,
-    ):
-        for _ in range(num_particles):
-            self.particles.add(Particle(position[0], position[1], base_color))
+        self.checkpoint = None # Snapshot taken with F5, restored with F9 (DEBUG_SNAPSHOT_HOTKEYS only)
 
     def reset_game_state(self):
-        self.player = Player(self.settings)
-        self.obstacles = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.score = 0
+        self.sim = Simulation(self.settings, self.locale, seed=self.seed)
+        self.sim.profiler = self.profiler
+        self.replay_recorder = ReplayRecorder.for_simulation(self.sim)
+        self._previous_positions = {}
+        self.render_alpha = 1.0
+        self.replay_saved = False
+        self.input_mask = 0
         self.high_score = get_high_score_value()
-        self.obstacle_speed = self.settings.OBSTACLE_BASE_SPEED
-        self.speed_multiplier = 1.0
-        self.lives = self.settings.INITIAL_LIVES
-        self.timers = GameTimers()
-        self.effects = ActiveEffects()
-        self.companion = None
-        self.companion_bullets = pygame.sprite.Group()
-        self.stars = [
-            self._create_star() for _ in range(self.settings.NUM_STARS)
-        ]
-        self.particles = pygame.sprite.Group()
+        # Separate stream so cosmetic stars never perturb the gameplay RNG
+        self.starfield = create_starfield(
+            self.settings, seed=random.Random(f"{self.sim.seed}:stars").getrandbits(64)
+        )
         self.previous_state_on_quit_request = self.STATE_PLAYING # Default previous state
         self.current_touch_pos = None
 
 
+    def take_snapshot(self):
+        """The run's full state (simulation and stars) as a compact binary buffer, see snapshot.py."""
+        return snapshot.capture_snapshot(self.sim, self.starfield)
+
+    def restore_snapshot(self, data):
+        """
+        Resumes the run captured by take_snapshot from its frame. Refused once
+        the current run is over, since its score has already been submitted.
+        """
+        if self.sim.game_over:
+            raise snapshot.SnapshotError("Cannot restore a snapshot after the run has ended")
+        snapshot.restore_snapshot(self.sim, data, self.starfield)
+        self._previous_positions = {}
+        self.render_alpha = 1.0
+        self.input_mask = 0
+        replay = self.replay_recorder.replay
+        if self.sim.seed == replay.seed and self.sim.frame <= len(replay):
+            del replay.masks[self.sim.frame:] # Rewound within this run: the replay follows the new branch
+            self.replay_saved = False
+        else:
+            # A different run whose earlier inputs are unknown, so it cannot be replayed
+            self.replay_recorder = ReplayRecorder.for_simulation(self.sim)
+            self.replay_saved = True
+
     def _update_stars(self):
-        for i in range(len(self.stars)):
-            star = self.stars[i]
-            star[1] += star[2] * self.speed_multiplier # Consider speed_multiplier for stars too
-            if star[1] > self.settings.HEIGHT:
-                self.stars[i] = [
-                    random.randint(0, self.settings.WIDTH),
-                    random.randint(-20, -5), # Respawn off-screen top
-                    random.randint(
-                        self.settings.STAR_SPEED_MIN, self.settings.STAR_SPEED_MAX
-                    ),
-                    random.choice(self.settings.STAR_COLORS),
-                    random.randint(
-                        self.settings.STAR_SIZE_MIN, self.settings.STAR_SIZE_MAX
-                    ),
-                ]
+        # Consider speed_multiplier for stars too
+        self.starfield.update(self.sim.speed_multiplier * self.sim.time_scale)
 
     def _draw_stars(self):
-        for star_data in self.stars:
-            pygame.draw.rect(
-                self.screen,
-                star_data[3], # color
-                (star_data[0], star_data[1], star_data[4], star_data[4]), # x, y, size, size
-            )
+        self.starfield.draw(self.screen)
 
     def update_score(self):
         # Called when game over or potentially at other points if needed
-        update_high_scores(self.username, self.score)
+        update_high_scores(self.username, self.sim.score) # In memory now; written to disk in the background
         self.high_score = get_high_score_value() # Refresh high score display
 
-    @staticmethod
-    def ai_decide_move(player, obstacles_group):
-        # This is a very basic AI, likely not used if ai_mode is False
-        if not obstacles_group:
-            return 0 # No action
-        closest = None
-        min_dist = float("inf")
-        for obs in obstacles_group:
-            dist = abs(obs.rect.centerx - player.rect.x) + abs(
-                obs.rect.centery - player.rect.y
-            ) # Simple Manhattan distance
-            if dist < min_dist:
-                min_dist = dist
-                closest = obs
-        if not closest:
-            return 0
-            dx = 0 # Horizontal movement direction (-1 left, 1 right)
-            dy = 0 # Vertical movement direction (-1 up, 1 down)
-        # Determine direction towards/away from obstacle (this logic seems to be for avoidance)
-        if player.rect.x < closest.rect.centerx:
-            dx = -1 # Obstacle is to the right, consider moving left
-        elif player.rect.x > closest.rect.centerx:
-            dx = 1  # Obstacle is to the left, consider moving right
-
-        if player.rect.y < closest.rect.centery:
-            dy = -1 # Obstacle is below, consider moving up
-        elif player.rect.y > closest.rect.centery:
-            dy = 1  # Obstacle is above, consider moving down
-
-        # Prioritize dominant axis for avoidance (simplified)
-        if abs(player.rect.x - closest.rect.centerx) > abs(
-            player.rect.y - closest.rect.centery
-        ): # Horizontal distance is greater
-            return 1 if dx > 0 else 2 if dx < 0 else 0 # 1 for right, 2 for left
-        else: # Vertical distance is greater or equal
-            return 3 if dy < 0 else 4 if dy > 0 else 0 # 3 for up, 4 for down
-
-
     def run_instructions_loop(self):
         # This loop is usually called from main_menu when ACTION_SHOW_INSTRUCTIONS is returned
         self.current_state = self.STATE_INSTRUCTIONS # Set state
         instructions_running = True
+        renderer = (
+            DirtyRectRenderer(self.screen, self.settings.BACKGROUND_COLOR)
+            if self.settings.DIRTY_RECT_RENDERING
+            else None
+        )
         # The back button rect is now managed by render_instructions_screen
         # self.instructions_back_button = pygame.Rect(...)
 
@@ -765,11 +715,21 @@ class Game:
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p or event.key == pygame.K_i:
                         instructions_running = False
 
-            self.screen.fill(self.settings.BACKGROUND_COLOR) # Clear screen
             self._update_stars() # Update star positions
-            self._draw_stars()   # Draw stars
-            self.render_instructions_screen(mouse_pos) # Draw instructions content and back button
-            pygame.display.flip() # Update display
+            if renderer is None:
+                self.screen.fill(self.settings.BACKGROUND_COLOR) # Clear screen
+                self._draw_stars()   # Draw stars
+                self.render_instructions_screen(mouse_pos) # Draw instructions content and back button
+                pygame.display.flip() # Update display
+            else:
+                back_hovered = bool(
+                    self.instructions_back_button and self.instructions_back_button.collidepoint(mouse_pos)
+                )
+                renderer.render(
+                    self.starfield,
+                    (back_hovered, self.locale.current_locale),
+                    lambda surface: self.render_instructions_screen(mouse_pos, surface=surface),
+                )
             self.clock.tick(30) # Cap FPS for instructions screen
 
         # When instructions_running becomes False, decide what to return.
@@ -780,23 +740,93 @@ class Game:
         return ACTION_BACK_TO_MAIN_MENU # Or a more context-aware return value if needed
 
     def game_loop(self):
-        # Main game loop
+        # Main game loop: the simulation advances in fixed steps of sim.dt_ms,
+        # rendering happens once per display frame, interpolated between steps
+        step_ms = self.sim.dt_ms
+        max_steps = self.settings.MAX_SIMULATION_STEPS_PER_FRAME
+        accumulator = 0.0
+        profiler = self.profiler
+        presented_state = None # Last static screen shown, see _static_screen_state
         while self.current_state not in [self.STATE_EXIT_TO_MENU, ACTION_QUIT_GAME]:
-            self.screen.fill(self.settings.BACKGROUND_COLOR) # Base background
+            frame_ms = self.clock.tick(self.settings.RENDER_FPS_CAP) # Cap FPS
+            phase_start = time.perf_counter()
             self.handle_events() # Process inputs
+            phase_start = profiler.lap("events", phase_start)
 
             if self.current_state == self.STATE_PLAYING:
-                self.update_game_logic() # Update game objects and state
+                accumulator += frame_ms
+                steps = 0
+                while accumulator >= step_ms and self.current_state == self.STATE_PLAYING:
+                    if steps == max_steps:
+                        # Too far behind: drop the backlog rather than slow gameplay down
+                        accumulator = 0.0
+                        break
+                    self.update_game_logic() # Update game objects and state
+                    accumulator -= step_ms
+                    steps += 1
+                self.render_alpha = min(1.0, accumulator / step_ms)
+                presented_state = None
+            else:
+                accumulator = 0.0
+                self.render_alpha = 1.0
+            phase_start = profiler.lap("update", phase_start)
+
+            if self.current_state != self.STATE_PLAYING and self.settings.DIRTY_RECT_RENDERING:
+                # Pause, game over and dialogs are static: skip unchanged frames entirely
+                state = self._static_screen_state()
+                if state == presented_state:
+                    profiler.end_frame(self.entity_counts())
+                    continue
+                presented_state = state
 
+            self.screen.fill(self.settings.BACKGROUND_COLOR) # Base background
             self.render_game() # Draw everything
+            profiler.draw(self.screen) # Profiler overlay, if toggled on
+            phase_start = profiler.lap("render", phase_start)
             pygame.display.flip() # Show the new frame
-            self.clock.tick(60) # Cap FPS
+            profiler.lap("flip", phase_start)
+            profiler.end_frame(self.entity_counts())
+
+        self.save_replay() # Keep the replay of runs abandoned before game over, too
 
         # Loop ended, determine why
         if self.current_state == self.STATE_EXIT_TO_MENU:
             return ACTION_BACK_TO_MAIN_MENU # Signal to go back to main menu
         return ACTION_QUIT_GAME # Default to quit game if not explicitly exiting to menu
 
+    def _static_screen_state(self):
+        """Everything a non-playing frame depends on; while it is unchanged, the frame is not redrawn."""
+        mouse_pos = pygame.mouse.get_pos()
+        buttons = (
+            self.pause_resume_button,
+            self.pause_instructions_button,
+            self.pause_restart_button,
+            self.pause_main_menu_button,
+            self.instructions_back_button,
+            self.game_over_restart_button,
+            self.game_over_main_menu_button,
+            self.confirm_quit_yes_button,
+            self.confirm_quit_no_button,
+        )
+        return (
+            self.current_state,
+            self.quit_context_message,
+            self.locale.current_locale,
+            tuple(bool(button and button.collidepoint(mouse_pos)) for button in buttons),
+            self.high_score,
+            get_high_score_version(),
+            self.profiler.overlay_visible and self.profiler.frame, # A visible overlay keeps updating
+        )
+
+    def entity_counts(self):
+        """Live entity counts, in the order of profiler.COUNTS."""
+        return (
+            len(self.sim.obstacles),
+            len(self.sim.particles),
+            len(self.sim.companion_bullets),
+            len(self.sim.powerups),
+        )
+
     def handle_events(self):
         keys = pygame.key.get_pressed()
         mouse_pos = pygame.mouse.get_pos()
@@ -903,6 +933,20 @@ class Game:
                         self.current_state = self.previous_state_on_quit_request
 
             # --- Keyboard Shortcuts ---
+            if e.type == pygame.KEYDOWN and e.key == pygame.K_F3: # Profiler overlay, in any state
+                self.profiler.toggle_overlay()
+            snapshot_hotkeys = (
+                getattr(self.settings, "DEBUG_SNAPSHOT_HOTKEYS", False)
+                and self.current_state in (self.STATE_PLAYING, self.STATE_PAUSED)
+                and not self.sim.game_over # The score is already submitted; never rewind past that
+            )
+            if snapshot_hotkeys and e.type == pygame.KEYDOWN and e.key == pygame.K_F5: # Checkpoint the run
+                self.checkpoint = self.take_snapshot()
+            if snapshot_hotkeys and e.type == pygame.KEYDOWN and e.key == pygame.K_F9 and self.checkpoint:
+                # Back to the checkpoint, paused so the player can get ready
+                self.restore_snapshot(self.checkpoint)
+                self.current_state = self.STATE_PAUSED
+                continue
             if e.type == pygame.KEYDOWN:
                 if self.current_state == self.STATE_PLAYING:
                     if e.key == pygame.K_p:
@@ -953,237 +997,98 @@ class Game:
 
 
         # --- Player Movement Call (Keyboard and Touch) ---
+        # Applied by the simulation on its next step, so it can be recorded for replays
         if not self.ai_mode and self.current_state == self.STATE_PLAYING:
-            self.player.move(keys, self.current_touch_pos)
-        elif not self.ai_mode : # If not playing, ensure player doesn't move via stale touch_pos
-             self.player.move(keys, None) # Pass None for touch if not in playing state
+            self.input_mask = self.sim.player.read_input(keys, self.current_touch_pos)
+        else: # If not playing, ensure player doesn't move via stale input
+            self.input_mask = 0
 
     def update_game_logic(self):
-        now = pygame.time.get_ticks() # Current time
-        if self.ai_mode:
-            # AI logic would go here, potentially calling self.player.move()
-            pass # Placeholder
-        self._update_stars() # Move stars
-        self.timers.spawn_obstacle += 1 # Increment obstacle spawn timer
-
-        # Dynamic obstacle spawn interval based on score
-        current_spawn_interval = (
-            self.settings.BASE_OBSTACLE_SPAWN_INTERVAL
+        """Runs exactly one fixed simulation step."""
+        if self.autopilot is not None:
+            self.input_mask = self.autopilot.decide(self.sim)
+            self.profiler.add("ai", self.autopilot.last_s)
+        self._update_stars() # Move stars (render-only, so they live outside the simulation)
+        self._capture_previous_positions()
+        self.replay_recorder.record(self.input_mask)
+        self.sim.step(self.input_mask)
+
+        if self.sim.game_over and self.current_state == self.STATE_PLAYING:
+            self.current_state = self.STATE_GAME_OVER
+            self.update_score() # Save score on game over
+            self.save_replay()
+
+    def _exact_topleft(self, sprite, group=None):
+        # Authoritative float position; Rects hold it rounded to whole pixels
+        player = self.sim.player
+        if group is not None:
+            return group.position(sprite)
+        if sprite is player:
+            return player.x, player.y
+        # The companion sits at a fixed pixel offset from the player's Rect
+        return (
+            player.x + sprite.rect.x - player.rect.x,
+            player.y + sprite.rect.y - player.rect.y,
         )
-        if self.settings.SCORE_TO_REACH_MIN_INTERVAL > 0: # Avoid division by zero if not set
-            if self.score >= self.settings.SCORE_TO_REACH_MIN_INTERVAL:
-                current_spawn_interval = (
-                    self.settings.MIN_OBSTACLE_SPAWN_INTERVAL
-                )
-            else:
-                # Linearly interpolate spawn interval
-                progress = (
-                    self.score / self.settings.SCORE_TO_REACH_MIN_INTERVAL
-                )
-                interval_reduction = (
-                    self.settings.BASE_OBSTACLE_SPAWN_INTERVAL
-                    - self.settings.MIN_OBSTACLE_SPAWN_INTERVAL
-                ) * progress
-                current_spawn_interval = (
-                    self.settings.BASE_OBSTACLE_SPAWN_INTERVAL - interval_reduction
-                )
-        current_spawn_interval = max(
-            self.settings.MIN_OBSTACLE_SPAWN_INTERVAL, int(current_spawn_interval)
-        ) # Ensure it doesn't go below min
-
-        # Spawn new obstacle if timer exceeds interval
-        if self.timers.spawn_obstacle > current_spawn_interval:
-            self.timers.spawn_obstacle = 0 # Reset timer
-            new_obstacle = None
-            # Chance to spawn a splittable obstacle
-            if random.random() < self.settings.SPLITTABLE_OBSTACLE_CHANCE:
-                new_obstacle = Obstacle(
-                    self.obstacle_speed, 1, True, 2, game_settings=self.settings
-                )
-            else:
-                new_obstacle = Obstacle(
-                    self.obstacle_speed, 1, False, game_settings=self.settings
-                )
-            if new_obstacle:
-                self.obstacles.add(new_obstacle)
-
-            self.score += 1 # Increment score for surviving longer / spawning obstacles
-
-            # Increase obstacle speed based on score milestones
-            if (
-                self.score > 0
-                and self.score % self.settings.OBSTACLE_SPEED_INCREASE_INTERVAL == 0
-                and self.obstacle_speed < self.settings.MAX_OBSTACLE_SPEED
-            ):
-                # Ensure speed increases only once per milestone
-                if (self.score // self.settings.OBSTACLE_SPEED_INCREASE_INTERVAL) > (
-                    (self.score - 1) // self.settings.OBSTACLE_SPEED_INCREASE_INTERVAL
-                ):
-                    self.obstacle_speed = min(
-                        self.obstacle_speed
-                        + self.settings.OBSTACLE_SPEED_INCREASE_AMOUNT,
-                        self.settings.MAX_OBSTACLE_SPEED,
-                    )
-
-        self.update_powerups() # Handle powerup spawning
-        self.update_effects(now) # Update durations of active effects (shrink, slowmo)
-
-        # Companion (turret) logic
-        if self.companion:
-            if now < self.timers.companion_active_end_tick: # If companion is active
-                new_bullets = self.companion.update(self.player.rect) # Update companion, may shoot
-                if new_bullets:
-                    self.companion_bullets.add(new_bullets)
-            else:
-                self.companion = None # Companion duration expired
-
-        self.companion_bullets.update() # Move companion bullets
-        self.obstacles.update(self.speed_multiplier) # Move obstacles (affected by slowmo)
-        self.powerups.update() # Move powerups
-        self.particles.update() # Update explosion particles
-
-        self.check_collisions(now) # Handle collisions
-
-    def update_effects(self, now):
-        # Check and apply Shrink effect
-        is_shrink_active = now < self.timers.shrink_effect_end_tick
-        # Check and apply SlowMo effect
-        is_slowmo_active = now < self.timers.slowmo_effect_end_tick
 
-        new_width = 30 if is_shrink_active else self.player.original_width
-        new_height = 15 if is_shrink_active else self.player.original_height
-
-        if self.player.width != new_width or self.player.height != new_height:
-            self.player.width = new_width
-            self.player.update_visuals() # Recreate player image if size changed
-            
-        # Game speed multiplier for SlowMo
-        self.speed_multiplier = 0.5 if is_slowmo_active else 1.0
+    def _capture_previous_positions(self):
+        # Positions before the upcoming step, for interpolated rendering
+        player = self.sim.player
+        positions = {player: self._exact_topleft(player)}
+        if self.sim.companion:
+            positions[self.sim.companion] = self._exact_topleft(self.sim.companion)
+        for group in (self.sim.obstacles, self.sim.powerups, self.sim.companion_bullets):
+            for sprite in group:
+                positions[sprite] = group.position(sprite)
+        self._previous_positions = positions
+
+    def _interpolated_topleft(self, sprite, group=None):
+        x, y = self._exact_topleft(sprite, group)
+        previous = self._previous_positions.get(sprite)
+        if previous is None or self.render_alpha >= 1.0:
+            return x, y
+        alpha = self.render_alpha
+        return (
+            previous[0] + (x - previous[0]) * alpha,
+            previous[1] + (y - previous[1]) * alpha,
+        )
 
-        if self.effects.pickup_message and now >= self.timers.pickup_message_end_tick:
-            self.effects.pickup_message = ""
+    def _draw_interpolated(self, group):
+        blit = self.screen.blit
+        for sprite in group:
+            blit(sprite.image, self._interpolated_topleft(sprite, group))
 
-    def check_collisions(self, now):
-        # Player vs Obstacles
-        collided_obs_player = pygame.sprite.spritecollide(
-            self.player, self.obstacles, False # False: do not kill obstacles yet
-        )
-        if collided_obs_player:
-            is_player_invincible = now < self.timers.player_invincible_end_tick # Temp invincibility after hit
-            if not is_player_invincible:
-                for obs in collided_obs_player: # Process each colliding obstacle
-                    if self.effects.shield: # If shield is active
-                        self.effects.shield = False # Shield breaks
-                        self._create_explosion(obs.rect.center, obs.color)
-                        obs.kill() # Destroy obstacle
-                        self.effects.pickup_message = self.locale.get_text("shield_lost")
-                        self.timers.pickup_message_end_tick = (
-                            now + self.settings.PICKUP_MESSAGE_DURATION_MS
-                        )
-                    else: # No shield, player takes a hit
-                        self.lives -= 1
-                        self._create_explosion(obs.rect.center, obs.color)
-                        obs.kill()
-                        if self.lives <= 0:
-                            self.current_state = self.STATE_GAME_OVER
-                            self.update_score() # Save score on game over
-                            break # Exit collision check loop for this frame
-                        else:
-                            # Grant temporary invincibility
-                            self.timers.player_invincible_end_tick = (
-                                now + self.settings.PLAYER_INVINCIBILITY_DURATION_MS
-                            )
-                            self.effects.pickup_message = self.locale.get_text("life_lost", self.lives)
-                            self.timers.pickup_message_end_tick = (
-                                now + self.settings.PICKUP_MESSAGE_DURATION_MS
-                            )
-            elif collided_obs_player: # Player is invincible but still collides
-                 for obs in collided_obs_player: # Destroy obstacle without penalty
-                    self._create_explosion(obs.rect.center, obs.color)
-                    obs.kill()
-
-        # Companion Bullets vs Obstacles
-        bullet_hits = pygame.sprite.groupcollide(
-            self.companion_bullets, self.obstacles, True, False # True: kill bullet, False: don't kill obstacle yet
-        )
-        for bullet, hit_obs_list in bullet_hits.items():
-            for obs in hit_obs_list:
-                self.score += 1 # Score for turret kills
-                self._create_explosion(obs.rect.center, obs.color)
-                obs.kill() # Destroy obstacle hit by bullet
-
-        # Player vs PowerUps
-        collided_powerups_player = pygame.sprite.spritecollide(
-            self.player, self.powerups, True # True: kill (collect) powerup
-        )
-        for p_up in collided_powerups_player:
-            self.handle_powerup_pickup(p_up, now)
-
-    def update_powerups(self):
-        # Spawn powerups periodically
-        self.timers.spawn_powerup += 1
-        if self.timers.spawn_powerup > self.settings.POWERUP_SPAWN_INTERVAL:
-            self.powerups.add(PowerUp(game_settings=self.settings)) # Add a new powerup
-            self.timers.spawn_powerup = 0 # Reset spawn timer
-
-    def handle_powerup_pickup(self, powerup, current_tick):
-        # Set duration for pickup message display
-        self.timers.pickup_message_end_tick = (
-            current_tick + self.settings.PICKUP_MESSAGE_DURATION_MS
+    def save_replay(self):
+        """Writes the run's replay to replay_path (once), if one was requested."""
+        if not self.replay_path or self.replay_saved:
+            return
+        replay = self.replay_recorder.finish(self.sim.score)
+        try:
+            replay.save(self.replay_path)
+            self.replay_saved = True
+            print(f"Replay saved to {self.replay_path} ({len(replay)} frames)")
+        except OSError as e:
+            print(f"Error saving replay to {self.replay_path}: {e}")
+
+    def render_instructions_screen(self, mouse_pos=None, back_button_override_rect=None, surface=None):
+        surface = surface or self.screen # Dirty-rect mode draws into its UI layer instead
+        override_key = tuple(back_button_override_rect) if back_button_override_rect else None
+        overlay = self.overlays.get(
+            ("instructions", self.locale.current_locale, override_key),
+            lambda: self._build_instructions_overlay(back_button_override_rect),
         )
-        if powerup.type == "shield":
-            self.effects.shield = True
-            self.effects.pickup_message = self.locale.get_text("shield_activated")
-        elif powerup.type == "slowmo":
-            self.timers.slowmo_effect_end_tick = (
-                current_tick + self.settings.SLOWMO_DURATION_MS
-            )
-            self.effects.pickup_message = self.locale.get_text("slow_motion")
-        elif powerup.type == "bomb":
-            self.effects.pickup_message = self.locale.get_text("kaboom")
-            newly_split_obstacles = []
-            for obs in list(self.obstacles.sprites()): # Iterate over a copy
-                self._create_explosion(
-                    obs.rect.center,
-                    obs.color,
-                    num_particles=self.settings.PARTICLES_PER_OBSTACLE_EXPLOSION // 2, # Fewer particles for bomb
-                )
-                # If obstacle can split, get its pieces
-                if (
-                    hasattr(obs, "can_split")
-                    and obs.can_split
-                    and hasattr(obs, "get_split_pieces") # Ensure method exists
-                ):
-                    pieces = obs.get_split_pieces()
-                    newly_split_obstacles.extend(pieces)
-                obs.kill() # Destroy original obstacle
-            self.obstacles.add(newly_split_obstacles) # Add any split pieces
-        elif powerup.type == "shrink":
-            self.timers.shrink_effect_end_tick = (
-                current_tick + self.settings.SHRINK_DURATION_MS
-            )
-            self.effects.pickup_message = self.locale.get_text("shrink_activated")
-        elif powerup.type == "extralife":
-            self.lives += 1
-            self.effects.pickup_message = self.locale.get_text("extra_life", self.lives)
-        elif powerup.type == "turret":
-            self.companion = Companion(self.player.rect, game_settings=self.settings)
-            self.timers.companion_active_end_tick = (
-                current_tick + self.settings.COMPANION_DURATION_MS
-            )
-            self.effects.pickup_message = self.locale.get_text("turret_activated")
-            
-    def render_instructions_screen(self, mouse_pos=None, back_button_override_rect=None):
+        self.instructions_back_button = overlay.rect("back") # Store for event handling
+        overlay.draw(surface, mouse_pos)
+
+    def _build_instructions_overlay(self, back_button_override_rect=None):
         # Semi-transparent overlay for instructions
-        overlay = pygame.Surface((self.settings.WIDTH, self.settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((15, 15, 35, 230)) # RGBA, A for alpha
-        self.screen.blit(overlay, (0, 0))
+        builder = OverlayBuilder((self.settings.WIDTH, self.settings.HEIGHT), (15, 15, 35, 230))
 
         y_offset = 60 # Initial Y position for drawing
-        title_surf = self.large_font.render(
-            self.locale.get_text("instructions"), True, self.settings.MENU_TITLE_COLOR
+        title_surf = render_text(
+            self.large_font, self.locale.get_text("instructions"), True, self.settings.MENU_TITLE_COLOR
         )
-        self.screen.blit(
+        builder.blit(
             title_surf,
             (self.settings.WIDTH // 2 - title_surf.get_width() // 2, y_offset),
         )
@@ -1238,12 +1143,12 @@ class Game:
 
             for line_text in lines:
                 if not line_text: continue
-                text_surf = font_to_use.render(line_text, True, text_color)
+                text_surf = render_text(font_to_use, line_text, True, text_color)
                 text_x_position = instructions_content_x
                 if is_title: # Center titles within the content area
                      text_x_position = instructions_content_x + (instructions_content_width - text_surf.get_width()) // 2
 
-                self.screen.blit(text_surf, (text_x_position, current_y_for_text))
+                builder.blit(text_surf, (text_x_position, current_y_for_text))
                 current_y_for_text += text_surf.get_height() + (line_spacing // 2)
             
             if is_title:
@@ -1262,26 +1167,22 @@ class Game:
                 self.settings.BUTTON_HEIGHT,
             )
         )
-        self.instructions_back_button = cbbr # Store for event handling
-        
-        bc = self.settings.BUTTON_COLOR_NORMAL # Default button color
-        if mouse_pos and cbbr.collidepoint(mouse_pos): # Hover effect
-            bc = self.settings.BUTTON_COLOR_HOVER
-        pygame.draw.rect(self.screen, bc, cbbr, border_radius=10)
-        draw_text_centered(
-            self.screen,
-            self.locale.get_text("back_button"), # Text for back button
-            self.medium_font,
-            self.settings.BUTTON_TEXT_COLOR,
-            cbbr,
-        )
+        builder.button("back", cbbr, self.locale.get_text("back_button"), self.medium_font, self.settings)
+        return builder.build()
 
 
     def render_confirm_quit_screen(self, mouse_pos=None):
+        overlay = self.overlays.get(
+            ("confirm_quit", self.locale.current_locale, self.quit_context_message),
+            self._build_confirm_quit_overlay,
+        )
+        self.confirm_quit_yes_button = overlay.rect("yes")
+        self.confirm_quit_no_button = overlay.rect("no")
+        overlay.draw(self.screen, mouse_pos)
+
+    def _build_confirm_quit_overlay(self):
         # Overlay for confirm quit dialog
-        overlay = pygame.Surface((self.settings.WIDTH, self.settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((10, 10, 20, 230)) # Dark, semi-transparent
-        self.screen.blit(overlay, (0, 0))
+        builder = OverlayBuilder((self.settings.WIDTH, self.settings.HEIGHT), (10, 10, 20, 230)) # Dark, semi-transparent
 
         # Dialog box
         dialog_width = self.settings.WIDTH * 0.7
@@ -1290,9 +1191,9 @@ class Game:
         dialog_y = self.settings.HEIGHT // 2 - dialog_height // 2
         dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
 
-        pygame.draw.rect(self.screen, (30, 30, 50), dialog_rect, border_radius=15) # Dialog background
+        pygame.draw.rect(builder.surface, (30, 30, 50), dialog_rect, border_radius=15) # Dialog background
         pygame.draw.rect( # Dialog border
-            self.screen,
+            builder.surface,
             self.settings.MENU_TITLE_COLOR, # Use a distinct border color
             dialog_rect,
             3, # Border thickness
@@ -1300,19 +1201,19 @@ class Game:
         )
 
         # Title "Confirm Exit"
-        title_surf = self.large_font.render(
-            self.locale.get_text("confirm_exit"), True, self.settings.MENU_TEXT_COLOR
+        title_surf = render_text(
+            self.large_font, self.locale.get_text("confirm_exit"), True, self.settings.MENU_TEXT_COLOR
         )
-        self.screen.blit(
+        builder.blit(
             title_surf,
             (dialog_rect.centerx - title_surf.get_width() // 2, dialog_rect.top + 30),
         )
 
         # Context message (e.g., "Quit Game?", "Restart?")
-        query_surf = self.font.render(
-            self.quit_context_message, True, self.settings.MENU_SUBTEXT_COLOR
+        query_surf = render_text(
+            self.font, self.quit_context_message, True, self.settings.MENU_SUBTEXT_COLOR
         )
-        self.screen.blit(
+        builder.blit(
             query_surf,
             (dialog_rect.centerx - query_surf.get_width() // 2, dialog_rect.top + 90),
         )
@@ -1321,57 +1222,29 @@ class Game:
         button_w, button_h = 120, self.settings.BUTTON_HEIGHT
         gap = 30 # Gap between buttons
         total_buttons_width = button_w * 2 + gap
-        # Yes button rect
-        self.confirm_quit_yes_button = pygame.Rect(
-            dialog_rect.centerx - total_buttons_width // 2, # Position Yes button
-            dialog_rect.bottom - button_h - 40, # Y position from bottom of dialog
-            button_w,
-            button_h,
-        )
-        # No button rect
-        self.confirm_quit_no_button = pygame.Rect(
-            self.confirm_quit_yes_button.right + gap, # Position No button relative to Yes
-            self.confirm_quit_yes_button.top, # Same Y as Yes button
-            button_w,
-            button_h,
-        )
-
-        # Draw Yes button with hover
-        yes_color = (
-            self.settings.BUTTON_COLOR_HOVER
-            if mouse_pos and self.confirm_quit_yes_button.collidepoint(mouse_pos)
-            else self.settings.BUTTON_COLOR_NORMAL
-        )
-        pygame.draw.rect(
-            self.screen, yes_color, self.confirm_quit_yes_button, border_radius=10
-        )
-        draw_text_centered(
-            self.screen,
+        yes_rect = builder.button(
+            "yes",
+            (
+                dialog_rect.centerx - total_buttons_width // 2, # Position Yes button
+                dialog_rect.bottom - button_h - 40, # Y position from bottom of dialog
+                button_w,
+                button_h,
+            ),
             self.locale.get_text("yes_button"),
             self.medium_font,
-            self.settings.BUTTON_TEXT_COLOR,
-            self.confirm_quit_yes_button,
-        )
-
-        # Draw No button with hover
-        no_color = (
-            self.settings.BUTTON_COLOR_HOVER
-            if mouse_pos and self.confirm_quit_no_button.collidepoint(mouse_pos)
-            else self.settings.BUTTON_COLOR_NORMAL
-        )
-        pygame.draw.rect(
-            self.screen, no_color, self.confirm_quit_no_button, border_radius=10
+            self.settings,
         )
-        draw_text_centered(
-            self.screen,
+        builder.button(
+            "no",
+            (yes_rect.right + gap, yes_rect.top, button_w, button_h), # Same Y as Yes button
             self.locale.get_text("no_button"),
             self.medium_font,
-            self.settings.BUTTON_TEXT_COLOR,
-            self.confirm_quit_no_button,
+            self.settings,
         )
+        return builder.build()
 
     def render_game(self):
-        now = pygame.time.get_ticks() # Get current time for animations/timers
+        now = self.sim.now # Simulation clock, so timers freeze while paused
         self._draw_stars() # Draw background stars first
         mouse_pos = pygame.mouse.get_pos() # Get mouse position for UI hovers
 
@@ -1381,20 +1254,31 @@ class Game:
             or self.current_state == self.STATE_PAUSED # Still show game scene when paused
         ):
             # Player invincibility visual flicker
-            is_player_invincible_visual = now < self.timers.player_invincible_end_tick
+            is_player_invincible_visual = now < self.sim.timers.player_invincible_end_tick
             if is_player_invincible_visual and (now // 100) % 2 == 0: # Flicker effect
                 pass # Don't draw player to make it "blink"
             else:
-                self.player.draw(self.screen)
-
-            self.obstacles.draw(self.screen)
-            self.powerups.draw(self.screen)
-            if self.companion:
-                self.companion.draw(self.screen)
-            self.companion_bullets.draw(self.screen)
-            self.particles.draw(self.screen) # Draw explosion particles
+                player = self.sim.player
+                pygame.draw.rect(
+                    self.screen,
+                    player.color,
+                    pygame.Rect(self._interpolated_topleft(player), player.rect.size),
+                    border_radius=6,
+                )
 
+            # Sprites are drawn between their previous and current simulation
+            # positions, so motion stays smooth when rendering outpaces the simulation
+            self._draw_interpolated(self.sim.obstacles)
+            self._draw_interpolated(self.sim.powerups)
+            if self.sim.companion:
+                companion = self.sim.companion
+                self.screen.blit(companion.image, self._interpolated_topleft(companion))
+            self._draw_interpolated(self.sim.companion_bullets)
+            self.sim.particles.draw(self.screen) # Draw explosion particles
+
+        ui_start = time.perf_counter()
         self.render_ui(now) # Draw HUD elements (score, lives, timers)
+        self.profiler.add("ui", time.perf_counter() - ui_start)
 
         # Render overlay screens based on current state
         if self.current_state == self.STATE_PAUSED:
@@ -1409,19 +1293,19 @@ class Game:
     def render_ui(self, now):
         # Player and Score Info
         self.screen.blit(
-            self.font.render(self.locale.get_text("player_score", self.username), True, settings.BRIGHT_WHITE),
+            render_text(self.font, self.locale.get_text("player_score", self.username), True, settings.BRIGHT_WHITE),
             (10, 10),
         )
         self.screen.blit(
-            self.font.render(self.locale.get_text("score", self.score), True, settings.BRIGHT_WHITE), (10, 40)
+            render_text(self.font, self.locale.get_text("score", self.sim.score), True, settings.BRIGHT_WHITE), (10, 40)
         )
         self.screen.blit(
-            self.font.render(self.locale.get_text("lives", self.lives), True, settings.BRIGHT_WHITE), (10, 70)
+            render_text(self.font, self.locale.get_text("lives", self.sim.lives), True, settings.BRIGHT_WHITE), (10, 70)
         )
 
         # High Score
-        hs_text_surf = self.font.render(
-            self.locale.get_text("high_score", self.high_score), True, settings.BRIGHT_WHITE
+        hs_text_surf = render_text(
+            self.font, self.locale.get_text("high_score", self.high_score), True, settings.BRIGHT_WHITE
         )
         self.screen.blit(
             hs_text_surf, (self.settings.WIDTH - hs_text_surf.get_width() - 10, 10)
@@ -1434,13 +1318,13 @@ class Game:
         timer_spacing = self.settings.UI_TIMER_BAR_HEIGHT + 10 # Vertical spacing between timers
         
         # Turret Timer Bar
-        if self.companion and now < self.timers.companion_active_end_tick:
-            time_left = self.timers.companion_active_end_tick - now
+        if self.sim.companion and now < self.sim.timers.companion_active_end_tick:
+            time_left = self.sim.timers.companion_active_end_tick - now
             percentage_left = max(
                 0, time_left / self.settings.COMPANION_DURATION_MS # Ensure not negative
             )
-            turret_label_surf = self.small_font.render(
-                self.locale.get_text("turret"), True, self.settings.UI_TURRET_TIMER_COLOR
+            turret_label_surf = render_text(
+                self.small_font, self.locale.get_text("turret"), True, self.settings.UI_TURRET_TIMER_COLOR
             )
             label_y = ( # Center label vertically with the bar
                 ui_timer_y_current
@@ -1482,13 +1366,13 @@ class Game:
                 self.settings.UI_TIMER_BAR_HEIGHT + timer_spacing
             )
         # SlowMo Timer Bar
-        if now < self.timers.slowmo_effect_end_tick:
-            time_left = self.timers.slowmo_effect_end_tick - now
+        if now < self.sim.timers.slowmo_effect_end_tick:
+            time_left = self.sim.timers.slowmo_effect_end_tick - now
             percentage_left = max(
                 0, time_left / self.settings.SLOWMO_DURATION_MS # Ensure not negative
             )
-            slowmo_label_surf = self.small_font.render(
-                self.locale.get_text("slowmo"), True, self.settings.UI_SLOWMO_TIMER_COLOR
+            slowmo_label_surf = render_text(
+                self.small_font, self.locale.get_text("slowmo"), True, self.settings.UI_SLOWMO_TIMER_COLOR
             )
             label_y = ( # Center label vertically with the bar
                 ui_timer_y_current
@@ -1529,13 +1413,13 @@ class Game:
             ui_timer_y_current += (
                 self.settings.UI_TIMER_BAR_HEIGHT + timer_spacing
             )
-        if now < self.timers.shrink_effect_end_tick:
-            time_left = self.timers.shrink_effect_end_tick - now
+        if now < self.sim.timers.shrink_effect_end_tick:
+            time_left = self.sim.timers.shrink_effect_end_tick - now
             percentage_left = max(
                 0, time_left / self.settings.SHRINK_DURATION_MS
             )
-            shrink_label_surf = self.small_font.render(
-                self.locale.get_text("shrink"), True, self.settings.UI_SHRINK_TIMER_COLOR
+            shrink_label_surf = render_text(
+                self.small_font, self.locale.get_text("shrink"), True, self.settings.UI_SHRINK_TIMER_COLOR
             )
             label_y = (
                 ui_timer_y_current
@@ -1575,9 +1459,9 @@ class Game:
             # ui_timer_y_current += timer_spacing # Only increment if another timer follows
 
         # Pickup Message (e.g., "Shield Activated!")
-        if self.effects.pickup_message and now < self.timers.pickup_message_end_tick:
-            msg_surface = self.font.render( # Use slightly larger font for messages
-                self.effects.pickup_message, True, self.settings.UI_PICKUP_MESSAGE_COLOR
+        if self.sim.effects.pickup_message and now < self.sim.timers.pickup_message_end_tick:
+            msg_surface = render_text( # Use slightly larger font for messages
+                self.font, self.sim.effects.pickup_message, True, self.settings.UI_PICKUP_MESSAGE_COLOR
             )
             self.screen.blit(
                 msg_surface,
@@ -1586,133 +1470,95 @@ class Game:
                     self.settings.HEIGHT - 60, # Position from bottom
                 ),
             )
-        elif self.effects.pickup_message: # Message expired
-            self.effects.pickup_message = ""
+        elif self.sim.effects.pickup_message: # Message expired
+            self.sim.effects.pickup_message = ""
 
         # Shield Visual Effect around player
-        if self.effects.shield:
+        if self.sim.effects.shield:
             pygame.draw.circle(
                 self.screen,
                 (0, 255, 255, 100),
-                self.player.rect.center,
-                int(self.player.rect.width * 0.75),
+                self.sim.player.rect.center,
+                int(self.sim.player.rect.width * 0.75),
                 3,
             )
 
     def show_pause_or_gameover_screen(self, message, mouse_pos=None):
+        is_game_over = message == self.locale.get_text("game_over")
+        key = (
+            "pause_or_game_over",
+            message,
+            self.locale.current_locale,
+            self.sim.score,
+            get_high_score_version() if is_game_over else None, # Game over lists the top 10
+        )
+        overlay = self.overlays.get(key, lambda: self._build_pause_or_gameover_overlay(message))
+
+        # Button rects for event handling
+        if is_game_over:
+            self.game_over_restart_button = overlay.rect("restart")
+            self.game_over_main_menu_button = overlay.rect("main_menu")
+        elif "resume" in overlay.buttons:
+            self.pause_resume_button = overlay.rect("resume")
+            self.pause_instructions_button = overlay.rect("instructions")
+            self.pause_restart_button = overlay.rect("restart")
+            self.pause_main_menu_button = overlay.rect("main_menu")
+        overlay.draw(self.screen, mouse_pos)
+
+    def _build_pause_or_gameover_overlay(self, message):
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.settings.WIDTH, self.settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180)) # RGBA, A for alpha
-        self.screen.blit(overlay, (0, 0))
+        builder = OverlayBuilder((self.settings.WIDTH, self.settings.HEIGHT), (0, 0, 0, 180))
 
         center_x = self.settings.WIDTH // 2
-        title_font = pygame.font.SysFont("consolas", 48)
+        title_font = get_font(48)
         button_font = self.medium_font # Font for buttons
 
         # Main Title (PAUSED or GAME OVER)
-        main_title_surf = title_font.render(message, True, settings.BRIGHT_WHITE)
-        self.screen.blit(
+        main_title_surf = render_text(title_font, message, True, settings.BRIGHT_WHITE)
+        builder.blit(
             main_title_surf, (center_x - main_title_surf.get_width() // 2, 80) # Y pos for title
         )
 
         # Score Display
-        score_surf = self.font.render( # Slightly smaller font for score
-            self.locale.get_text("your_score", self.score), True, settings.LIGHT_TEXT
+        score_surf = render_text( # Slightly smaller font for score
+            self.font, self.locale.get_text("your_score", self.sim.score), True, settings.LIGHT_TEXT
         )
-        self.screen.blit(score_surf, (center_x - score_surf.get_width() // 2, 160)) # Y pos for score
+        builder.blit(score_surf, (center_x - score_surf.get_width() // 2, 160)) # Y pos for score
 
         # Buttons start Y position
         y_button_start = 240
         button_y = y_button_start
         button_spacing_pause = self.settings.BUTTON_HEIGHT + 20 # Spacing between buttons
 
+        def add_button(name, label_key):
+            return builder.button(
+                name,
+                (
+                    center_x - self.settings.BUTTON_WIDTH // 2, button_y,
+                    self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
+                ),
+                self.locale.get_text(label_key),
+                button_font,
+                self.settings,
+            )
+
         # --- PAUSED State Buttons ---
         if message == self.locale.get_text("paused"):
-            # Resume Button
-            self.pause_resume_button = pygame.Rect(
-                center_x - self.settings.BUTTON_WIDTH // 2, button_y,
-                self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
-            )
-            color = ( # Hover effect
-                self.settings.BUTTON_COLOR_HOVER
-                if mouse_pos and self.pause_resume_button.collidepoint(mouse_pos)
-                else self.settings.BUTTON_COLOR_NORMAL
-            )
-            pygame.draw.rect(self.screen, color, self.pause_resume_button, border_radius=10)
-            draw_text_centered(self.screen, self.locale.get_text("resume"), button_font, self.settings.BUTTON_TEXT_COLOR, self.pause_resume_button)
+            add_button("resume", "resume")
             button_y += button_spacing_pause
-
-            # Instructions Button
-            self.pause_instructions_button = pygame.Rect(
-                center_x - self.settings.BUTTON_WIDTH // 2, button_y,
-                self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
-            )
-            color = (
-                self.settings.BUTTON_COLOR_HOVER
-                if mouse_pos and self.pause_instructions_button.collidepoint(mouse_pos)
-                else self.settings.BUTTON_COLOR_NORMAL
-            )
-            pygame.draw.rect(self.screen, color, self.pause_instructions_button, border_radius=10)
-            draw_text_centered(self.screen, self.locale.get_text("instructions_pause"), button_font, self.settings.BUTTON_TEXT_COLOR, self.pause_instructions_button)
+            add_button("instructions", "instructions_pause")
             button_y += button_spacing_pause
-
-            # Restart Button
-            self.pause_restart_button = pygame.Rect(
-                center_x - self.settings.BUTTON_WIDTH // 2, button_y,
-                self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
-            )
-            color = (
-                self.settings.BUTTON_COLOR_HOVER
-                if mouse_pos and self.pause_restart_button.collidepoint(mouse_pos)
-                else self.settings.BUTTON_COLOR_NORMAL
-            )
-            pygame.draw.rect(self.screen, color, self.pause_restart_button, border_radius=10)
-            draw_text_centered(self.screen, self.locale.get_text("restart_pause"), button_font, self.settings.BUTTON_TEXT_COLOR, self.pause_restart_button)
+            add_button("restart", "restart_pause")
             button_y += button_spacing_pause
-
-            # Main Menu Button
-            self.pause_main_menu_button = pygame.Rect(
-                center_x - self.settings.BUTTON_WIDTH // 2, button_y,
-                self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
-            )
-            color = (
-                self.settings.BUTTON_COLOR_HOVER
-                if mouse_pos and self.pause_main_menu_button.collidepoint(mouse_pos)
-                else self.settings.BUTTON_COLOR_NORMAL
-            )
-            pygame.draw.rect(self.screen, color, self.pause_main_menu_button, border_radius=10)
-            draw_text_centered(self.screen, self.locale.get_text("main_menu_pause"), button_font, self.settings.BUTTON_TEXT_COLOR, self.pause_main_menu_button)
-            # button_y += button_spacing_pause # No more buttons after this for paused state
+            add_button("main_menu", "main_menu_pause")
 
         # --- GAME OVER State Buttons ---
         elif message == self.locale.get_text("game_over"):
-            # Restart Button (Game Over)
-            self.game_over_restart_button = pygame.Rect( # Use specific attribute for game over
-                center_x - self.settings.BUTTON_WIDTH // 2, button_y,
-                self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
-            )
-            color = (
-                self.settings.BUTTON_COLOR_HOVER
-                if mouse_pos and self.game_over_restart_button.collidepoint(mouse_pos)
-                else self.settings.BUTTON_COLOR_NORMAL
-            )
-            pygame.draw.rect(self.screen, color, self.game_over_restart_button, border_radius=10)
-            draw_text_centered(self.screen, self.locale.get_text("restart_pause"), button_font, self.settings.BUTTON_TEXT_COLOR, self.game_over_restart_button)
+            add_button("restart", "restart_pause")
             button_y += button_spacing_pause
-
-            # Main Menu Button (Game Over)
-            self.game_over_main_menu_button = pygame.Rect( # Use specific attribute
-                center_x - self.settings.BUTTON_WIDTH // 2, button_y,
-                self.settings.BUTTON_WIDTH, self.settings.BUTTON_HEIGHT,
-            )
-            color = (
-                self.settings.BUTTON_COLOR_HOVER
-                if mouse_pos and self.game_over_main_menu_button.collidepoint(mouse_pos)
-                else self.settings.BUTTON_COLOR_NORMAL
-            )
-            pygame.draw.rect(self.screen, color, self.game_over_main_menu_button, border_radius=10)
-            draw_text_centered(self.screen, self.locale.get_text("main_menu_pause"), button_font, self.settings.BUTTON_TEXT_COLOR, self.game_over_main_menu_button)
+            add_button("main_menu", "main_menu_pause")
             button_y += button_spacing_pause # Move Y for high scores display
 
             # Display High Scores on Game Over screen
-            draw_high_scores(self.screen, self.small_font, y_start=button_y + 20) # Add some padding
\ No newline at end of file
+            draw_high_scores(builder.surface, self.small_font, y_start=button_y + 20) # Add some padding
+        return builder.build()
@@ -0,0 +1,119 @@
+from entity_pool import PooledGroup
+
+
+class KinematicGroup(PooledGroup):
+    """
+    PooledGroup that owns its members' motion. Each member's authoritative
+    top-left position is a float kept in the group's parallel lists, packed
+    into slots 0..len-1 (removal moves the last member into the freed slot);
+    its velocity, in pixels per 60 Hz step, is read once from
+    `sprite.velocity` when it joins. `update(scale)` advances every member
+    by `scale` steps and writes the positions into the members' Rects, which
+    round them to whole pixels and remain what collisions and drawing read.
+    Members whose top passes `max_top` or whose bottom passes above
+    `min_bottom` are killed.
+
+    The step is a list comprehension per axis plus one Rect write per
+    member, which costs about what the entities' own update() methods did.
+    NumPy arrays lose to it below a few dozen members, and obstacles rarely
+    number more than ten. The x axis is skipped while no member moves
+    sideways.
+
+    A member's position starts from its Rect when it joins; code that moves
+    a member afterwards must go through `set_position`.
+    """
+
+    def __init__(self, pool, max_top=None, min_bottom=None):
+        self.max_top = max_top
+        self.min_bottom = min_bottom
+        self._members = [] # Slot -> sprite
+        self._slots = {} # Sprite -> slot
+        self._x, self._y, self._vx, self._vy, self._height = [], [], [], [], []
+        self._sideways = 0 # Members with a non-zero vx
+        self.last_scale = 0.0 # Steps covered by the last update, for displacements
+        super().__init__(pool)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self._slots[sprite] = len(self._members)
+        self._members.append(sprite)
+        rect = sprite.rect
+        vx, vy = sprite.velocity
+        self._x.append(float(rect.x))
+        self._y.append(float(rect.y))
+        self._vx.append(vx)
+        self._vy.append(vy)
+        self._height.append(rect.height)
+        if vx:
+            self._sideways += 1
+
+    def remove_internal(self, sprite):
+        slot = self._slots.pop(sprite)
+        if self._vx[slot]:
+            self._sideways -= 1
+        last = len(self._members) - 1
+        columns = (self._members, self._x, self._y, self._vx, self._vy, self._height)
+        if slot != last:
+            moved = self._members[last]
+            self._slots[moved] = slot
+            for values in columns:
+                values[slot] = values[last]
+        for values in columns:
+            values.pop()
+        super().remove_internal(sprite)
+
+    def position(self, sprite):
+        """The member's exact top-left position."""
+        slot = self._slots[sprite]
+        return self._x[slot], self._y[slot]
+
+    def set_position(self, sprite, x, y):
+        slot = self._slots[sprite]
+        self._x[slot] = x
+        self._y[slot] = y
+        sprite.rect.topleft = (x, y)
+
+    def displacement(self, sprite):
+        """The member's (dx, dy) over the last update."""
+        slot = self._slots[sprite]
+        return self._vx[slot] * self.last_scale, self._vy[slot] * self.last_scale
+
+    def max_step(self):
+        """Largest distance along either axis any member moved in the last update."""
+        if not self._members:
+            return 0.0
+        fastest = max(map(abs, self._vy))
+        if self._sideways:
+            fastest = max(fastest, max(map(abs, self._vx)))
+        return fastest * abs(self.last_scale)
+
+    def update(self, scale=1.0):
+        """Moves every member by `scale` 60 Hz steps and syncs their Rects."""
+        self.last_scale = scale
+        members = self._members
+        if not members:
+            return
+        ys = [y + vy * scale for y, vy in zip(self._y, self._vy)]
+        self._y = ys
+        if self._sideways:
+            xs = [x + vx * scale for x, vx in zip(self._x, self._vx)]
+            self._x = xs
+            for sprite, x, y in zip(members, xs, ys):
+                sprite.rect.topleft = (x, y) # Rect rounds half away from zero
+        else:
+            for sprite, y in zip(members, ys):
+                sprite.rect.y = y
+
+        # Rounded top > max_top  <=>  y >= max_top + 0.5 (likewise for min_bottom)
+        doomed = []
+        if self.max_top is not None and max(ys) >= self.max_top + 0.5:
+            limit = self.max_top + 0.5
+            doomed = [sprite for sprite, y in zip(members, ys) if y >= limit]
+        if self.min_bottom is not None:
+            limit = self.min_bottom - 0.5
+            doomed += [
+                sprite for sprite, y, height in zip(members, ys, self._height)
+                if y + height <= limit
+            ]
+        for sprite in doomed:
+            sprite.kill()
@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -13,51 +14,118 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 class LocaleManager:
+    """
+    Translations are loaded on demand: constructing the manager (at import
+    time, as _LOCALE_MANAGER_GLOBAL) touches no files, and only the active
+    locale and the fallback locale are ever parsed. Switching locales merges
+    the fallback chain into one catalog of key -> text plus a bound
+    str.format per message, so get_text is a single lookup. Formatted results
+    are memoized too, since the HUD asks for the same "score"/"lives" strings
+    every frame until the numbers change.
+
+    The startup warmer compiles the catalog on a background thread while the
+    main thread may already be asking for text, so loading and compiling run
+    under one lock and publish their results only once complete: the merged
+    messages, their formatters and the memo are swapped in as a single tuple,
+    and a reader that finds no catalog yet waits for the load in flight
+    instead of seeing an empty one.
+    """
+
+    FALLBACK_LOCALE = 'en'
+    MAX_FORMATTED = 256 # Memoized (key, args) results kept before the memo is reset
+
     def __init__(self, default_locale='en', locale_dir='lang'):
         self.locale_dir = resource_path(locale_dir)
         self.current_locale = default_locale
-        self.translations = {}
-        self._load_locales()
-
-    def _load_locales(self):
-        self.translations = {}
-        if not os.path.exists(self.locale_dir):
-            print(f"Warning: Locale directory '{self.locale_dir}' not found.")
-            return
-
-        for filename in os.listdir(self.locale_dir):
-            if filename.endswith('.json'):
-                locale_code = filename.split('.')[0]
+        self.translations = {} # Locale code -> parsed JSON, filled as locales are needed
+        self._available = None # Locale codes found in locale_dir, listed on first use
+        self._catalog = None # (messages, formatters, formatted memo) for current_locale, built on first lookup
+        self.catalog_version = 0 # Increases whenever a new catalog is published
+        self._lock = threading.Lock()
+
+    def _available_locales(self):
+        available = self._available
+        if available is None: # Listing twice is harmless; the set is published whole
+            if not os.path.exists(self.locale_dir):
+                print(f"Warning: Locale directory '{self.locale_dir}' not found.")
+                available = set()
+            else:
+                available = {
+                    filename.split('.')[0]
+                    for filename in os.listdir(self.locale_dir)
+                    if filename.endswith('.json')
+                }
+            self._available = available
+        return available
+
+    def _load_locale(self, locale_code):
+        """Parses one translation file the first time it is needed. Caller holds _lock."""
+        translations = self.translations.get(locale_code)
+        if translations is None:
+            translations = {}
+            if locale_code in self._available_locales():
+                filename = f"{locale_code}.json"
                 filepath = os.path.join(self.locale_dir, filename)
                 try:
                     with open(filepath, 'r', encoding='utf-8') as f:
-                        self.translations[locale_code] = json.load(f)
+                        translations = json.load(f)
                 except json.JSONDecodeError as e:
                     print(f"Error loading translation file {filename}: {e}")
                 except Exception as e:
                     print(f"An unexpected error occurred loading {filename}: {e}")
+            self.translations[locale_code] = translations
+        return translations
 
-    def set_locale(self, locale_code):
-        if locale_code in self.translations:
+    def _compile(self, locale_code=None):
+        """Merges the fallback chain for a locale into one catalog and publishes it."""
+        with self._lock:
+            if locale_code is None:
+                if self._catalog is not None: # Another thread compiled while we waited
+                    return self._catalog
+                locale_code = self.current_locale
+            messages = dict(self._load_locale(self.FALLBACK_LOCALE))
+            messages.update(self._load_locale(locale_code))
+            formatters = {key: text.format for key, text in messages.items() if isinstance(text, str)}
             self.current_locale = locale_code
+            self._catalog = (messages, formatters, {})
+            self.catalog_version += 1
+            return self._catalog
+
+    def set_locale(self, locale_code):
+        if locale_code in self._available_locales():
+            self._compile(locale_code)
             print(f"Locale set to: {locale_code}")
         else:
             print(f"Warning: Locale '{locale_code}' not found. Keeping '{self.current_locale}'.")
 
     def get_text(self, key, *args):
+        catalog = self._catalog
+        if catalog is None:
+            catalog = self._compile()
+        messages, formatters, formatted = catalog
+        if not args:
+            text = messages.get(key)
+            return text if text is not None else f"MISSING_TRANSLATION:{key}"
+        memo_key = (key, args)
+        text = formatted.get(memo_key)
+        if text is not None:
+            return text
+        formatter = formatters.get(key)
+        if formatter is None:
+            return f"MISSING_TRANSLATION:{key}"
         try:
-            # Fallback to default locale if key not in current locale
-            text = self.translations.get(self.current_locale, {}).get(key)
-            if text is None:
-                text = self.translations.get('en', {}).get(key, f"MISSING_TRANSLATION:{key}")
-            return text.format(*args) if args else text
+            text = formatter(*args)
         except KeyError:
             return f"MISSING_KEY:{key}"
-        except Exception as e:
+        except Exception as e: # IndexError (too few positional arguments) and other format errors
             print(f"Error getting text for key '{key}': {e}")
             return f"ERROR:{key}"
+        if len(formatted) >= self.MAX_FORMATTED:
+            formatted.clear()
+        formatted[memo_key] = text
+        return text
 
     def get_available_locales(self):
-        return sorted(list(self.translations.keys()))
-    
-_LOCALE_MANAGER_GLOBAL = LocaleManager()
\ No newline at end of file
+        return sorted(self._available_locales())
+
+_LOCALE_MANAGER_GLOBAL = LocaleManager()
@@ -1,18 +1,16 @@
-import pygame
+# Imported first so its clock starts as close to process start as possible
+from startup import _STARTUP_PROFILER_GLOBAL, AssetWarmer
+
 import sys
 import os # Import os for resource_path
+import argparse
 
-from game import (
-    Game,
-    show_main_menu,
-    ACTION_QUIT_GAME,
-    ACTION_SHOW_INSTRUCTIONS,
-    ACTION_START_GAME,
-    ACTION_BACK_TO_MAIN_MENU,
-)
-from utils import WIDTH, HEIGHT
+import pygame
 import settings # Import settings to access DEFAULT_LANGUAGE and LOCALE_DIR
-from locale_manager import _LOCALE_MANAGER_GLOBAL
+from batch import DEFAULT_MAX_FRAMES, parse_override
+
+# Everything else (game, simulation, replay, ...) is imported by the mode
+# that needs it, so the window can open before the game modules load.
 
 # Add the resource_path function here (or import if it's in utils.py)
 def resource_path(relative_path):
@@ -23,26 +21,182 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Neon Dodge")
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="Step the simulation without a window as fast as possible",
+    )
+    parser.add_argument(
+        "--frames", type=int, default=None,
+        help="Number of frames to simulate in headless mode (default 100000), "
+        f"or the per-game cap in batch mode (default {DEFAULT_MAX_FRAMES})",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Seed for the gameplay RNG (random if omitted)",
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", default=None,
+        help="Record each played run as a replay file at PATH",
+    )
+    parser.add_argument(
+        "--replay", metavar="PATH", default=None,
+        help="Re-run a recorded replay headlessly (on the difficulty curve it was recorded with) and report the result",
+    )
+    parser.add_argument(
+        "--ai", action="store_true",
+        help="Let the autopilot play (interactive runs and headless mode)",
+    )
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Report the time spent in each startup stage up to the first menu frame",
+    )
+    parser.add_argument(
+        "--trace", metavar="PATH", default=None,
+        help="Append per-frame phase timings and entity counts to PATH (.csv or .jsonl)",
+    )
+    parser.add_argument(
+        "--batch", metavar="GAMES", type=int, default=None,
+        help="Play GAMES seeded autopilot games across a process pool and print a summary",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Worker processes for --batch (default: one per CPU core)",
+    )
+    parser.add_argument(
+        "--set", metavar="NAME=VALUE", dest="overrides", action="append", default=[],
+        help="Override a settings constant for --batch runs (repeatable)",
+    )
+    parser.add_argument(
+        "--curve", metavar="PATH", default=None,
+        help="Load the difficulty curve (spawn interval, speed, waves by score) from a JSON file",
+    )
+    parser.add_argument(
+        "--results", metavar="PATH", default=None,
+        help="Write per-game --batch results to PATH as CSV",
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.overrides = dict(parse_override(text) for text in args.overrides)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.curve:
+        from difficulty import DifficultyCurve, DifficultyCurveError
+
+        try:
+            DifficultyCurve.load(args.curve, settings) # Fail here rather than in a worker
+        except DifficultyCurveError as e:
+            parser.error(str(e))
+        settings.DIFFICULTY_CURVE_FILE = args.curve
+        args.overrides["DIFFICULTY_CURVE_FILE"] = args.curve
+    return args
+
+def main_replay(args):
+    from replay import Replay, ReplayError, play_replay
+    from difficulty import DifficultyCurveError
+
+    replay = Replay.load(args.replay)
+    if replay.curve_path and not args.curve:
+        settings.DIFFICULTY_CURVE_FILE = replay.curve_path # Play back on the curve it was recorded with
+    try:
+        sim = play_replay(replay)
+    except (ReplayError, DifficultyCurveError) as e:
+        sys.exit(f"Cannot replay {args.replay}: {e}")
+    status = "matches" if sim.score == replay.final_score else "DIFFERS FROM"
+    print(
+        f"Replayed {sim.frame}/{len(replay)} frames (seed {replay.seed}): "
+        f"score {sim.score} {status} recorded score {replay.final_score}"
+    )
+
+def main_headless(args):
+    from simulation import run_headless
+
+    stats = run_headless(args.frames or 100000, seed=args.seed, autopilot=args.ai)
+    print(
+        f"Simulated {stats['frames']} frames ({stats['games_played']} games, "
+        f"best score {stats['best_score']}) in {stats['elapsed_s']:.2f}s "
+        f"-> {stats['fps']:.0f} frames/s"
+    )
+    if "autopilot" in stats:
+        latency = stats["autopilot"]
+        print(
+            f"Autopilot decision latency: mean {latency['mean_ms']:.3f} ms, "
+            f"max {latency['max_ms']:.3f} ms over {latency['decisions']} decisions"
+        )
+
+def main_batch(args):
+    from batch import run_batch, format_summary, write_results_csv
+
+    results, summary = run_batch(
+        args.batch,
+        seed=args.seed,
+        workers=args.workers,
+        max_frames=args.frames or DEFAULT_MAX_FRAMES,
+        overrides=args.overrides,
+    )
+    if args.overrides:
+        print("Overrides: " + ", ".join(f"{name}={value!r}" for name, value in args.overrides.items()))
+    print(format_summary(summary))
+    if args.results:
+        write_results_csv(args.results, results)
+        print(f"Per-game results written to {args.results}")
+
 def main():
-    pygame.init()
+    args = parse_args()
+    if args.batch:
+        main_batch(args)
+        return
+    if args.replay:
+        main_replay(args)
+        return
+    if args.headless:
+        main_headless(args)
+        return
 
-    # --- Icon Setting ---
+    startup = _STARTUP_PROFILER_GLOBAL
+    startup.enabled = args.profile_startup
+    startup.record("imports", startup.since_start()) # Interpreter, pygame and settings
+    with startup.stage("pygame.init"):
+        pygame.init()
+
+    # Show the window right away; fonts, locale and scores load behind it
+    with startup.stage("window"):
+        screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+        pygame.display.set_caption("Neon Dodge")
+        screen.fill(settings.BACKGROUND_COLOR)
+        pygame.display.flip()
+        pygame.event.pump() # Let the window manager map the window now
+    AssetWarmer(startup).start()
+
+    # --- Icon Setting (after the window is up; SDL applies it to the open window) ---
     # Load the icon image using resource_path
     # Make sure 'assets/icon.png' is the correct path to your icon file
     # and that 'assets' is included in your PyInstaller --add-data
-    try:
-        icon_path = resource_path("assets/icon.jpg") # Assuming your icon is named icon.png inside assets
-        icon = pygame.image.load(icon_path)
-        pygame.display.set_icon(icon)
-    except pygame.error as e:
-        print(f"Error loading icon: {e}")
-        print(f"Attempted to load from: {icon_path}")
-    except FileNotFoundError:
-        print(f"Icon file not found at: {icon_path}")
+    with startup.stage("icon"):
+        try:
+            icon_path = resource_path("assets/icon.jpg") # Assuming your icon is named icon.png inside assets
+            icon = pygame.image.load(icon_path)
+            pygame.display.set_icon(icon)
+        except pygame.error as e:
+            print(f"Error loading icon: {e}")
+            print(f"Attempted to load from: {icon_path}")
+        except FileNotFoundError:
+            print(f"Icon file not found at: {icon_path}")
     # --- End Icon Setting ---
 
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Neon Dodge")
+    with startup.stage("import game"):
+        from game import (
+            Game,
+            show_main_menu,
+            ACTION_QUIT_GAME,
+            ACTION_SHOW_INSTRUCTIONS,
+            ACTION_START_GAME,
+        )
+        from profiler import _FRAME_PROFILER_GLOBAL
+
+    if args.trace:
+        _FRAME_PROFILER_GLOBAL.start_trace(args.trace)
 
     username = ""
     running_application = True
@@ -66,13 +220,14 @@ def main():
             print(f"Starting game with username: {username}")
 
             game_session = Game(
-                screen, username, ai_mode=False
+                screen, username, ai_mode=args.ai, seed=args.seed, replay_path=args.record
             )
             session_result = game_session.game_loop()
 
             if session_result == ACTION_QUIT_GAME:
                 running_application = False
 
+    _FRAME_PROFILER_GLOBAL.stop_trace()
     pygame.quit()
     sys.exit()
 
@@ -1,9 +1,15 @@
 import random
-import pygame
+from entity import Entity
+from sprite_atlas import _SPRITE_ATLAS_GLOBAL
 # import settings  # Removed direct import, settings will be passed
 
 
-class Obstacle(pygame.sprite.Sprite):
+class Obstacle(Entity):
+    __slots__ = (
+        "settings", "speed", "generation", "can_split", "num_splits", "effective_speed",
+        "style", # Shared (width, height, color) of the obstacle's variant
+    )
+
     BASE_WIDTH = (
         50  # Kept as class attributes for local reference, can be moved to settings
     )
@@ -11,6 +17,7 @@ class Obstacle(pygame.sprite.Sprite):
         20  # Kept as class attributes for local reference, can be moved to settings
     )
     # BASE_COLOR will now be an instance attribute based on settings
+    _styles = {} # (generation, base color) -> shared (width, height, color)
 
     def __init__(
         self,
@@ -20,8 +27,22 @@ class Obstacle(pygame.sprite.Sprite):
         num_splits=2,
         position=None,
         game_settings=None,  # Accept game_settings
+        rng=None,  # random.Random stream; defaults to the global random module
     ):
         super().__init__()
+        self.reinit(speed, generation, can_split, num_splits, position, game_settings, rng)
+
+    def reinit(
+        self,
+        speed,
+        generation=1,
+        can_split=False,
+        num_splits=2,
+        position=None,
+        game_settings=None,
+        rng=None,
+    ):
+        """(Re)initializes the obstacle in place; EntityPool calls this to recycle instances."""
         # Initialize settings with fallback if not provided
         if game_settings is None:
             import settings as default_settings # Fallback import
@@ -34,52 +55,16 @@ class Obstacle(pygame.sprite.Sprite):
         self.can_split = can_split if self.generation > 0 else False
         self.num_splits = num_splits
 
-        if self.generation == 1:
-            self.width = self.BASE_WIDTH
-            self.height = self.BASE_HEIGHT
-            self.color = self.settings.NEON_RED # Use settings color
-            self.effective_speed = self.speed
-        elif self.generation == 0:
-            self.width = int(self.BASE_WIDTH * 0.55)
-            self.height = int(self.BASE_HEIGHT * 0.7)
-            # Derive color from the base settings color, assuming NEON_RED is the base
-            base_red = self.settings.NEON_RED
-            self.color = (
-                max(0, base_red[0] - 70),
-                base_red[1],
-                base_red[2],
-            )
-            self.effective_speed = self.speed * 1.2
-        else:  # Fallback, though generation 1 and 0 are the primary types
-            self.width = self.BASE_WIDTH
-            self.height = self.BASE_HEIGHT
-            self.color = self.settings.NEON_RED # Use settings color
-            self.effective_speed = self.speed
-
-        self.image = pygame.Surface([self.width, self.height], pygame.SRCALPHA)
+        self.style = self.shared_style(self.generation, self.settings)
+        self.effective_speed = self.speed * 1.2 if self.generation == 0 else self.speed
 
         glow_color_val = 60
         if self.can_split and self.generation == 1:
             glow_color_val = 100
 
-        glow_color = (
-            min(255, self.color[0] + glow_color_val),
-            min(255, self.color[1] + glow_color_val),
-            min(255, self.color[2] + glow_color_val),
-        )
-
-        inset = min(2, self.width // 10, self.height // 10)
-        pygame.draw.rect(
-            self.image,
-            glow_color,
-            (0, 0, self.width, self.height),
-            border_radius=max(1, inset * 3),
-        )
-        pygame.draw.rect(
-            self.image,
-            self.color,
-            (inset, inset, self.width - inset * 2, self.height - inset * 2),
-            border_radius=max(1, inset * 2),
+        # Shared, pre-rendered surface for this (size, color, glow) variant
+        self.image = _SPRITE_ATLAS_GLOBAL.obstacle(
+            self.width, self.height, self.color, glow_color_val
         )
 
         self.rect = self.image.get_rect()
@@ -87,27 +72,59 @@ class Obstacle(pygame.sprite.Sprite):
         if position:
             self.rect.center = position
         else:
-            self.rect.x = random.randint(
+            self.rect.x = (rng or random).randint(
                 0, self.settings.WIDTH - self.width
             )  # Use settings.WIDTH
             self.rect.y = -self.height
 
-    def update(self, speed_multiplier=1):
-        self.rect.y += self.effective_speed * speed_multiplier
-        if self.rect.top > self.settings.HEIGHT:  # Use settings.HEIGHT
-            self.kill()
+    @property
+    def width(self):
+        return self.style[0]
+
+    @property
+    def height(self):
+        return self.style[1]
+
+    @property
+    def color(self):
+        return self.style[2]
+
+    @classmethod
+    def shared_style(cls, generation, game_settings):
+        """variant_style, memoized so every obstacle of a variant shares one tuple."""
+        key = (generation, game_settings.NEON_RED)
+        style = cls._styles.get(key)
+        if style is None:
+            style = cls._styles[key] = cls.variant_style(generation, game_settings)
+        return style
+
+    @classmethod
+    def variant_style(cls, generation, game_settings):
+        """Returns (width, height, color) for an obstacle of the given generation."""
+        if generation == 0:
+            # Derive color from the base settings color, assuming NEON_RED is the base
+            base_red = game_settings.NEON_RED
+            return (
+                int(cls.BASE_WIDTH * 0.55),
+                int(cls.BASE_HEIGHT * 0.7),
+                (max(0, base_red[0] - 70), base_red[1], base_red[2]),
+            )
+        # Generation 1, plus a fallback for any other generation
+        return cls.BASE_WIDTH, cls.BASE_HEIGHT, game_settings.NEON_RED # Use settings color
+
+    @property
+    def velocity(self):
+        # Pixels per 60 Hz step; the obstacles' KinematicGroup moves and culls them
+        return 0.0, self.effective_speed
 
-    def get_split_pieces(self):
+    def get_split_pieces(self, pool=None):
         if not self.can_split or self.generation <= 0 or self.num_splits != 2:
             return []
 
         new_pieces = []
+        create = pool.acquire if pool is not None else Obstacle # Recycle pooled obstacles if given
 
-        temp_small_piece = Obstacle(
-            speed=self.speed, generation=0, can_split=False, game_settings=self.settings
-        )  # Pass settings
-        small_piece_width = temp_small_piece.width
-        small_piece_height = temp_small_piece.height
+        small_piece_width, small_piece_height, _ = self.variant_style(0, self.settings)
 
         pos1_x = self.rect.centerx - (small_piece_width / 2) - 1
         pos1_y = self.rect.centery
@@ -115,7 +132,7 @@ class Obstacle(pygame.sprite.Sprite):
         pos2_x = self.rect.centerx + (small_piece_width / 2) + 1
         pos2_y = self.rect.centery
 
-        piece1 = Obstacle(
+        piece1 = create(
             speed=self.speed,
             generation=0,
             can_split=False,
@@ -124,7 +141,7 @@ class Obstacle(pygame.sprite.Sprite):
         )
         new_pieces.append(piece1)
 
-        piece2 = Obstacle(
+        piece2 = create(
             speed=self.speed,
             generation=0,
             can_split=False,
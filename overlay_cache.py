@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+import pygame
+from text_cache import render_text
+
+
+class Overlay:
+    """
+    A composited full-screen overlay (pause, game over, instructions, quit
+    dialog): its translucent backdrop, text and buttons in their normal state
+    live in one surface. Each button also keeps a pre-rendered hover variant,
+    so a frame costs one full blit plus at most one button-sized blit.
+    """
+
+    def __init__(self, surface, buttons):
+        self.surface = surface
+        self.buttons = buttons # name -> (rect, hover surface)
+
+    def rect(self, name):
+        return self.buttons[name][0]
+
+    def hovered(self, mouse_pos):
+        """Name of the button under mouse_pos, or None."""
+        if mouse_pos:
+            for name, (rect, _) in self.buttons.items():
+                if rect.collidepoint(mouse_pos):
+                    return name
+        return None
+
+    def draw(self, target, mouse_pos=None):
+        target.blit(self.surface, (0, 0))
+        name = self.hovered(mouse_pos)
+        if name is not None:
+            rect, hover_surface = self.buttons[name]
+            target.blit(hover_surface, rect)
+
+
+class OverlayBuilder:
+    """Draws an overlay once; see Overlay."""
+
+    def __init__(self, size, fill_color):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.surface.fill(fill_color)
+        self.buttons = {}
+
+    def blit(self, source, dest):
+        self.surface.blit(source, dest)
+
+    def button(self, name, rect, label, font, game_settings):
+        """Draws a normal-state button and pre-renders its hover variant."""
+        rect = pygame.Rect(rect)
+        label_surf = render_text(font, label, True, game_settings.BUTTON_TEXT_COLOR)
+        pygame.draw.rect(self.surface, game_settings.BUTTON_COLOR_NORMAL, rect, border_radius=10)
+        self.surface.blit(label_surf, label_surf.get_rect(center=rect.center))
+
+        hover_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        local_rect = hover_surface.get_rect()
+        pygame.draw.rect(hover_surface, game_settings.BUTTON_COLOR_HOVER, local_rect, border_radius=10)
+        hover_surface.blit(label_surf, label_surf.get_rect(center=local_rect.center))
+        self.buttons[name] = (rect, hover_surface)
+        return rect
+
+    def build(self):
+        return Overlay(self.surface, self.buttons)
+
+
+class OverlayCache:
+    """
+    Small LRU of built overlays. Keys must cover everything the overlay shows
+    (state, locale, score, prompt, ...), so a stale overlay is never reused.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.builds = 0
+
+    def get(self, key, build):
+        """Returns the overlay for key, calling build() to create it on a miss."""
+        overlay = self._entries.get(key)
+        if overlay is not None:
+            self._entries.move_to_end(key)
+            return overlay
+        overlay = build()
+        self.builds += 1
+        self._entries[key] = overlay
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return overlay
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,9 +1,18 @@
 import pygame
 import random
 import math  # Added for math.pi, math.cos, math.sin
+from entity import Entity
+from entity_pool import EntityPool, PooledGroup
 
 
-class Particle(pygame.sprite.Sprite):
+class Particle(Entity):
+    __slots__ = (
+        "x", "y", "base_color", "size", "color", "vx", "vy", "lifespan", "current_lifespan",
+    )
+    # Shared by every particle (ParticlePool uses the same constants)
+    gravity = 0.05
+    friction = 0.99
+
     def __init__(self, x, y, base_obstacle_color, explosion_intensity=1.0):
         """
         Creates a particle for an explosion effect.
@@ -13,7 +22,11 @@ class Particle(pygame.sprite.Sprite):
         :param explosion_intensity: Multiplier for particle speed
         """
         super().__init__()
+        self.image = None
+        self.reinit(x, y, base_obstacle_color, explosion_intensity)
 
+    def reinit(self, x, y, base_obstacle_color, explosion_intensity=1.0):
+        """(Re)initializes the particle in place; EntityPool calls this to recycle instances."""
         self.x = x
         self.y = y
         self.base_color = base_obstacle_color
@@ -29,7 +42,8 @@ class Particle(pygame.sprite.Sprite):
         b = max(0, min(255, self.base_color[2] + b_offset))
         self.color = (r, g, b)
 
-        self.image = pygame.Surface([self.size, self.size])
+        if self.image is None or self.image.get_width() != self.size:
+            self.image = pygame.Surface([self.size, self.size])
         self.image.fill(self.color)
         self.rect = self.image.get_rect(center=(self.x, self.y))
 
@@ -41,17 +55,268 @@ class Particle(pygame.sprite.Sprite):
         self.lifespan = random.randint(20, 50)  # Increased lifespan slightly
         self.current_lifespan = 0
 
-        self.gravity = 0.05
-        self.friction = 0.99
-
-    def update(self):
-        self.vx *= self.friction
-        self.vy *= self.friction
-        self.vy += self.gravity
+    def update(self, time_scale=1.0):
+        friction = self.friction ** time_scale
+        self.vx *= friction
+        self.vy *= friction
+        self.vy += self.gravity * time_scale
 
-        self.rect.x += self.vx
-        self.rect.y += self.vy
+        # x/y are the exact center; the rect only rounds it for drawing
+        self.x += self.vx * time_scale
+        self.y += self.vy * time_scale
+        self.rect.center = (self.x, self.y)
 
-        self.current_lifespan += 1
+        self.current_lifespan += time_scale
         if self.current_lifespan > self.lifespan:
             self.kill()
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to per-sprite particles
+    np = None
+
+
+class ParticlePool:
+    """
+    Struct-of-arrays particle system. Positions, velocities, colors, sizes and
+    lifespans live in preallocated NumPy arrays; live particles are packed into
+    the first `count` slots so update and draw are single vectorized passes.
+    """
+    GRAVITY = Particle.gravity
+    FRICTION = Particle.friction
+    MIN_SIZE = 2
+    MAX_SIZE = 5
+
+    def __init__(self, capacity=1024, rng=None):
+        if np is None:
+            raise RuntimeError("ParticlePool requires NumPy")
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old_count = self.count
+        old = getattr(self, "pos", None)
+        new_pos = np.zeros((capacity, 2), dtype=np.float32)
+        new_vel = np.zeros((capacity, 2), dtype=np.float32)
+        new_color = np.zeros((capacity, 3), dtype=np.uint8)
+        new_size = np.zeros(capacity, dtype=np.int8)
+        new_age = np.zeros(capacity, dtype=np.float32)
+        new_lifespan = np.zeros(capacity, dtype=np.int16)
+        if old is not None and old_count:
+            new_pos[:old_count] = self.pos[:old_count]
+            new_vel[:old_count] = self.vel[:old_count]
+            new_color[:old_count] = self.color[:old_count]
+            new_size[:old_count] = self.size[:old_count]
+            new_age[:old_count] = self.age[:old_count]
+            new_lifespan[:old_count] = self.lifespan[:old_count]
+        self.pos, self.vel, self.color = new_pos, new_vel, new_color
+        self.size, self.age, self.lifespan = new_size, new_age, new_lifespan
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def empty(self):
+        self.count = 0
+
+    def stats(self):
+        # Slots are reused in place, so the arrays only grow when an emit overflows them
+        return {"live": self.count, "capacity": self.capacity}
+
+    def columns(self):
+        """Live particles as (x, y, vx, vy, r, g, b, size, age, lifespan) arrays, for snapshots."""
+        n = self.count
+        return (
+            self.pos[:n, 0], self.pos[:n, 1], self.vel[:n, 0], self.vel[:n, 1],
+            self.color[:n, 0], self.color[:n, 1], self.color[:n, 2],
+            self.size[:n], self.age[:n], self.lifespan[:n],
+        )
+
+    def restore_columns(self, x, y, vx, vy, r, g, b, size, age, lifespan):
+        """Replaces every live particle with the given columns (see `columns`)."""
+        n = len(x)
+        self.count = 0
+        if n > self.capacity:
+            self._allocate(max(n, self.capacity * 2))
+        self.pos[:n, 0], self.pos[:n, 1] = x, y
+        self.vel[:n, 0], self.vel[:n, 1] = vx, vy
+        self.color[:n, 0], self.color[:n, 1], self.color[:n, 2] = r, g, b
+        self.size[:n], self.age[:n], self.lifespan[:n] = size, age, lifespan
+        self.count = n
+
+    def emit(self, x, y, base_obstacle_color, num_particles, explosion_intensity=1.0):
+        """Spawns `num_particles` explosion particles at (x, y), like Particle does."""
+        if num_particles <= 0:
+            return
+        end = self.count + num_particles
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+        s = slice(self.count, end)
+        # One uniform draw per attribute, scaled to the same ranges Particle uses
+        u = self.rng.random((7, num_particles), dtype=np.float32)
+
+        self.pos[s, 0] = x
+        self.pos[s, 1] = y
+
+        angle = u[0] * (2 * math.pi)
+        speed_magnitude = (1 + u[1] * 2.5) * explosion_intensity
+        self.vel[s, 0] = np.cos(angle) * speed_magnitude
+        self.vel[s, 1] = np.sin(angle) * speed_magnitude
+
+        offsets = (u[2:5] * _COLOR_OFFSET_SPAN[:, None]).astype(np.int16) + _COLOR_OFFSET_MIN[:, None]
+        base = np.asarray(base_obstacle_color[:3], dtype=np.int16)
+        rgb = base[:, None] + offsets
+        rgb[1] += (u[5] * 41).astype(np.int16)
+        self.color[s] = np.clip(rgb.T, 0, 255)
+
+        sizes = (u[6] * (self.MAX_SIZE - self.MIN_SIZE + 1)).astype(np.int8) + self.MIN_SIZE
+        self.size[s] = sizes
+        self.age[s] = 0
+        self.lifespan[s] = self.rng.integers(20, 51, num_particles)
+        self.count = end
+
+    def update(self, time_scale=1.0):
+        """Advances every particle by `time_scale` 60 Hz frames."""
+        n = self.count
+        if not n:
+            return
+        vel = self.vel[:n]
+        vel *= self.FRICTION ** time_scale
+        vel[:, 1] += self.GRAVITY * time_scale
+        self.pos[:n] += vel * time_scale
+        self.age[:n] += time_scale
+
+        alive = self.age[:n] <= self.lifespan[:n]
+        remaining = int(np.count_nonzero(alive))
+        if remaining != n:
+            # Compact survivors into the front of the arrays
+            for arr in (self.pos, self.vel, self.color, self.size, self.age, self.lifespan):
+                arr[:remaining] = arr[:n][alive]
+            self.count = remaining
+
+    def _map_colors(self, screen, n):
+        # Vectorized Surface.map_rgb for the surface's own pixel format
+        rgb = self.color[:n].astype(np.uint32)
+        shifts, losses = screen.get_shifts(), screen.get_losses()
+        mapped = np.full(n, screen.get_masks()[3], dtype=np.uint32)
+        for channel in range(3):
+            mapped |= (rgb[:, channel] >> losses[channel]) << shifts[channel]
+        return mapped
+
+    def _fill_each(self, screen, indices, left, top, size):
+        # Surface.fill moves a rect at a negative offset onto the surface
+        # instead of clipping it, so clip first
+        bounds = screen.get_rect()
+        for i in indices:
+            square = pygame.Rect(int(left[i]), int(top[i]), int(size[i]), int(size[i])).clip(bounds)
+            screen.fill(self.color[i], square)
+
+    def draw(self, screen):
+        n = self.count
+        if not n:
+            return
+        # Top-left corner of each square, matching Particle's rect centered on (x, y)
+        size = self.size[:n].astype(np.int32)
+        left = self.pos[:n, 0].astype(np.int32) - size // 2
+        top = self.pos[:n, 1].astype(np.int32) - size // 2
+        if screen.get_bytesize() != 4:
+            # Only 32-bit surfaces can take the direct pixel write below
+            self._fill_each(screen, range(n), left, top, size)
+            return
+
+        width, height = screen.get_size()
+        inside = (left >= 0) & (top >= 0) & (left + size <= width) & (top + size <= height)
+        # Squares straddling the screen edge are rare; _fill_each clips them
+        self._fill_each(screen, np.flatnonzero(~inside), left, top, size)
+
+        left, top, size = left[inside], top[inside], size[inside]
+        if not len(size):
+            return
+        # Expand every particle into a MAX_SIZE x MAX_SIZE block, keep the
+        # pixels inside its own square and write them all in one assignment
+        in_square = _SQUARE_MASKS[size]
+        px = (left[:, None, None] + _BLOCK_DX)[in_square]
+        py = (top[:, None, None] + _BLOCK_DY)[in_square]
+        colors = np.broadcast_to(
+            self._map_colors(screen, n)[inside][:, None, None], in_square.shape
+        )[in_square]
+        pixels = pygame.surfarray.pixels2d(screen)
+        try:
+            pixels[px, py] = colors
+        finally:
+            del pixels  # Release the surface lock
+
+
+if np is not None:
+    # Inclusive color offset ranges per channel, as in Particle.__init__
+    _COLOR_OFFSET_MIN = np.array([0, -30, -50], dtype=np.int16)
+    _COLOR_OFFSET_SPAN = np.array([51, 61, 51], dtype=np.float32)
+    # Per-size square masks and pixel offsets used by ParticlePool.draw
+    _BLOCK_DX, _BLOCK_DY = np.meshgrid(
+        np.arange(ParticlePool.MAX_SIZE), np.arange(ParticlePool.MAX_SIZE), indexing="ij"
+    )
+    _SQUARE_MASKS = np.zeros(
+        (ParticlePool.MAX_SIZE + 1, ParticlePool.MAX_SIZE, ParticlePool.MAX_SIZE), dtype=bool
+    )
+    for _size in range(ParticlePool.MAX_SIZE + 1):
+        _SQUARE_MASKS[_size, :_size, :_size] = True
+
+
+class SpriteParticleSystem(PooledGroup):
+    """
+    Fallback particle system with the ParticlePool interface, built on
+    Particle sprites that are recycled through an EntityPool.
+    """
+
+    def __init__(self, *sprites):
+        super().__init__(EntityPool(Particle, max_free=2048), *sprites)
+
+    def emit(self, x, y, base_obstacle_color, num_particles, explosion_intensity=1.0):
+        acquire = self.pool.acquire
+        for _ in range(num_particles):
+            self.add(acquire(x, y, base_obstacle_color, explosion_intensity))
+
+    def update(self, *args, **kwargs):
+        self.pool.flush() # Particles that expired last update may be reused from now on
+        super().update(*args, **kwargs)
+
+    def columns(self):
+        """Live particles as (x, y, vx, vy, r, g, b, size, age, lifespan) lists, for snapshots."""
+        particles = self.sprites()
+        return (
+            [p.x for p in particles], [p.y for p in particles],
+            [p.vx for p in particles], [p.vy for p in particles],
+            [p.color[0] for p in particles], [p.color[1] for p in particles], [p.color[2] for p in particles],
+            [p.size for p in particles], [p.current_lifespan for p in particles], [p.lifespan for p in particles],
+        )
+
+    def restore_columns(self, x, y, vx, vy, r, g, b, size, age, lifespan):
+        """Replaces every live particle with the given columns (see `columns`)."""
+        self.empty()
+        for row in zip(x, y, vx, vy, r, g, b, size, age, lifespan):
+            px, py, pvx, pvy, red, green, blue, psize, page, plifespan = row
+            particle = self.pool.acquire(px, py, (red, green, blue))
+            particle.color = (red, green, blue)
+            if particle.size != psize:
+                particle.size = psize
+                particle.image = pygame.Surface([psize, psize])
+            particle.image.fill(particle.color)
+            particle.rect = particle.image.get_rect(center=(px, py))
+            particle.vx, particle.vy = pvx, pvy
+            particle.current_lifespan, particle.lifespan = page, plifespan
+            self.add(particle)
+
+    def stats(self):
+        return dict(self.pool.stats(), live=len(self))
+
+
+def create_particle_system(capacity=1024, seed=None):
+    """
+    Returns a ParticlePool when NumPy is available, else a SpriteParticleSystem.
+    `seed` makes the pool's particles reproducible; the sprite fallback always
+    draws from the global random module.
+    """
+    if np is not None:
+        return ParticlePool(capacity, rng=np.random.default_rng(seed))
+    return SpriteParticleSystem()
@@ -2,6 +2,13 @@ import pygame
 # import settings  # Removed direct import, settings will be passed
 
 
+# Directional input bits, shared by keyboard, touch, AI and replays
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_UP = 4
+INPUT_DOWN = 8
+
+
 # Inherit from pygame.sprite.Sprite
 class Player(pygame.sprite.Sprite):
     def __init__(self, game_settings=None):  # Accept game_settings
@@ -25,12 +32,16 @@ class Player(pygame.sprite.Sprite):
 
         self.rect.x = 300
         self.rect.y = 740
+        # Exact top-left position; the rect holds it rounded to whole pixels
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+        self.step = (0.0, 0.0) # Distance moved by the last apply_input, for swept collisions
         self.speed = self.settings.PLAYER_SPEED  # Use settings for speed
         self.update_visuals()  # Call once at init
 
-    def move(self, keys, touch_pos=None): # Added touch_pos parameter
-        dx = 0
-        dy = 0
+    def read_input(self, keys, touch_pos=None):
+        """Translates keyboard/touch state into a bitmask of INPUT_* directions."""
+        mask = 0
 
         if touch_pos:
             # --- Touch Input Logic ---
@@ -41,9 +52,9 @@ class Player(pygame.sprite.Sprite):
             # Horizontal movement
             if abs(touch_pos[0] * self.settings.WIDTH - self.rect.centerx) > dead_zone:
                 if touch_pos[0] * self.settings.WIDTH < self.rect.centerx :
-                    dx = -self.speed
+                    mask |= INPUT_LEFT
                 elif touch_pos[0] * self.settings.WIDTH > self.rect.centerx:
-                    dx = self.speed
+                    mask |= INPUT_RIGHT
 
             # Vertical movement
             # Ensure player stays in the designated play area (e.g., bottom half of the screen)
@@ -51,48 +62,68 @@ class Player(pygame.sprite.Sprite):
             if touch_pos[1] * self.settings.HEIGHT > min_y_touch_control and \
                abs(touch_pos[1] * self.settings.HEIGHT - self.rect.centery) > dead_zone:
                 if touch_pos[1] * self.settings.HEIGHT < self.rect.centery:
-                    dy = -self.speed
+                    mask |= INPUT_UP
                 elif touch_pos[1] * self.settings.HEIGHT > self.rect.centery:
-                    dy = self.speed
+                    mask |= INPUT_DOWN
             # --- End Touch Input Logic ---
         else:
             # --- Keyboard Input Logic ---
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx = -self.speed
+                mask |= INPUT_LEFT
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx = self.speed
+                mask |= INPUT_RIGHT
             if keys[pygame.K_UP] or keys[pygame.K_w]:
-                dy = -self.speed
+                mask |= INPUT_UP
             if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                dy = self.speed
+                mask |= INPUT_DOWN
             # --- End Keyboard Input Logic ---
 
+        return mask
 
-        self.rect.x += dx
-        self.rect.y += dy
+    def move(self, keys, touch_pos=None): # Added touch_pos parameter
+        self.apply_input(self.read_input(keys, touch_pos))
 
-        # self.x = self.rect.x # These seem redundant as rect.x/y are the primary position
-        # self.y = self.rect.y
+    def apply_input(self, mask, time_scale=1.0):
+        dx = 0
+        dy = 0
+        step = self.speed * time_scale # speed is per 60 Hz simulation step
+        # Right/down win when opposite directions are held, as with the keyboard
+        if mask & INPUT_LEFT:
+            dx = -step
+        if mask & INPUT_RIGHT:
+            dx = step
+        if mask & INPUT_UP:
+            dy = -step
+        if mask & INPUT_DOWN:
+            dy = step
+
+        x = self.x + dx
+        y = self.y + dy
 
         # Boundary checks (ensure these work well with touch)
-        self.rect.left = max(2.5, self.rect.left)
-        self.rect.right = min(
-            self.settings.WIDTH - 2.5, self.rect.right
-        )  # Use settings.WIDTH
-        self.rect.top = max(
-            self.settings.HEIGHT // 2, self.rect.top # Player stays in bottom half
-        )  # Use settings.HEIGHT
-        self.rect.bottom = min(
-            self.settings.HEIGHT - 5, self.rect.bottom
-        )  # Use settings.HEIGHT
+        x = max(2.5, x)
+        x = min(self.settings.WIDTH - 2.5 - self.rect.width, x)  # Use settings.WIDTH
+        y = max(self.settings.HEIGHT // 2, y)  # Player stays in bottom half
+        y = min(self.settings.HEIGHT - 5 - self.rect.height, y)  # Use settings.HEIGHT
+        self.step = (x - self.x, y - self.y)
+        self.set_position(x, y)
+
+    def set_position(self, x, y):
+        """Moves the player's top-left corner to (x, y), keeping the fractions."""
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y) # Rect rounds half away from zero
 
     def update_visuals(self):
-        old_center = self.rect.center
+        # Resize around the exact center
+        center_x = self.x + self.rect.width / 2
+        center_y = self.y + self.rect.height / 2
         self.image = pygame.Surface([self.width, self.height], pygame.SRCALPHA)
         pygame.draw.rect(
             self.image, self.color, (0, 0, self.width, self.height), border_radius=6
         )
-        self.rect = self.image.get_rect(center=old_center)
+        self.rect = self.image.get_rect()
+        self.set_position(center_x - self.width / 2, center_y - self.height / 2)
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect, border_radius=6)
\ No newline at end of file
@@ -1,5 +1,6 @@
-import pygame
 import random
+from entity import Entity
+from sprite_atlas import _SPRITE_ATLAS_GLOBAL
 # import settings  # Removed direct import, settings will be passed
 
 # Define weights for each power-up type
@@ -19,48 +20,55 @@ for type_name, weight in POWERUP_WEIGHTS.items():
     _POWERUP_SELECTION_POOL.extend([type_name] * weight)
 
 
-class PowerUp(pygame.sprite.Sprite):
-    def __init__(self, game_settings=None):  # Accept game_settings
+class PowerUp(Entity):
+    __slots__ = ("settings", "type")
+
+    def __init__(self, game_settings=None, rng=None, powerup_type=None):  # Accept game_settings and an optional random.Random
         super().__init__()
+        self.reinit(game_settings, rng, powerup_type)
+
+    def reinit(self, game_settings=None, rng=None, powerup_type=None):
+        """(Re)initializes the power-up in place; EntityPool calls this to recycle instances."""
         # Initialize settings with fallback if not provided
         if game_settings is None:
             import settings as default_settings # Fallback import
             self.settings = default_settings
         else:
             self.settings = game_settings  # Store settings
+        rng = rng or random
 
-        # Select type from the weighted pool
-        if not _POWERUP_SELECTION_POOL:
+        # Select type from the weighted pool, unless given (snapshot restore)
+        if powerup_type is not None:
+            self.type = powerup_type
+        elif not _POWERUP_SELECTION_POOL:
             print("Warning: _POWERUP_SELECTION_POOL is empty! Defaulting to shield.")
             self.type = "shield"
         else:
-            self.type = random.choice(_POWERUP_SELECTION_POOL)
-
-        self.size = self.settings.POWERUP_SIZE  # Use settings for size
-        self.color = self.settings.POWERUP_COLORS[self.type] # Use self.settings
-        self.speed = self.settings.POWERUP_SPEED  # Use settings for speed
-
-        self.image = pygame.Surface([self.size, self.size], pygame.SRCALPHA)
-        pygame.draw.ellipse(self.image, self.color, (0, 0, self.size, self.size))
+            self.type = rng.choice(_POWERUP_SELECTION_POOL)
 
-        self.icon_font = pygame.font.SysFont("consolas", 20)
-        label_char = self.type[0].upper()
-        if self.type == "extralife":
-            label_char = "1UP"
-        elif self.type == "turret":
-            label_char = "T"
-
-        label_surface = self.icon_font.render(label_char, True, (0, 0, 0))
-        label_rect = label_surface.get_rect(center=(self.size // 2, self.size // 2))
-        self.image.blit(label_surface, label_rect)
+        # Shared, pre-rendered disc with the type's label
+        self.image = _SPRITE_ATLAS_GLOBAL.powerup(self.type, self.settings)
 
         self.rect = self.image.get_rect()
-        self.rect.x = random.randint(
+        self.rect.x = rng.randint(
             50, self.settings.WIDTH - self.size - 50
         )  # Use settings.WIDTH
         self.rect.y = -self.size
 
-    def update(self):
-        self.rect.y += self.speed
-        if self.rect.top > self.settings.HEIGHT:  # Use settings.HEIGHT
-            self.kill()
\ No newline at end of file
+    # Size, color and speed come straight from settings rather than per-instance copies
+    @property
+    def size(self):
+        return self.settings.POWERUP_SIZE
+
+    @property
+    def color(self):
+        return self.settings.POWERUP_COLORS[self.type]
+
+    @property
+    def speed(self):
+        return self.settings.POWERUP_SPEED
+
+    @property
+    def velocity(self):
+        # Pixels per 60 Hz step; the power-ups' KinematicGroup moves and culls them
+        return 0.0, self.settings.POWERUP_SPEED
\ No newline at end of file
@@ -0,0 +1,191 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+import pygame
+import settings
+from font_registry import get_font
+
+# Phases timed by Game.game_loop. "collisions" and "ai" (autopilot decisions)
+# run inside "update" and "ui" inside "render", so those are also included
+# in their parent.
+PHASES = ("events", "update", "collisions", "ai", "render", "ui", "flip")
+COUNTS = ("obstacles", "particles", "bullets", "powerups")
+
+
+class TraceSink:
+    """
+    Appends one record per frame to a CSV or JSONL file, picked by the
+    file extension (.csv, anything else is JSONL). Rows are buffered by the
+    file object, so writing costs no syscall per frame.
+    """
+
+    FIELDS = ("frame", "time_s", "frame_ms") + tuple(f"{p}_ms" for p in PHASES) + COUNTS
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.lower().endswith(".csv")
+        write_header = self.is_csv and (not os.path.exists(path) or os.path.getsize(path) == 0)
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._csv = csv.writer(self._file) if self.is_csv else None
+        if write_header:
+            self._csv.writerow(self.FIELDS)
+
+    def write(self, record):
+        if self._csv is not None:
+            self._csv.writerow(record)
+        else:
+            self._file.write(json.dumps(dict(zip(self.FIELDS, record))) + "\n")
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class FrameProfiler:
+    """
+    Low-overhead per-frame phase timer. Game.game_loop calls `lap` after each
+    phase and `end_frame` once per frame; each costs a perf_counter call and a
+    few float additions. The last `history` frames feed the on-screen overlay
+    (toggled with F3) and every frame goes to the trace sink, if one is set.
+    """
+
+    def __init__(self, history=settings.PROFILER_HISTORY_FRAMES):
+        self.overlay_visible = False
+        self.frame_times = deque(maxlen=history)
+        self.phase_history = {phase: deque(maxlen=history) for phase in PHASES}
+        self.sink = None
+        self.frame = 0
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self._counts = (0,) * len(COUNTS)
+        self._frame_start = time.perf_counter()
+        self._session_start = self._frame_start
+        self._overlay_surface = None
+        self._overlay_refreshed = 0.0
+
+    # --- Recording ---
+    def lap(self, phase, since):
+        """Adds the time from `since` to now to `phase`; returns now for the next lap."""
+        now = time.perf_counter()
+        self._phases[phase] += now - since
+        return now
+
+    def add(self, phase, seconds):
+        self._phases[phase] += seconds
+
+    def end_frame(self, counts=(0, 0, 0, 0)):
+        """Closes the current frame. `counts` follows COUNTS."""
+        now = time.perf_counter()
+        frame_s = now - self._frame_start
+        self._frame_start = now
+        self.frame += 1
+        self.frame_times.append(frame_s)
+        phases = self._phases
+        for phase in PHASES:
+            self.phase_history[phase].append(phases[phase])
+        self._counts = counts
+        if self.sink is not None:
+            self.sink.write(
+                (self.frame, round(now - self._session_start, 4), round(frame_s * 1000, 3))
+                + tuple(round(phases[phase] * 1000, 3) for phase in PHASES)
+                + tuple(counts)
+            )
+        self._phases = dict.fromkeys(PHASES, 0.0)
+
+    def start_trace(self, path):
+        self.stop_trace()
+        self.sink = TraceSink(path)
+
+    def stop_trace(self):
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+    # --- Statistics ---
+    def percentiles(self, values=(50, 95, 99)):
+        """Frame time percentiles in ms over the recorded history."""
+        ordered = sorted(self.frame_times)
+        if not ordered:
+            return {p: 0.0 for p in values}
+        last = len(ordered) - 1
+        return {p: ordered[min(last, round(last * p / 100))] * 1000 for p in values}
+
+    def phase_means(self):
+        """Mean ms per frame of each phase over the recorded history."""
+        return {
+            phase: (sum(history) / len(history) * 1000 if history else 0.0)
+            for phase, history in self.phase_history.items()
+        }
+
+    # --- Overlay ---
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_surface = None
+
+    def draw(self, screen):
+        if not self.overlay_visible:
+            return
+        # Text changes every frame, so the panel is rebuilt a few times per
+        # second instead of re-rendering (and re-caching) it on every frame
+        now = time.perf_counter()
+        if (
+            self._overlay_surface is None
+            or now - self._overlay_refreshed >= settings.PROFILER_OVERLAY_REFRESH_MS / 1000
+        ):
+            self._overlay_surface = self._render_text_panel()
+            self._overlay_refreshed = now
+        panel = self._overlay_surface
+        x = settings.WIDTH - panel.get_width() - 10
+        y = settings.HEIGHT - panel.get_height() - settings.PROFILER_GRAPH_HEIGHT - 20
+        screen.blit(panel, (x, y))
+        self._draw_graph(screen, x, y + panel.get_height() + 5, panel.get_width())
+
+    def _render_text_panel(self):
+        font = get_font(14)
+        percentiles = self.percentiles()
+        means = self.phase_means()
+        lines = [
+            "frame ms  p50 {:.2f}  p95 {:.2f}  p99 {:.2f}".format(
+                percentiles[50], percentiles[95], percentiles[99]
+            ),
+            "fps {:.0f}".format(1000 / percentiles[50] if percentiles[50] else 0),
+        ]
+        for phase in PHASES:
+            indent = "  " if phase in ("collisions", "ai", "ui") else ""
+            lines.append(f"{indent}{phase:<11} {means[phase]:6.2f} ms")
+        lines.append("  ".join(f"{name} {count}" for name, count in zip(COUNTS, self._counts)))
+
+        line_height = font.get_linesize()
+        rendered = [font.render(line, True, settings.PROFILER_TEXT_COLOR) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        panel = pygame.Surface((width, line_height * len(lines) + 8), pygame.SRCALPHA)
+        panel.fill(settings.PROFILER_BACKGROUND_COLOR)
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (6, 4 + i * line_height))
+        return panel
+
+    def _draw_graph(self, screen, x, y, width):
+        # Frame times as one polyline, newest on the right, with a line at the
+        # simulation step budget; the graph tops out at two budgets
+        height = settings.PROFILER_GRAPH_HEIGHT
+        budget_ms = 1000 / settings.SIMULATION_TICK_RATE
+        scale = height / (budget_ms * 2)
+        bottom = y + height
+        screen.fill(settings.PROFILER_BACKGROUND_COLOR[:3], (x, y, width, height))
+        budget_y = bottom - int(budget_ms * scale)
+        pygame.draw.line(
+            screen, settings.PROFILER_BUDGET_LINE_COLOR, (x, budget_y), (x + width - 1, budget_y)
+        )
+        times = list(self.frame_times)[-width:]
+        if len(times) < 2:
+            return
+        left = x + width - len(times)
+        points = [
+            (left + i, bottom - min(height, frame_s * 1000 * scale))
+            for i, frame_s in enumerate(times)
+        ]
+        pygame.draw.lines(screen, settings.PROFILER_GRAPH_COLOR, False, points)
+
+
+_FRAME_PROFILER_GLOBAL = FrameProfiler()
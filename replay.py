@@ -0,0 +1,141 @@
+import struct
+import settings
+from simulation import Simulation, BASE_TICK_RATE
+
+# File layout (little endian):
+#   header: magic, format version, seed (u64), simulation tick rate (u16),
+#           frame count (u32), final score (i32), difficulty curve fingerprint
+#           (u64), curve file path length (u16) followed by the UTF-8 path
+#           (empty for the settings-derived curve)
+#   body:   run-length encoded input masks as (mask u8, run length u16) pairs
+REPLAY_MAGIC = b"NDRP"
+REPLAY_VERSION = 6 # 3: float entity kinematics, 4: swept collisions change how recorded inputs play out, 5: obstacle waves, 6: difficulty curve
+_HEADER = struct.Struct("<4sBQHIiQH")
+_RUN = struct.Struct("<BH")
+_MAX_RUN = 0xFFFF
+
+
+class ReplayError(Exception):
+    pass
+
+
+class Replay:
+    """
+    A recorded run: the simulation seed and tick rate, the difficulty curve it
+    ran on (fingerprint and curve file path, if any) plus one input bitmask
+    per step.
+    """
+
+    def __init__(
+        self, seed, masks=None, final_score=0, tick_rate=BASE_TICK_RATE, curve_fingerprint=0, curve_path=None
+    ):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.masks = bytearray(masks or b"")
+        self.final_score = final_score
+        self.curve_fingerprint = curve_fingerprint
+        self.curve_path = curve_path
+
+    def __len__(self):
+        return len(self.masks)
+
+    def to_bytes(self):
+        runs = bytearray()
+        i = 0
+        n = len(self.masks)
+        while i < n:
+            mask = self.masks[i]
+            run = 1
+            while i + run < n and run < _MAX_RUN and self.masks[i + run] == mask:
+                run += 1
+            runs += _RUN.pack(mask, run)
+            i += run
+        path = (self.curve_path or "").encode("utf-8")
+        header = _HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.tick_rate, n, self.final_score,
+            self.curve_fingerprint, len(path),
+        )
+        return header + path + bytes(runs)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < _HEADER.size:
+            raise ReplayError("Replay data is truncated")
+        magic, version, seed, tick_rate, frame_count, final_score, curve_fingerprint, path_length = (
+            _HEADER.unpack_from(data)
+        )
+        if magic != REPLAY_MAGIC:
+            raise ReplayError("Not a Neon Dodge replay")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+        body = _HEADER.size + path_length
+        if len(data) < body:
+            raise ReplayError("Replay data is truncated")
+        try:
+            curve_path = data[_HEADER.size:body].decode("utf-8") or None
+        except UnicodeDecodeError:
+            raise ReplayError("Replay curve path is not valid UTF-8") from None
+        masks = bytearray()
+        for mask, run in _RUN.iter_unpack(data[body:]):
+            masks += bytes((mask,)) * run
+        if len(masks) != frame_count:
+            raise ReplayError(
+                f"Replay frame count mismatch: header says {frame_count}, body has {len(masks)}"
+            )
+        return cls(seed, masks, final_score, tick_rate, curve_fingerprint, curve_path)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Collects the input mask of every simulated frame of one run."""
+
+    def __init__(self, seed, tick_rate=BASE_TICK_RATE, curve_fingerprint=0, curve_path=None):
+        self.replay = Replay(
+            seed, tick_rate=tick_rate, curve_fingerprint=curve_fingerprint, curve_path=curve_path
+        )
+
+    @classmethod
+    def for_simulation(cls, sim):
+        """A recorder for `sim`'s run, noting its seed, tick rate and difficulty curve."""
+        return cls(
+            sim.seed, sim.tick_rate, sim.difficulty.fingerprint(),
+            getattr(sim.settings, "DIFFICULTY_CURVE_FILE", None),
+        )
+
+    def record(self, input_mask):
+        self.replay.masks.append(input_mask)
+
+    def finish(self, final_score):
+        self.replay.final_score = final_score
+        return self.replay
+
+
+def play_replay(replay, game_settings=settings, on_frame=None):
+    """
+    Re-runs a replay headlessly and returns the resulting Simulation.
+    `on_frame(sim)` is called after every step. The run is exact, so the
+    returned sim.score matches replay.final_score for an unmodified build.
+    Raises ReplayError if `game_settings` compile to a different difficulty
+    curve than the one the replay was recorded with (see replay.curve_path).
+    """
+    sim = Simulation(
+        game_settings, visual_effects=False, seed=replay.seed, tick_rate=replay.tick_rate
+    )
+    if sim.difficulty.fingerprint() != replay.curve_fingerprint:
+        recorded = replay.curve_path or "the settings-derived curve"
+        raise ReplayError(f"Replay was recorded with a different difficulty curve ({recorded})")
+    for input_mask in replay.masks:
+        sim.step(input_mask)
+        if on_frame is not None:
+            on_frame(sim)
+        if sim.game_over:
+            break
+    return sim
@@ -52,6 +52,7 @@ MIN_MULTIPLE_SPAWN_X_GAP = 70 # Mindestabstand zwischen Hindernissen beim Mehrfa
 MAX_MULTIPLE_SPAWN_X_GAP = 120 # Höchstabstand zwischen Hindernissen beim Mehrfach-Spawn
 MULTIPLE_SPAWN_Y_OFFSET_MIN = 0 # Minimaler Y-Offset für zusätzliche Hindernisse
 MULTIPLE_SPAWN_Y_OFFSET_MAX = 50 # Maximaler Y-Offset für zusätzliche Hindernisse
+DIFFICULTY_CURVE_FILE = None # JSON-Kurvendatei (siehe difficulty.py); None = aus den Werten oben berechnet
 
 
 # Bullet Settings
@@ -114,6 +115,31 @@ MENU_TEXT_COLOR = LIGHT_TEXT # Changed from WHITE
 MENU_SUBTEXT_COLOR = MEDIUM_TEXT # Changed from (200, 200, 200)
 MENU_TITLE_COLOR = NEON_PINK # Changed from NEON_GREEN for consistency with the overall theme title
 
+# Simulation timing
+SIMULATION_TICK_RATE = 60 # Fixed simulation steps per second; speeds and spawn intervals are tuned per 60 Hz step
+RENDER_FPS_CAP = 144 # Upper bound for rendered frames per second (0 = uncapped)
+MAX_SIMULATION_STEPS_PER_FRAME = 5 # Catch-up limit per rendered frame; beyond it slow machines drop time instead of spiralling
+
+# Rendering
+DIRTY_RECT_RENDERING = True # Menus and static screens push only changed regions instead of flipping every frame
+
+# Collision Settings
+COLLISION_CELL_SIZE = 64 # Spatial hash cell size in pixels (about one obstacle/player width)
+COLLISION_GRID_MIN_SPRITES = 160 # Below this many sprites a linear scan beats the grid (benchmarks/collision_crossover.py)
+SWEPT_COLLISION_MIN_STEP = 10 # Relative movement per step (px) from which hits are tested along the movers' paths; below it nothing can pass through the thinnest pair (14 px obstacle + 10 px bullet)
+
+# Profiler overlay (toggle with F3)
+PROFILER_HISTORY_FRAMES = 240 # Frames kept for the frame-time graph and percentiles
+PROFILER_OVERLAY_REFRESH_MS = 250 # How often the overlay text is re-rendered
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_TEXT_COLOR = LIGHT_TEXT
+PROFILER_BACKGROUND_COLOR = (0, 0, 0, 170)
+PROFILER_GRAPH_COLOR = NEON_GREEN
+PROFILER_BUDGET_LINE_COLOR = NEON_RED # Marks one simulation step (1000 / SIMULATION_TICK_RATE ms)
+
+# Debugging
+DEBUG_SNAPSHOT_HOTKEYS = False # F5 checkpoints the run, F9 rewinds to it; never enable in player builds
+
 # Highscore File
 HIGHSCORE_FILE = "assets/highscores.json"
 
@@ -0,0 +1,438 @@
+import random
+import time
+import pygame
+from dataclasses import dataclass, field
+from player import Player
+from obstacle import Obstacle
+from powerups import PowerUp
+from companion import Companion
+from bullet import Bullet
+from particle import create_particle_system
+from spatial_hash import SpatialHash
+from autopilot import Autopilot
+from entity_pool import EntityPool
+from kinematics import KinematicGroup
+from difficulty import get_difficulty_curve
+import settings
+from locale_manager import _LOCALE_MANAGER_GLOBAL
+
+# Entity speeds and spawn intervals in settings are expressed per step of this rate
+BASE_TICK_RATE = 60
+BASE_FRAME_MS = 1000 / BASE_TICK_RATE
+
+
+# --- Dataclasses ---
+@dataclass
+class GameTimers:
+    # All values are timestamps in ms on the simulation clock (Simulation.now)
+    last_obstacle_spawn_tick: float = 0
+    last_powerup_spawn_tick: float = 0
+    slowmo_effect_end_tick: float = 0
+    shrink_effect_end_tick: float = 0
+    pickup_message_end_tick: float = 0
+    player_invincible_end_tick: float = 0
+    companion_active_end_tick: float = 0
+
+
+@dataclass
+class ActiveEffects:
+    shield: bool = False
+    bomb_ready: bool = False
+    pickup_message: str = ""
+
+
+@dataclass
+class RunCounters:
+    # Per-run tallies for batch analysis; they never influence gameplay
+    obstacles_spawned: int = 0 # Including split pieces
+    obstacles_destroyed: int = 0 # By turret, bomb, shield or invincible contact
+    peak_obstacles: int = 0 # Most obstacles alive after any step
+    lives_lost: int = 0
+    powerups_spawned: int = 0
+    powerups_collected: dict = field(default_factory=dict) # Type -> pickups
+
+
+# ---
+
+class Simulation:
+    """
+    Pure game-state core: player, obstacles, powerups, companion, timers,
+    effects, score and lives. It never touches the display, so it can be
+    stepped as fast as the CPU allows (see run_headless) or wrapped by Game
+    for interactive play.
+    """
+
+    def __init__(
+        self, game_settings=settings, locale=None, visual_effects=True, seed=None, tick_rate=None
+    ):
+        self.settings = game_settings
+        self.tick_rate = tick_rate or getattr(
+            game_settings, "SIMULATION_TICK_RATE", BASE_TICK_RATE
+        )
+        self.dt_ms = 1000 / self.tick_rate
+        # Per-step scale for speeds that settings express per BASE_TICK_RATE step
+        self.time_scale = BASE_TICK_RATE / self.tick_rate
+        self.locale = locale if locale is not None else _LOCALE_MANAGER_GLOBAL
+        # Explosion particles are purely cosmetic; headless runs switch them off
+        self.visual_effects = visual_effects
+        self.profiler = None # Optional FrameProfiler that times check_collisions
+        # Killed entities are recycled instead of left to the garbage collector;
+        # the pools outlive reset(), so batch runs keep reusing them
+        self.obstacle_pool = EntityPool(Obstacle)
+        self.powerup_pool = EntityPool(PowerUp)
+        self.bullet_pool = EntityPool(Bullet)
+        self.difficulty = get_difficulty_curve(game_settings)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """
+        Starts a new run. All gameplay randomness comes from `self.rng`, seeded
+        with `seed` (a fresh random seed if None), so a seed plus the per-frame
+        input masks fully determine a run.
+        """
+        self.seed = seed if seed is not None else random.randrange(2**63)
+        self.rng = random.Random(self.seed)
+        self.player = Player(self.settings)
+        for group_name in ("obstacles", "powerups", "companion_bullets"):
+            if hasattr(self, group_name):
+                getattr(self, group_name).empty() # Hand the previous run's entities back to their pools
+        # Obstacles and power-ups fall until their top passes the bottom edge
+        self.obstacles = KinematicGroup(self.obstacle_pool, max_top=self.settings.HEIGHT)
+        self.powerups = KinematicGroup(self.powerup_pool, max_top=self.settings.HEIGHT)
+        self.score = 0
+        self.obstacle_speed = self.difficulty.at(0).obstacle_speed # Speed of the latest spawn
+        self.speed_multiplier = 1.0
+        self.lives = self.settings.INITIAL_LIVES
+        self.timers = GameTimers()
+        self.effects = ActiveEffects()
+        self.counters = RunCounters()
+        self.companion = None
+        self.companion_bullets = KinematicGroup(self.bullet_pool, min_bottom=0)
+        self.particles = create_particle_system(seed=self.seed)
+        self.obstacle_grid = SpatialHash(
+            self.settings.COLLISION_CELL_SIZE, self.settings.COLLISION_GRID_MIN_SPRITES
+        )
+        self.powerup_grid = SpatialHash(
+            self.settings.COLLISION_CELL_SIZE, self.settings.COLLISION_GRID_MIN_SPRITES
+        )
+        self.game_over = False
+        self.frame = 0
+        self.now = 0 # Simulation clock in ms, derived from the frame count
+
+    def _create_explosion(
+        self,
+        position,
+        base_color,
+        num_particles=settings.PARTICLES_PER_OBSTACLE_EXPLOSION,
+    ):
+        if not self.visual_effects:
+            return
+        self.particles.emit(position[0], position[1], base_color, num_particles)
+
+    def step(self, input_mask=0):
+        """
+        Advances the simulation by one frame. `input_mask` holds the player's
+        INPUT_* direction bits for this frame. Time advances by dt_ms.
+        """
+        self.frame += 1
+        # Computed from the step count rather than accumulated, so it never drifts
+        now = self.frame * self.dt_ms
+        self.now = now
+        # Entities killed during the previous step are safe to reuse from here on
+        self.obstacle_pool.flush()
+        self.powerup_pool.flush()
+        self.bullet_pool.flush()
+        self.player.apply_input(input_mask, self.time_scale)
+
+        # Spawn interval, speed and wave pattern for the current score, from the precompiled curve
+        level = self.difficulty.at(self.score)
+
+        # Spawn new obstacles if more than the interval has passed since the last spawn
+        if self._base_frames_since(self.timers.last_obstacle_spawn_tick) > level.spawn_interval:
+            self.timers.last_obstacle_spawn_tick = now # Reset timer
+            self.obstacle_speed = level.obstacle_speed
+            self._spawn_wave(level)
+            self.score += 1 # Increment score for surviving longer / spawning obstacles
+
+        self.update_powerups() # Handle powerup spawning
+        self.update_effects(now) # Update durations of active effects (shrink, slowmo)
+
+        # Companion (turret) logic
+        if self.companion:
+            if now < self.timers.companion_active_end_tick: # If companion is active
+                new_bullets = self.companion.update(self.player.rect, now) # Update companion, may shoot
+                if new_bullets:
+                    self.companion_bullets.add(new_bullets)
+            else:
+                self.companion = None # Companion duration expired
+
+        self.companion_bullets.update(self.time_scale) # Move companion bullets
+        self.obstacles.update(self.speed_multiplier * self.time_scale) # Move obstacles (affected by slowmo)
+        self.powerups.update(self.time_scale) # Move powerups
+        self.particles.update(self.time_scale) # Update explosion particles
+
+        if self.profiler is None:
+            self.check_collisions(now) # Handle collisions
+        else:
+            start = time.perf_counter()
+            self.check_collisions(now)
+            self.profiler.add("collisions", time.perf_counter() - start)
+        if len(self.obstacles) > self.counters.peak_obstacles:
+            self.counters.peak_obstacles = len(self.obstacles)
+
+    def _spawn_obstacle(self, position=None):
+        # Chance to spawn a splittable obstacle
+        splittable = self.rng.random() < self.settings.SPLITTABLE_OBSTACLE_CHANCE
+        new_obstacle = self.obstacle_pool.acquire(
+            self.obstacle_speed, 1, splittable, 2, position, game_settings=self.settings, rng=self.rng
+        )
+        self.obstacles.add(new_obstacle)
+        self.counters.obstacles_spawned += 1
+        return new_obstacle
+
+    def _spawn_wave(self, level):
+        """
+        Spawns one obstacle at a random x and, with the level's wave chance,
+        `wave_size` more in a row beside it: each a random gap from the
+        previous one (to its right if that fits on screen, else its left) and
+        a random height above the top edge. Extras that fit on neither side
+        are skipped.
+        """
+        previous = self._spawn_obstacle().rect
+        if level.wave_size <= 0 or level.wave_chance <= 0 or self.rng.random() >= level.wave_chance:
+            return
+        width, height, _ = Obstacle.shared_style(1, self.settings)
+        for _ in range(level.wave_size):
+            gap = self.rng.randint(
+                self.settings.MIN_MULTIPLE_SPAWN_X_GAP, self.settings.MAX_MULTIPLE_SPAWN_X_GAP
+            )
+            y_offset = self.rng.randint(
+                self.settings.MULTIPLE_SPAWN_Y_OFFSET_MIN, self.settings.MULTIPLE_SPAWN_Y_OFFSET_MAX
+            )
+            if previous.right + gap + width <= self.settings.WIDTH:
+                x = previous.right + gap
+            elif previous.left - gap - width >= 0:
+                x = previous.left - gap - width
+            else:
+                continue
+            top = -height - y_offset
+            previous = self._spawn_obstacle((x + width / 2, top + height / 2)).rect
+
+    def _base_frames_since(self, tick):
+        """Time since `tick`, in BASE_TICK_RATE frames (rounded to absorb float error)."""
+        return round((self.now - tick) / BASE_FRAME_MS, 6)
+
+    def update_effects(self, now):
+        # Check and apply Shrink effect
+        is_shrink_active = now < self.timers.shrink_effect_end_tick
+        # Check and apply SlowMo effect
+        is_slowmo_active = now < self.timers.slowmo_effect_end_tick
+
+        new_width = 30 if is_shrink_active else self.player.original_width
+        new_height = 15 if is_shrink_active else self.player.original_height
+
+        if self.player.width != new_width or self.player.height != new_height:
+            self.player.width = new_width
+            self.player.height = new_height
+            self.player.update_visuals() # Recreate player image if size changed
+
+        # Game speed multiplier for SlowMo
+        self.speed_multiplier = 0.5 if is_slowmo_active else 1.0
+
+        if self.effects.pickup_message and now >= self.timers.pickup_message_end_tick:
+            self.effects.pickup_message = ""
+
+    def check_collisions(self, now):
+        # Movers that close in on each other faster than SWEPT_COLLISION_MIN_STEP per
+        # step could pass through each other between steps, so they are tested
+        # along their paths (swept) instead of only where they ended up
+        min_step = self.settings.SWEPT_COLLISION_MIN_STEP
+        player_step = max(abs(self.player.step[0]), abs(self.player.step[1]))
+        obstacle_step = self.obstacles.max_step()
+        powerup_step = self.powerups.max_step()
+        sweep_obstacles = obstacle_step + max(player_step, self.companion_bullets.max_step()) >= min_step
+        sweep_powerups = powerup_step + player_step >= min_step
+        player_delta = self.player.step if sweep_obstacles or sweep_powerups else None
+
+        # Broad phase: bucket this step's obstacle and powerup positions into grids
+        if sweep_obstacles:
+            self.obstacle_grid.rebuild(self.obstacles, self.obstacles.displacement, obstacle_step)
+        else:
+            self.obstacle_grid.rebuild(self.obstacles)
+        if sweep_powerups:
+            self.powerup_grid.rebuild(self.powerups, self.powerups.displacement, powerup_step)
+        else:
+            self.powerup_grid.rebuild(self.powerups)
+
+        # Player vs Obstacles
+        collided_obs_player = self.obstacle_grid.spritecollide(
+            self.player, False, player_delta # False: do not kill obstacles yet
+        )
+        if collided_obs_player:
+            is_player_invincible = now < self.timers.player_invincible_end_tick # Temp invincibility after hit
+            if not is_player_invincible:
+                for obs in collided_obs_player: # Process each colliding obstacle
+                    if self.effects.shield: # If shield is active
+                        self.effects.shield = False # Shield breaks
+                        self._create_explosion(obs.rect.center, obs.color)
+                        obs.kill() # Destroy obstacle
+                        self.counters.obstacles_destroyed += 1
+                        self.effects.pickup_message = self.locale.get_text("shield_lost")
+                        self.timers.pickup_message_end_tick = (
+                            now + self.settings.PICKUP_MESSAGE_DURATION_MS
+                        )
+                    else: # No shield, player takes a hit
+                        self.lives -= 1
+                        self.counters.lives_lost += 1
+                        self._create_explosion(obs.rect.center, obs.color)
+                        obs.kill()
+                        if self.lives <= 0:
+                            self.game_over = True # The owner (Game / headless runner) reacts to this
+                            break # Exit collision check loop for this frame
+                        else:
+                            # Grant temporary invincibility
+                            self.timers.player_invincible_end_tick = (
+                                now + self.settings.PLAYER_INVINCIBILITY_DURATION_MS
+                            )
+                            self.effects.pickup_message = self.locale.get_text("life_lost", self.lives)
+                            self.timers.pickup_message_end_tick = (
+                                now + self.settings.PICKUP_MESSAGE_DURATION_MS
+                            )
+            elif collided_obs_player: # Player is invincible but still collides
+                 for obs in collided_obs_player: # Destroy obstacle without penalty
+                    self._create_explosion(obs.rect.center, obs.color)
+                    obs.kill()
+                    self.counters.obstacles_destroyed += 1
+
+        # Companion Bullets vs Obstacles
+        # All hits are gathered before any obstacle is destroyed, as groupcollide does
+        bullet_hits = []
+        bullet_displacement = self.companion_bullets.displacement if sweep_obstacles else None
+        for bullet in self.companion_bullets.sprites():
+            hit_obs_list = self.obstacle_grid.spritecollide(
+                bullet, False, bullet_displacement(bullet) if bullet_displacement else None
+            )
+            if hit_obs_list:
+                bullet.kill() # Bullet is spent, obstacle is destroyed below
+                bullet_hits.append(hit_obs_list)
+        for hit_obs_list in bullet_hits:
+            for obs in hit_obs_list:
+                self.score += 1 # Score for turret kills
+                self._create_explosion(obs.rect.center, obs.color)
+                obs.kill() # Destroy obstacle hit by bullet
+                self.counters.obstacles_destroyed += 1
+
+        # Player vs PowerUps
+        collided_powerups_player = self.powerup_grid.spritecollide(
+            self.player, True, player_delta # True: kill (collect) powerup
+        )
+        collected = self.counters.powerups_collected
+        for p_up in collided_powerups_player:
+            collected[p_up.type] = collected.get(p_up.type, 0) + 1
+            self.handle_powerup_pickup(p_up, now)
+
+    def update_powerups(self):
+        # Spawn powerups periodically
+        if self._base_frames_since(self.timers.last_powerup_spawn_tick) > self.settings.POWERUP_SPAWN_INTERVAL:
+            self.powerups.add(self.powerup_pool.acquire(game_settings=self.settings, rng=self.rng)) # Add a new powerup
+            self.counters.powerups_spawned += 1
+            self.timers.last_powerup_spawn_tick = self.now # Reset spawn timer
+
+    def handle_powerup_pickup(self, powerup, current_tick):
+        # Set duration for pickup message display
+        self.timers.pickup_message_end_tick = (
+            current_tick + self.settings.PICKUP_MESSAGE_DURATION_MS
+        )
+        if powerup.type == "shield":
+            self.effects.shield = True
+            self.effects.pickup_message = self.locale.get_text("shield_activated")
+        elif powerup.type == "slowmo":
+            self.timers.slowmo_effect_end_tick = (
+                current_tick + self.settings.SLOWMO_DURATION_MS
+            )
+            self.effects.pickup_message = self.locale.get_text("slow_motion")
+        elif powerup.type == "bomb":
+            self.effects.pickup_message = self.locale.get_text("kaboom")
+            newly_split_obstacles = []
+            for obs in list(self.obstacles.sprites()): # Iterate over a copy
+                self._create_explosion(
+                    obs.rect.center,
+                    obs.color,
+                    num_particles=self.settings.PARTICLES_PER_OBSTACLE_EXPLOSION // 2, # Fewer particles for bomb
+                )
+                # If obstacle can split, get its pieces
+                if (
+                    hasattr(obs, "can_split")
+                    and obs.can_split
+                    and hasattr(obs, "get_split_pieces") # Ensure method exists
+                ):
+                    pieces = obs.get_split_pieces(self.obstacle_pool)
+                    newly_split_obstacles.extend(pieces)
+                obs.kill() # Destroy original obstacle
+                self.counters.obstacles_destroyed += 1
+            self.obstacles.add(newly_split_obstacles) # Add any split pieces
+            self.counters.obstacles_spawned += len(newly_split_obstacles)
+        elif powerup.type == "shrink":
+            self.timers.shrink_effect_end_tick = (
+                current_tick + self.settings.SHRINK_DURATION_MS
+            )
+            self.effects.pickup_message = self.locale.get_text("shrink_activated")
+        elif powerup.type == "extralife":
+            self.lives += 1
+            self.effects.pickup_message = self.locale.get_text("extra_life", self.lives)
+        elif powerup.type == "turret":
+            self.companion = Companion(
+                self.player.rect, game_settings=self.settings, now=current_tick,
+                bullet_pool=self.bullet_pool,
+            )
+            self.timers.companion_active_end_tick = (
+                current_tick + self.settings.COMPANION_DURATION_MS
+            )
+            self.effects.pickup_message = self.locale.get_text("turret_activated")
+
+
+    def pool_stats(self):
+        """Debug view of entity recycling: per-pool counters plus particle storage."""
+        return {
+            "obstacles": self.obstacle_pool.stats(),
+            "powerups": self.powerup_pool.stats(),
+            "bullets": self.bullet_pool.stats(),
+            "particles": self.particles.stats(),
+        }
+
+
+def run_headless(max_frames, game_settings=settings, seed=None, autopilot=False):
+    """
+    Steps Simulation without a window or renderer for `max_frames` frames,
+    restarting whenever a run ends. Time advances by the simulation's fixed
+    step, so effect durations behave exactly as in an interactive session.
+    With a `seed`, every restart is seeded from it and the whole batch is
+    reproducible. With `autopilot`, an Autopilot plays instead of an idle
+    player and its decision latency is reported. Returns a dict of stats.
+    """
+    pygame.font.init() # PowerUp labels need the font module, but no display
+    seeds = random.Random(seed)
+    sim = Simulation(game_settings, visual_effects=False, seed=seeds.randrange(2**63))
+    games_played = 0
+    best_score = 0
+    pilot = Autopilot() if autopilot else None
+    start = time.perf_counter()
+    for _ in range(max_frames):
+        sim.step(pilot.decide(sim) if pilot is not None else 0)
+        if sim.game_over:
+            games_played += 1
+            best_score = max(best_score, sim.score)
+            sim.reset(seeds.randrange(2**63))
+    elapsed = time.perf_counter() - start
+    best_score = max(best_score, sim.score) # Include the run still in progress
+    stats = {
+        "frames": max_frames,
+        "games_played": games_played,
+        "best_score": best_score,
+        "elapsed_s": elapsed,
+        "fps": max_frames / elapsed if elapsed > 0 else float("inf"),
+        "pools": sim.pool_stats(),
+    }
+    if pilot is not None:
+        stats["autopilot"] = pilot.stats()
+    return stats
@@ -0,0 +1,327 @@
+import struct
+import sys
+from array import array
+from powerups import POWERUP_WEIGHTS
+from simulation import GameTimers, ActiveEffects, RunCounters
+from companion import Companion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; columns are then packed from Python lists
+    np = None
+
+# Snapshot layout (little endian), sections in this order:
+#   header:    magic, format version, simulation tick rate (u16), seed (u64), frame (u32)
+#   state:     score, lives, flags, speed multiplier, obstacle speed, GameTimers fields
+#   message:   pickup message (u16 length + UTF-8)
+#   counters:  RunCounters fields, then (powerup type code, pickups) pairs
+#   rng:       gameplay random.Random state
+#   player:    exact top-left, last step, size
+#   companion: present flag, last shot time
+#   entities:  obstacles, powerups and bullets, each a row count (u32) and fixed-size rows
+#              in group order, with exact top-left positions
+#   particles: row count and one packed array per column, then the particle RNG state
+#   stars:     present flag; row count, columns and RNG state (Game snapshots only)
+SNAPSHOT_MAGIC = b"NDSS"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct("<4sBHQI")
+_STATE = struct.Struct("<ihBdd7d")
+_COUNTERS = struct.Struct("<6I")
+_PICKUPS = struct.Struct("<BI")
+_PLAYER = struct.Struct("<ddddHH")
+_COMPANION = struct.Struct("<?d")
+_COUNT = struct.Struct("<I")
+_FLAG = struct.Struct("<?")
+_OBSTACLE = struct.Struct("<ddBBBd") # x, y, generation, can_split, num_splits, speed
+_POWERUP = struct.Struct("<ddB") # x, y, type code
+_BULLET = struct.Struct("<dddB") # x, y, speed_y, radius
+_MT_RNG = struct.Struct("<B?d") # version, has gauss_next, gauss_next; 625 u32 words follow
+_PCG_RNG = struct.Struct("<16s16s?I") # state, increment, has_uint32, uinteger
+
+# Column array typecodes of the particle (x, y, vx, vy, r, g, b, size, age, lifespan)
+# and star (x, y, speed, color index, size) tables
+PARTICLE_COLUMNS = "ffffBBBbfh"
+STAR_COLUMNS = "iffBB"
+_NUMPY_DTYPES = {"f": "<f4", "d": "<f8", "i": "<i4", "h": "<i2", "b": "i1", "B": "u1"}
+_RNG_NONE, _RNG_MT, _RNG_PCG64 = 0, 1, 2
+
+POWERUP_TYPES = tuple(POWERUP_WEIGHTS) # Type code -> type name
+_POWERUP_CODES = {name: code for code, name in enumerate(POWERUP_TYPES)}
+_FLAG_GAME_OVER, _FLAG_SHIELD, _FLAG_BOMB_READY = 1, 2, 4
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def capture_snapshot(sim, starfield=None):
+    """
+    Packs the complete state of `sim` (plus `starfield`, which lives outside
+    the simulation) into a versioned binary buffer. Restoring it with
+    `restore_snapshot` resumes the run exactly: stepping the restored sim
+    with the same inputs gives the same frames the original would have.
+    (Without NumPy, particles draw from the global random module, so only
+    their current state is captured and later explosions differ.)
+    """
+    out = []
+    out.append(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, sim.tick_rate, sim.seed, sim.frame))
+    timers = sim.timers
+    effects = sim.effects
+    flags = (
+        (_FLAG_GAME_OVER if sim.game_over else 0)
+        | (_FLAG_SHIELD if effects.shield else 0)
+        | (_FLAG_BOMB_READY if effects.bomb_ready else 0)
+    )
+    out.append(_STATE.pack(
+        sim.score, sim.lives, flags, sim.speed_multiplier, sim.obstacle_speed,
+        timers.last_obstacle_spawn_tick, timers.last_powerup_spawn_tick,
+        timers.slowmo_effect_end_tick, timers.shrink_effect_end_tick,
+        timers.pickup_message_end_tick, timers.player_invincible_end_tick,
+        timers.companion_active_end_tick,
+    ))
+    _pack_text(out, effects.pickup_message)
+
+    counters = sim.counters
+    out.append(_COUNTERS.pack(
+        counters.obstacles_spawned, counters.obstacles_destroyed, counters.peak_obstacles,
+        counters.lives_lost, counters.powerups_spawned, len(counters.powerups_collected),
+    ))
+    for powerup_type, count in counters.powerups_collected.items():
+        out.append(_PICKUPS.pack(_POWERUP_CODES[powerup_type], count))
+    _pack_rng(out, sim.rng)
+
+    player = sim.player
+    out.append(_PLAYER.pack(player.x, player.y, player.step[0], player.step[1], player.width, player.height))
+    companion = sim.companion
+    out.append(_COMPANION.pack(companion is not None, companion.last_shot_time if companion else 0.0))
+
+    obstacles = sim.obstacles
+    _pack_rows(out, _OBSTACLE, [
+        obstacles.position(obs) + (obs.generation, obs.can_split, obs.num_splits, obs.speed)
+        for obs in obstacles.sprites()
+    ])
+    powerups = sim.powerups
+    _pack_rows(out, _POWERUP, [
+        powerups.position(p_up) + (_POWERUP_CODES[p_up.type],) for p_up in powerups.sprites()
+    ])
+    bullets = sim.companion_bullets
+    _pack_rows(out, _BULLET, [
+        bullets.position(bullet) + (bullet.speed_y, bullet.radius) for bullet in bullets.sprites()
+    ])
+
+    _pack_columns(out, PARTICLE_COLUMNS, sim.particles.columns())
+    _pack_rng(out, getattr(sim.particles, "rng", None))
+    out.append(_FLAG.pack(starfield is not None))
+    if starfield is not None:
+        _pack_columns(out, STAR_COLUMNS, starfield.columns())
+        _pack_rng(out, starfield.rng)
+    return b"".join(out)
+
+
+def restore_snapshot(sim, data, starfield=None):
+    """
+    Replaces the state of `sim` (and of `starfield`, if the snapshot has
+    stars) with a `capture_snapshot` buffer. Entities go back through the
+    sim's pools, so restoring allocates little. `sim` must run at the
+    snapshot's tick rate; its settings and locale are kept.
+    """
+    reader = _Reader(data)
+    magic, version, tick_rate, seed, frame = reader.unpack(_HEADER)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a Neon Dodge snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    if tick_rate != sim.tick_rate:
+        raise SnapshotError(f"Snapshot runs at {tick_rate} Hz, the simulation at {sim.tick_rate} Hz")
+    state = reader.unpack(_STATE)
+    message = reader.text()
+    counter_values = reader.unpack(_COUNTERS)
+    collected = {}
+    for _ in range(counter_values[5]):
+        code, count = reader.unpack(_PICKUPS)
+        collected[POWERUP_TYPES[code]] = count
+    rng_state = reader.rng()
+    player_x, player_y, step_x, step_y, width, height = reader.unpack(_PLAYER)
+    has_companion, last_shot_time = reader.unpack(_COMPANION)
+    obstacle_rows = reader.rows(_OBSTACLE)
+    powerup_rows = reader.rows(_POWERUP)
+    bullet_rows = reader.rows(_BULLET)
+    particle_columns = reader.columns(PARTICLE_COLUMNS)
+    particle_rng_state = reader.rng()
+    (has_stars,) = reader.unpack(_FLAG)
+    if has_stars:
+        star_columns = reader.columns(STAR_COLUMNS)
+        star_rng_state = reader.rng()
+    if reader.offset != len(data):
+        raise SnapshotError("Snapshot has trailing data")
+
+    # Everything is parsed, so a damaged buffer never leaves the sim half restored
+    sim.seed = seed
+    sim.frame = frame
+    sim.now = frame * sim.dt_ms
+    sim.score, sim.lives, flags, sim.speed_multiplier, sim.obstacle_speed = state[:5]
+    sim.game_over = bool(flags & _FLAG_GAME_OVER)
+    sim.timers = GameTimers(*state[5:])
+    sim.effects = ActiveEffects(bool(flags & _FLAG_SHIELD), bool(flags & _FLAG_BOMB_READY), message)
+    sim.counters = RunCounters(*counter_values[:5], powerups_collected=collected)
+
+    player = sim.player
+    if (player.width, player.height) != (width, height):
+        player.width, player.height = width, height
+        player.update_visuals()
+    player.set_position(player_x, player_y)
+    player.step = (step_x, step_y)
+
+    game_settings = sim.settings
+    sim.obstacles.empty()
+    sim.powerups.empty()
+    sim.companion_bullets.empty()
+    # Pooled entities are re-created with a throwaway position and then moved to
+    # their exact one; sim.rng absorbs any draws before its state is restored below
+    for x, y, generation, can_split, num_splits, speed in obstacle_rows:
+        obs = sim.obstacle_pool.acquire(
+            speed, generation, bool(can_split), num_splits, (0, 0), game_settings=game_settings
+        )
+        sim.obstacles.add(obs)
+        sim.obstacles.set_position(obs, x, y)
+    for x, y, code in powerup_rows:
+        p_up = sim.powerup_pool.acquire(game_settings, sim.rng, POWERUP_TYPES[code])
+        sim.powerups.add(p_up)
+        sim.powerups.set_position(p_up, x, y)
+    for x, y, speed_y, radius in bullet_rows:
+        bullet = sim.bullet_pool.acquire(0, 0, speed_y, radius, game_settings)
+        sim.companion_bullets.add(bullet)
+        sim.companion_bullets.set_position(bullet, x, y)
+    sim.companion = None
+    if has_companion:
+        sim.companion = Companion(
+            player.rect, game_settings=game_settings, now=last_shot_time, bullet_pool=sim.bullet_pool
+        )
+    sim.particles.restore_columns(*particle_columns)
+    _restore_rng(getattr(sim.particles, "rng", None), particle_rng_state)
+    _restore_rng(sim.rng, rng_state)
+
+    if has_stars and starfield is not None:
+        starfield.restore_columns(*star_columns)
+        _restore_rng(starfield.rng, star_rng_state)
+
+
+# --- Packing ---
+def _pack_text(out, text):
+    encoded = text.encode("utf-8")
+    out.append(struct.pack("<H", len(encoded)))
+    out.append(encoded)
+
+
+def _pack_rows(out, row, rows):
+    out.append(_COUNT.pack(len(rows)))
+    out.extend(row.pack(*values) for values in rows)
+
+
+def _pack_columns(out, typecodes, columns):
+    out.append(_COUNT.pack(len(columns[0])))
+    for typecode, values in zip(typecodes, columns):
+        if np is not None and isinstance(values, np.ndarray):
+            out.append(values.astype(_NUMPY_DTYPES[typecode], copy=False).tobytes())
+        else:
+            packed = array(typecode, values)
+            if sys.byteorder == "big":
+                packed.byteswap()
+            out.append(packed.tobytes())
+
+
+def _pack_rng(out, rng):
+    if rng is None:
+        out.append(bytes((_RNG_NONE,)))
+    elif hasattr(rng, "getstate"): # random.Random (Mersenne Twister)
+        version, words, gauss_next = rng.getstate()
+        out.append(bytes((_RNG_MT,)))
+        out.append(_MT_RNG.pack(version, gauss_next is not None, gauss_next or 0.0))
+        packed = array("I", words)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        out.append(_COUNT.pack(len(packed)))
+        out.append(packed.tobytes())
+    else: # numpy.random.Generator
+        state = rng.bit_generator.state
+        if state["bit_generator"] != "PCG64":
+            raise SnapshotError(f"Cannot snapshot a {state['bit_generator']} generator")
+        out.append(bytes((_RNG_PCG64,)))
+        out.append(_PCG_RNG.pack(
+            state["state"]["state"].to_bytes(16, "little"),
+            state["state"]["inc"].to_bytes(16, "little"),
+            bool(state["has_uint32"]),
+            state["uinteger"],
+        ))
+
+
+def _restore_rng(rng, state):
+    if rng is None or state is None:
+        return
+    kind, value = state
+    if kind == _RNG_MT:
+        rng.setstate(value)
+    else:
+        rng.bit_generator.state = value
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def take(self, size):
+        end = self.offset + size
+        if end > len(self.data):
+            raise SnapshotError("Snapshot data is truncated")
+        chunk = self.data[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def unpack(self, layout):
+        return layout.unpack(self.take(layout.size))
+
+    def text(self):
+        (size,) = struct.unpack("<H", self.take(2))
+        return str(self.take(size), "utf-8")
+
+    def rows(self, row):
+        (count,) = self.unpack(_COUNT)
+        return list(row.iter_unpack(self.take(count * row.size)))
+
+    def columns(self, typecodes):
+        (count,) = self.unpack(_COUNT)
+        columns = []
+        for typecode in typecodes:
+            if np is not None:
+                dtype = np.dtype(_NUMPY_DTYPES[typecode])
+                columns.append(np.frombuffer(self.take(count * dtype.itemsize), dtype=dtype))
+            else:
+                values = array(typecode)
+                values.frombytes(self.take(count * values.itemsize))
+                if sys.byteorder == "big":
+                    values.byteswap()
+                columns.append(values.tolist())
+        return columns
+
+    def rng(self):
+        (kind,) = self.take(1)
+        if kind == _RNG_NONE:
+            return None
+        if kind == _RNG_MT:
+            version, has_gauss, gauss_next = self.unpack(_MT_RNG)
+            (count,) = self.unpack(_COUNT)
+            words = array("I")
+            words.frombytes(self.take(count * words.itemsize))
+            if sys.byteorder == "big":
+                words.byteswap()
+            return kind, (version, tuple(words), gauss_next if has_gauss else None)
+        if kind == _RNG_PCG64:
+            state, inc, has_uint32, uinteger = self.unpack(_PCG_RNG)
+            return kind, {
+                "bit_generator": "PCG64",
+                "state": {"state": int.from_bytes(state, "little"), "inc": int.from_bytes(inc, "little")},
+                "has_uint32": int(has_uint32),
+                "uinteger": uinteger,
+            }
+        raise SnapshotError(f"Unknown RNG kind {kind}")
@@ -0,0 +1,95 @@
+import pygame
+from font_registry import get_font
+
+
+class SpriteAtlas:
+    """
+    Renders each visual variant of the game's entities once and shares the
+    resulting Surface between every instance of that variant. The colors and
+    sizes taken from settings are part of each cache key, so a change in
+    settings produces a freshly rendered variant instead of a stale one.
+    Shared surfaces must only be blitted, never drawn on.
+    """
+
+    COMPANION_SIZE = 20
+
+    def __init__(self):
+        self._surfaces = {}
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    # --- Obstacles ---
+    def obstacle(self, width, height, color, glow_color_val):
+        key = ("obstacle", width, height, color, glow_color_val)
+        image = self._surfaces.get(key)
+        if image is None:
+            image = pygame.Surface([width, height], pygame.SRCALPHA)
+            glow_color = (
+                min(255, color[0] + glow_color_val),
+                min(255, color[1] + glow_color_val),
+                min(255, color[2] + glow_color_val),
+            )
+            inset = min(2, width // 10, height // 10)
+            pygame.draw.rect(
+                image,
+                glow_color,
+                (0, 0, width, height),
+                border_radius=max(1, inset * 3),
+            )
+            pygame.draw.rect(
+                image,
+                color,
+                (inset, inset, width - inset * 2, height - inset * 2),
+                border_radius=max(1, inset * 2),
+            )
+            self._surfaces[key] = image
+        return image
+
+    # --- Power-ups ---
+    def powerup(self, powerup_type, game_settings):
+        size = game_settings.POWERUP_SIZE
+        color = game_settings.POWERUP_COLORS[powerup_type]
+        key = ("powerup", powerup_type, size, color)
+        image = self._surfaces.get(key)
+        if image is None:
+            image = pygame.Surface([size, size], pygame.SRCALPHA)
+            pygame.draw.ellipse(image, color, (0, 0, size, size))
+
+            label_char = powerup_type[0].upper()
+            if powerup_type == "extralife":
+                label_char = "1UP"
+            elif powerup_type == "turret":
+                label_char = "T"
+
+            label_surface = get_font(20).render(label_char, True, (0, 0, 0))
+            label_rect = label_surface.get_rect(center=(size // 2, size // 2))
+            image.blit(label_surface, label_rect)
+            self._surfaces[key] = image
+        return image
+
+    # --- Bullets ---
+    def bullet(self, radius, color):
+        key = ("bullet", radius, tuple(color))
+        image = self._surfaces.get(key)
+        if image is None:
+            image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, color, (radius, radius), radius)
+            self._surfaces[key] = image
+        return image
+
+    # --- Companion ---
+    def companion(self, color, size=COMPANION_SIZE):
+        key = ("companion", size, tuple(color))
+        image = self._surfaces.get(key)
+        if image is None:
+            image = pygame.Surface([size, size], pygame.SRCALPHA)
+            pygame.draw.rect(image, color, (0, 0, size, size), border_radius=5)
+            self._surfaces[key] = image
+        return image
+
+
+_SPRITE_ATLAS_GLOBAL = SpriteAtlas()
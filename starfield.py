@@ -0,0 +1,253 @@
+import random
+import pygame
+import settings
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to per-star Python lists
+    np = None
+
+RESPAWN_Y_MIN = -20 # Respawned stars start just above the top edge
+RESPAWN_Y_MAX = -5
+
+
+class Starfield:
+    """
+    Scrolling background stars stored as NumPy arrays. `update` moves every
+    star in one vectorized pass and respawns the ones that fell off the bottom
+    in a single batch; `draw` writes all visible stars straight into the
+    surface pixels. Stars are squares with their top-left corner at (x, y),
+    like the pygame.draw.rect calls they replace.
+
+    Stars are kept sorted by size and a respawned star keeps its size, so
+    every size is one contiguous block that `draw` writes with a single
+    assignment. Sizes stay uniformly distributed, as before.
+    """
+
+    def __init__(self, game_settings=settings, count=None, rng=None):
+        if np is None:
+            raise RuntimeError("Starfield requires NumPy")
+        self.settings = game_settings
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = game_settings.NUM_STARS if count is None else count
+        self.colors = [tuple(color)[:3] for color in game_settings.STAR_COLORS]
+        self.size = np.sort(
+            self.rng.integers(
+                game_settings.STAR_SIZE_MIN, game_settings.STAR_SIZE_MAX + 1, self.count
+            )
+        ).astype(np.int32)
+        self.x = np.zeros(self.count, dtype=np.int32)
+        self.y = np.zeros(self.count, dtype=np.float32)
+        self.speed = np.zeros(self.count, dtype=np.float32)
+        self.color_index = np.zeros(self.count, dtype=np.intp)
+        self._index_sizes()
+        self._square_offsets = {} # (size, surface pitch) -> flat pixel offsets of a square
+        self._spawn(np.arange(self.count), 0, game_settings.HEIGHT)
+        self._previous_x = self.x.copy()
+        self._previous_top = self.y.astype(np.int32)
+
+    def __len__(self):
+        return self.count
+
+    def _index_sizes(self):
+        # (size, slice of the stars with that size)
+        self._blocks = [
+            (int(size), slice(
+                int(np.searchsorted(self.size, size, side="left")),
+                int(np.searchsorted(self.size, size, side="right")),
+            ))
+            for size in np.unique(self.size)
+        ]
+
+    def columns(self):
+        """Every star as (x, y, speed, color index, size) arrays, for snapshots."""
+        return self.x, self.y, self.speed, self.color_index, self.size
+
+    def restore_columns(self, x, y, speed, color_index, size):
+        """Replaces every star with the given columns (see `columns`); sizes must be sorted."""
+        self.count = len(x)
+        self.x = np.array(x, dtype=np.int32)
+        self.y = np.array(y, dtype=np.float32)
+        self.speed = np.array(speed, dtype=np.float32)
+        self.color_index = np.array(color_index, dtype=np.intp)
+        self.size = np.array(size, dtype=np.int32)
+        self._index_sizes()
+        self._previous_x = self.x.copy()
+        self._previous_top = self.y.astype(np.int32)
+
+    def _spawn(self, indices, y_min, y_max):
+        # Same inclusive ranges as random.randint, except that x keeps every
+        # star fully inside the screen horizontally
+        s = self.settings
+        u = self.rng.random((4, len(indices)))
+        self.x[indices] = u[0] * (s.WIDTH - self.size[indices] + 1)
+        self.y[indices] = y_min + np.floor(u[1] * (y_max - y_min + 1))
+        self.speed[indices] = s.STAR_SPEED_MIN + np.floor(
+            u[2] * (s.STAR_SPEED_MAX - s.STAR_SPEED_MIN + 1)
+        )
+        self.color_index[indices] = u[3] * len(self.colors)
+
+    def update(self, speed_scale=1.0):
+        """Scrolls every star down by its speed times `speed_scale`."""
+        self._previous_x = self.x.copy()
+        self._previous_top = self.y.astype(np.int32)
+        self.y += self.speed * speed_scale
+        fallen = np.flatnonzero(self.y > self.settings.HEIGHT)
+        if len(fallen):
+            self._spawn(fallen, RESPAWN_Y_MIN, RESPAWN_Y_MAX)
+
+    def dirty_rects(self):
+        """
+        Rects covering every star's square before and after the last update,
+        for pygame.display.update. A star that scrolled down gets one rect
+        spanning both squares; a respawned star gets one per square.
+        """
+        top = self.y.astype(np.int32)
+        previous_x, previous_top = self._previous_x, self._previous_top
+        scrolled = (self.x == previous_x) & (top >= previous_top)
+        rects = [
+            pygame.Rect(x, old_top, size, new_top - old_top + size)
+            for x, old_top, new_top, size in zip(
+                self.x[scrolled].tolist(),
+                previous_top[scrolled].tolist(),
+                top[scrolled].tolist(),
+                self.size[scrolled].tolist(),
+            )
+        ]
+        respawned = ~scrolled
+        for x, y, size in zip(
+            np.concatenate((previous_x[respawned], self.x[respawned])).tolist(),
+            np.concatenate((previous_top[respawned], top[respawned])).tolist(),
+            np.concatenate((self.size[respawned], self.size[respawned])).tolist(),
+        ):
+            rects.append(pygame.Rect(x, y, size, size))
+        return rects
+
+    def _map_palette(self, screen):
+        return np.array([screen.map_rgb(color) for color in self.colors], dtype=np.uint32)
+
+    def _offsets(self, size, row):
+        key = (size, row)
+        offsets = self._square_offsets.get(key)
+        if offsets is None:
+            dy, dx = np.divmod(np.arange(size * size, dtype=np.int32), size)
+            offsets = self._square_offsets[key] = dy * row + dx
+        return offsets
+
+    def draw(self, screen):
+        if not self.count:
+            return
+        top = self.y.astype(np.int32)
+        if screen.get_bytesize() != 4:
+            # Only 32-bit surfaces can take the direct pixel write below
+            self._fill_each(screen, range(self.count), top)
+            return
+
+        height = screen.get_height()
+        visible = (top >= 0) & (top + self.size <= height)
+        # Stars straddling the top or bottom edge are few; _fill_each clips them
+        straddling = ~visible & (top + self.size > 0) & (top < height)
+        self._fill_each(screen, np.flatnonzero(straddling), top)
+
+        row = screen.get_pitch() // 4
+        colors = self._map_palette(screen)[self.color_index]
+        buffer = screen.get_buffer() # Locks the surface until released
+        try:
+            pixels = np.frombuffer(buffer, dtype=np.uint32)
+            for size, block in self._blocks:
+                base = top[block] * row + self.x[block]
+                block_colors = colors[block]
+                shown = visible[block]
+                if not shown.all():
+                    base, block_colors = base[shown], block_colors[shown]
+                # Every star in the block covers the same square of offsets
+                pixels[base[:, None] + self._offsets(size, row)] = block_colors[:, None]
+        finally:
+            del buffer  # Release the surface lock
+
+    def _fill_each(self, screen, indices, top):
+        # Surface.fill moves a rect at a negative offset onto the surface
+        # instead of clipping it, so clip first
+        bounds = screen.get_rect()
+        for i in indices:
+            size = int(self.size[i])
+            square = pygame.Rect(int(self.x[i]), int(top[i]), size, size).clip(bounds)
+            screen.fill(self.colors[self.color_index[i]], square)
+
+
+class ListStarfield:
+    """Fallback starfield with the Starfield interface, built on per-star lists."""
+
+    def __init__(self, game_settings=settings, count=None, rng=None):
+        self.settings = game_settings
+        self.rng = rng if rng is not None else random.Random()
+        count = game_settings.NUM_STARS if count is None else count
+        self.stars = [self._create_star(0, game_settings.HEIGHT) for _ in range(count)]
+        self._previous = [self._square(star) for star in self.stars]
+
+    def __len__(self):
+        return len(self.stars)
+
+    def columns(self):
+        """Every star as (x, y, speed, color index, size) lists, for snapshots."""
+        colors = self.settings.STAR_COLORS
+        return (
+            [star[0] for star in self.stars], [star[1] for star in self.stars],
+            [star[2] for star in self.stars], [colors.index(star[3]) for star in self.stars],
+            [star[4] for star in self.stars],
+        )
+
+    def restore_columns(self, x, y, speed, color_index, size):
+        """Replaces every star with the given columns (see `columns`)."""
+        colors = self.settings.STAR_COLORS
+        self.stars = [
+            [star_x, star_y, star_speed, colors[color], star_size]
+            for star_x, star_y, star_speed, color, star_size in zip(x, y, speed, color_index, size)
+        ]
+        self._previous = [self._square(star) for star in self.stars]
+
+    def _create_star(self, y_min, y_max):
+        s = self.settings
+        return [
+            self.rng.randint(0, s.WIDTH),
+            self.rng.randint(y_min, y_max),
+            self.rng.randint(s.STAR_SPEED_MIN, s.STAR_SPEED_MAX),
+            self.rng.choice(s.STAR_COLORS),
+            self.rng.randint(s.STAR_SIZE_MIN, s.STAR_SIZE_MAX),
+        ]
+
+    @staticmethod
+    def _square(star):
+        return pygame.Rect(star[0], int(star[1]), star[4], star[4])
+
+    def update(self, speed_scale=1.0):
+        self._previous = [self._square(star) for star in self.stars]
+        for i, star in enumerate(self.stars):
+            star[1] += star[2] * speed_scale
+            if star[1] > self.settings.HEIGHT:
+                self.stars[i] = self._create_star(RESPAWN_Y_MIN, RESPAWN_Y_MAX)
+
+    def dirty_rects(self):
+        rects = []
+        for old, star in zip(self._previous, self.stars):
+            new = self._square(star)
+            if old.x == new.x and new.y >= old.y:
+                rects.append(old.union(new))
+            else:
+                rects.extend((old, new))
+        return rects
+
+    def draw(self, screen):
+        for x, y, _, color, size in self.stars:
+            pygame.draw.rect(screen, color, (x, y, size, size))
+
+
+def create_starfield(game_settings=settings, count=None, seed=None):
+    """
+    Returns a Starfield when NumPy is available, else a ListStarfield.
+    `count` defaults to game_settings.NUM_STARS; `seed` makes the star
+    layout reproducible.
+    """
+    if np is not None:
+        return Starfield(game_settings, count, rng=np.random.default_rng(seed))
+    return ListStarfield(game_settings, count, rng=random.Random(seed))
@@ -0,0 +1,116 @@
+import threading
+import time
+
+
+class StartupProfiler:
+    """
+    Records how long each startup stage takes, from process start to the
+    first interactive main-menu frame. Main-thread stages are timed with
+    `stage`; background warm-up tasks report through `record`. The report
+    is printed once, when `first_frame` is called, if `enabled`.
+    """
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.enabled = False
+        self.stages = [] # (name, seconds, background)
+        self.first_frame_s = None
+        self._lock = threading.Lock()
+
+    def since_start(self):
+        return time.perf_counter() - self.start
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def record(self, name, seconds, background=False):
+        with self._lock:
+            self.stages.append((name, seconds, background))
+
+    def first_frame(self):
+        if self.first_frame_s is not None:
+            return
+        self.first_frame_s = self.since_start()
+        if self.enabled:
+            print(self.report())
+
+    def report(self):
+        with self._lock:
+            stages = list(self.stages)
+        lines = [f"{'startup stage':<24} {'ms':>9}"]
+        for name, seconds, background in stages:
+            label = f"{name} (background)" if background else name
+            lines.append(f"{label:<24} {seconds * 1000:>9.1f}")
+        if self.first_frame_s is not None:
+            lines.append(f"{'first interactive frame':<24} {self.first_frame_s * 1000:>9.1f}")
+        return "\n".join(lines)
+
+
+class _Stage:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class AssetWarmer(threading.Thread):
+    """
+    Loads what the first frames need while the window is already up: the
+    system font table (scanning the registry or fc-list) and the UI font's
+    file, the active locale's message catalog, the high score file and
+    NumPy's random module for the starfield. Every task only fills a cache
+    the main thread would otherwise fill on first use; whichever gets there
+    first does the work, and the main thread only waits if it needs
+    something the warmer is loading at that moment. Nothing here touches
+    SDL: Font objects are built from the prefetched file on the main thread.
+    """
+
+    def __init__(self, profiler):
+        super().__init__(name="asset-warmer", daemon=True)
+        self.profiler = profiler
+
+    def _timed(self, name, task):
+        start = time.perf_counter()
+        try:
+            task()
+        except Exception as e: # Warm-up is best effort; the main thread retries on demand
+            print(f"Warning: startup warm-up '{name}' failed: {e}")
+        self.profiler.record(name, time.perf_counter() - start, background=True)
+
+    def run(self):
+        self._timed("fonts", _warm_fonts)
+        self._timed("locale", _warm_locale)
+        self._timed("high scores", _warm_high_scores)
+        self._timed("numpy.random", _warm_numpy)
+
+
+def _warm_fonts():
+    from font_registry import _FONT_REGISTRY_GLOBAL
+
+    _FONT_REGISTRY_GLOBAL.prefetch() # Font objects themselves are built on the main thread
+
+
+def _warm_locale():
+    from locale_manager import _LOCALE_MANAGER_GLOBAL
+
+    _LOCALE_MANAGER_GLOBAL.get_text("game_title") # Parses and merges the active catalog
+
+
+def _warm_high_scores():
+    from utils import get_high_score_value
+
+    get_high_score_value()
+
+
+def _warm_numpy():
+    import numpy.random # noqa: F401  (imported lazily by the starfield's first default_rng)
+
+
+_STARTUP_PROFILER_GLOBAL = StartupProfiler()
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed on (font, text, color, antialias).
+    Entries are evicted least-recently-used first once either `max_entries` or
+    `max_bytes` (estimated surface pixel memory) is exceeded. Returned
+    surfaces are shared, so callers must only blit them, never draw on them.
+    """
+
+    def __init__(self, max_entries=512, max_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), background and tuple(background))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._entries[key] = surface
+        self.bytes_used += self._surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.bytes_used > self.max_bytes
+        ):
+            _, surface = self._entries.popitem(last=False)
+            self.bytes_used -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_TEXT_CACHE_GLOBAL = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Drop-in replacement for font.render(text, antialias, color) backed by the shared cache."""
+    return _TEXT_CACHE_GLOBAL.render(font, text, antialias, color, background)
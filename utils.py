@@ -1,8 +1,13 @@
+import atexit
 import json
 import os
+import queue
 import pygame
 import settings
 import sys
+import threading
+import time
+from font_registry import get_font
 # Import _LOCALE_MANAGER_GLOBAL from game.py to access it
 from locale_manager import _LOCALE_MANAGER_GLOBAL
 
@@ -18,41 +23,175 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+class HighScoreStore:
+    """
+    In-memory cache of the high score file. Updates apply to the cached list
+    immediately and are written to disk by a HighScoreWriter thread, so the
+    game loop never waits for the disk. The file is only re-read when its
+    mtime changes (checked at most every `check_interval` seconds) and never
+    while a write is outstanding, when the cache is newer than the file.
+    `version()` increases whenever the cached list changes, so callers can
+    cache anything derived from it. The startup warmer reads the file from
+    a background thread, so all cache state is guarded by one lock.
+    """
+
+    def __init__(self, path, max_entries=10, check_interval=1.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.check_interval = check_interval
+        self._version = 0
+        self._scores = []
+        self._mtime = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self._pending = 0 # Lists queued for the writer and not yet on disk
+        self._writer = None
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self, mtime):
+        # Caller holds _lock
+        scores = []
+        if mtime is not None:
+            try:
+                with open(self.path, "r") as f:
+                    scores = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                scores = []
+        self._scores = sorted(scores, key=lambda x: x["score"], reverse=True)[
+            : self.max_entries
+        ]
+        self._mtime = mtime
+        self._version += 1
+
+    def _refresh(self):
+        # Caller holds _lock
+        now = time.monotonic()
+        if self._version and (self._pending or now < self._next_check):
+            return
+        self._next_check = now + self.check_interval
+        mtime = self._file_mtime()
+        if not self._version or mtime != self._mtime:
+            self._load(mtime)
+
+    def get(self):
+        with self._lock:
+            self._refresh()
+            return list(self._scores)
+
+    def version(self):
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def _save_locked(self, highscores):
+        self._scores = sorted(highscores, key=lambda x: x["score"], reverse=True)[
+            : self.max_entries
+        ]
+        self._version += 1
+        self._pending += 1
+        if self._writer is None:
+            self._writer = HighScoreWriter(self)
+            self._writer.start()
+            atexit.register(self.flush) # Don't lose a score queued just before exit
+        self._writer.queue.put(list(self._scores))
+
+    def save(self, highscores):
+        with self._lock:
+            self._save_locked(highscores)
+
+    def add(self, username, score):
+        with self._lock:
+            if not self._version:
+                self._refresh() # First use: the cache must hold the file's scores
+            self._save_locked(self._scores + [{"username": username, "score": score}])
+
+    def best(self):
+        with self._lock:
+            self._refresh()
+            return self._scores[0]["score"] if self._scores else 0
+
+    def flush(self):
+        """Blocks until every queued list has been written."""
+        if self._writer is not None:
+            self._writer.queue.join()
+
+    def _write(self, scores, lists):
+        # Writer thread: `scores` is the newest of `lists` coalesced lists
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(scores, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno()) # On disk before it replaces the old file
+            os.replace(temp_path, self.path) # Atomic: readers see the old file or the new one
+        except Exception as e: # Keep the writer thread alive; the cached list is still current
+            print(f"Error saving high scores to {self.path}: {e}")
+            try:
+                os.remove(temp_path) # Don't leave a partial file behind
+            except OSError:
+                pass
+        with self._lock:
+            self._mtime = self._file_mtime() # Our own write is not a change to reload
+            self._pending -= lists
+
+
+class HighScoreWriter(threading.Thread):
+    """
+    Writes the lists a HighScoreStore queues, oldest first. Lists queued
+    while a write is in progress are coalesced: only the newest is written,
+    since each one is the complete table.
+    """
+
+    def __init__(self, store):
+        super().__init__(name="high-score-writer", daemon=True)
+        self.store = store
+        self.queue = queue.Queue()
+
+    def run(self):
+        while True:
+            scores = self.queue.get()
+            lists = 1
+            while True:
+                try:
+                    scores = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                lists += 1
+            self.store._write(scores, lists)
+            for _ in range(lists):
+                self.queue.task_done()
+
+
+_HIGH_SCORE_STORE = HighScoreStore(resource_path(HIGHSCORE_FILE))
+
+
 def save_high_scores(highscores):
-    with open(resource_path(HIGHSCORE_FILE), "w") as f:
-        json.dump(highscores, f, indent=4)
+    _HIGH_SCORE_STORE.save(highscores)
 
 
 def get_high_scores():
-    if not os.path.exists(resource_path(HIGHSCORE_FILE)):
-        return []
-    try:
-        with open(resource_path(HIGHSCORE_FILE), "r") as f:
-            highscores = json.load(f)
-            highscores = sorted(highscores, key=lambda x: x["score"], reverse=True)[:10]
-            return highscores
-    except json.JSONDecodeError:
-        return []
+    return _HIGH_SCORE_STORE.get()
 
 
 def update_high_scores(username, score):
-    highscores = get_high_scores()
+    _HIGH_SCORE_STORE.add(username, score)
 
-    highscores.append({"username": username, "score": score})
 
-    highscores.sort(key=lambda x: x["score"], reverse=True)
-
-    save_high_scores(highscores[:10])
+def get_high_score_value():
+    return _HIGH_SCORE_STORE.best()
 
 
-def get_high_score_value():
-    scores = get_high_scores()
-    return scores[0]["score"] if scores else 0
+def get_high_score_version():
+    return _HIGH_SCORE_STORE.version()
 
 
 def get_username(screen):
-    pygame.font.init()
-    font = pygame.font.SysFont("consolas", 32)
+    font = get_font(32)
     username = ""
     input_active = True
     clock = pygame.time.Clock()